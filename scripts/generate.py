@@ -132,58 +132,80 @@ def get_fields_from_code(code: str) -> tuple[str, str, str]:
 
     return updated_fields
 
-def generate_node_class_file(dst_folder: str, node_name: str, fields: list[tuple[str, str, str]]):
+def generate_node_class_file(dst_folder: str, node_name: str):
     """Generate a file with the corresponding Webots VRML node class inside.
+        The node fields are taken from the node schema, see generate_node_schema_file().
 
     Args:
+        dst_folder (str): Destination folder.
         node_name (str): Name of the Webots VRML node.
-        fields (list[tuple[str, str, str]]): Node specific fields.
     """
     full_path = f"{dst_folder}/{node_name}.py"
 
-    # Get unique list of field types
-    unique_list_of_types = set([])
-    for field_type, _, _ in fields:
-        unique_list_of_types.add(field_type)
-
     result = f"\"\"\"Webots VRML node {node_name}\n"
     result += "    This code is automatically generated. Don't modify it manually.\n"
     result += "\"\"\"\n"
     result += "# pylint: disable=invalid-name\n"
     result += "\n"
     result += "from pyLineFollowerTrackGenerator.base.node import Node\n"
+    result += "from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA\n"
+    result += "\n"
+    result += f"class {node_name}(Node): # pylint: disable=too-few-public-methods\n"
+    result += f"    \"\"\"Webots {node_name} VRML node.\n"
+    result +=  "    \"\"\"\n"
+    result +=  "    def __init__(self) -> None:\n"
+    result += f"        super().__init__(\"{node_name}\", NODE_SCHEMA[\"{node_name}\"])\n"
+
+    with open(full_path, "w", encoding="utf-8") as file:
+        file.write(result)
+
+def generate_node_schema_file(dst_folder: str, nodes: list[tuple[str, list[tuple[str, str, str]]]]):
+    """Generate the file with the field schema of all Webots VRML nodes.
+        The schema contains the field type, field name and default value of
+        every node field.
+
+    Args:
+        dst_folder (str): Destination folder.
+        nodes (list[tuple[str, list[tuple[str, str, str]]]]): Node names with its fields.
+    """
+    full_path = f"{dst_folder}/schema.py"
+
+    # Get unique list of field types
+    unique_list_of_types = set([])
+    for _, fields in nodes:
+        for field_type, _, _ in fields:
+            unique_list_of_types.add(field_type)
+
+    result = "\"\"\"Webots VRML node field schema\n"
+    result += "    This code is automatically generated. Don't modify it manually.\n"
+    result += "\"\"\"\n"
+    result += "# pylint: disable=line-too-long, too-many-lines\n"
+    result += "\n"
 
     if len(unique_list_of_types) > 0:
         result += "from pyLineFollowerTrackGenerator.base.fields import (\n"
         result += "    "
-        for index, field_type in enumerate(unique_list_of_types):
+        for index, field_type in enumerate(sorted(unique_list_of_types)):
             if index > 0:
                 result += ", "
             result += field_type
         result += "\n)\n"
+        result += "\n"
 
-    result += "\n"
-    result += f"class {node_name}(Node): # pylint: disable=too-few-public-methods\n"
-    result += f"    \"\"\"Webots {node_name} VRML node.\n"
-    result +=  "    \"\"\"\n"
-    result +=  "    def __init__(self) -> None:\n"
-    result += f"        super().__init__(\"{node_name}\")\n"
-    if len(fields) > 0:
-        result +=  "        self.add_fields([\n"
-        suppression = ""
-        for index, (field_type, field_name, field_value) in enumerate(fields):
-            if index > 0:
-                result += f",{suppression}\n"
-            single_line = f"            {field_type}(\"{field_name}\", {field_value})"
-            result += single_line
-
-            if len(single_line) > 88:
-                suppression = " # pylint: disable=line-too-long"
-            else:
-                suppression = ""
+    result += "# Field type, field name and default value of every node field.\n"
+    result += "NODE_SCHEMA = {\n"
+    for node_index, (node_name, fields) in enumerate(nodes):
+        if node_index > 0:
+            result += ",\n"
 
-        result += f"{suppression}\n"
-        result +=  "        ])\n"
+        if len(fields) == 0:
+            result += f"    \"{node_name}\": ()"
+        else:
+            result += f"    \"{node_name}\": (\n"
+            for field_type, field_name, field_value in fields:
+                result += f"        ({field_type}, \"{field_name}\", {field_value}),\n"
+            result += "    )"
+    result += "\n}\n"
 
     with open(full_path, "w", encoding="utf-8") as file:
         file.write(result)
@@ -193,6 +215,8 @@ def main():
     """
     url_nodes_and_api_functions = WEBOTS_DOCS_REFERENCE_URL + "/nodes-and-api-functions.md"
     ignore_list = ["Mouse", "Supervisor"]
+    dst_folder = "../src/pyLineFollowerTrackGenerator/nodes"
+    node_fields = []
 
     webots_node_markdown = get_file_from_url(url_nodes_and_api_functions)
     nodes = get_nodes_from_markdown(webots_node_markdown)
@@ -209,7 +233,10 @@ def main():
             node_code = get_code_from_markdown(node_description_markdown)
             fields = get_fields_from_code(node_code)
 
-            generate_node_class_file("../src/pyLineFollowerTrackGenerator/nodes", node_name, fields)
+            generate_node_class_file(dst_folder, node_name)
+            node_fields.append((node_name, fields))
+
+    generate_node_schema_file(dst_folder, node_fields)
 
 if __name__ == "__main__":
     main()
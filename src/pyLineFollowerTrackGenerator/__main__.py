@@ -28,9 +28,12 @@
 import sys
 from pyLineFollowerTrackGenerator.constants import Ret
 from pyLineFollowerTrackGenerator.prg_arg_parser import PrgArgParser
+from pyLineFollowerTrackGenerator.cmd_batch import cmd_register as cmd_batch_register
 from pyLineFollowerTrackGenerator.cmd_etrack import cmd_register as cmd_etrack_register
 from pyLineFollowerTrackGenerator.cmd_friction import cmd_register as cmd_friction_register
 from pyLineFollowerTrackGenerator.cmd_grid import cmd_register as cmd_grid_register
+from pyLineFollowerTrackGenerator.cmd_gridgen import cmd_register as cmd_gridgen_register
+from pyLineFollowerTrackGenerator.cmd_serve import cmd_register as cmd_serve_register
 from pyLineFollowerTrackGenerator.cmd_simple import cmd_register as cmd_simple_register
 
 ################################################################################
@@ -39,9 +42,12 @@ from pyLineFollowerTrackGenerator.cmd_simple import cmd_register as cmd_simple_r
 
 # Register a command here!
 _COMMAND_REG_LIST = [
+    cmd_batch_register,
     cmd_etrack_register,
     cmd_friction_register,
     cmd_grid_register,
+    cmd_gridgen_register,
+    cmd_serve_register,
     cmd_simple_register
 ]
 
@@ -0,0 +1,132 @@
+"""Arc-length parameterization of a closed spline."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from typing import Any, Union
+import numpy as np
+from scipy.interpolate import splev
+
+################################################################################
+# Variables
+################################################################################
+
+# Number of spline samples per spline knot, used to approximate the arc-length.
+_SAMPLES_PER_KNOT = 100
+
+################################################################################
+# Classes
+################################################################################
+
+class ArcLengthTable():
+    """Maps the distance along a closed spline to the spline parameter u.
+        The spline is sampled densely once and the cumulative chord length
+        of the samples is stored. A distance is mapped back to u by binary
+        search in the table and linear interpolation.
+    """
+
+    def __init__(self, tck: Any) -> None:
+        """Create the arc-length table of a spline.
+
+        Args:
+            tck (tuple[t,c,k]): Vector of knots, the B-spline coefficients,
+                and the degree of the spline.
+        """
+        num_samples = max(len(tck[0]) * _SAMPLES_PER_KNOT, 2)
+
+        self._u = np.linspace(0, 1, num_samples)
+        x, y = splev(self._u, tck, der=0)
+
+        chord_lengths = np.hypot(np.diff(x), np.diff(y))
+
+        self._distances = np.concatenate(([0.0], np.cumsum(chord_lengths)))
+
+    def get_length(self) -> float:
+        """Get the length of the closed spline.
+
+        Returns:
+            float: Length in the unit of the spline points.
+        """
+        return float(self._distances[-1])
+
+    def get_u(self, distance: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Get the spline parameter u at the distance along the spline, measured
+            from its begin. Because the spline is closed, the distance wraps around.
+
+        Args:
+            distance (Union[float, np.ndarray]): Distance or distances.
+
+        Returns:
+            Union[float, np.ndarray]: Spline parameter u [0..1]
+        """
+        length = self.get_length()
+        distance = np.asarray(distance, dtype=float)
+
+        # The end of the spline is its begin too.
+        is_end = distance == length
+        distance = np.where(is_end, length, np.mod(distance, length))
+
+        u = np.interp(distance, self._distances, self._u)
+
+        if u.ndim == 0:
+            u = float(u)
+
+        return u
+
+    def get_u_by_fraction(self, fraction: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Get the spline parameter u at the fraction of the spline length.
+
+        Args:
+            fraction (Union[float, np.ndarray]): Fraction of the spline length [0..1].
+
+        Returns:
+            Union[float, np.ndarray]: Spline parameter u [0..1]
+        """
+        return self.get_u(np.asarray(fraction, dtype=float) * self.get_length())
+
+    def get_u_by_step(self, step: float) -> np.ndarray:
+        """Get the spline parameters of samples with equal distance along the
+            spline. The first and the last sample are the begin of the spline,
+            which closes the polyline.
+
+        Args:
+            step (float): Target distance between two samples. The distance is
+                adjusted, that the samples are spread equally over the whole spline.
+
+        Returns:
+            np.ndarray: Spline parameters u [0..1]
+        """
+        length = self.get_length()
+        num_steps = max(int(np.ceil(length / step)), 3)
+
+        return self.get_u(np.linspace(0, length, num_steps + 1))
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
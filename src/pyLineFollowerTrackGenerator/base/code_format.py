@@ -43,3 +43,12 @@ class CodeFormat:
             str: Line ending
         """
         return self._line_ending
+
+    def get_state(self) -> tuple[int, str, int]:
+        """Get the state, which determines the formatted code: the number of
+            spaces per indention level, the line ending and the current level.
+
+        Returns:
+            tuple[int, str, int]: Indention, line ending and level.
+        """
+        return (self._indention, self._line_ending, self._level)
@@ -1,7 +1,38 @@
 """Webots VRML base field"""
 
-class Field: # pylint: disable=too-few-public-methods
-    """Base field
+import io
+from typing import TextIO
+from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
+
+class Field:
+    """Base field. A derived field implements at least one of export()
+        or write().
     """
     def __init__(self, name: str) -> None:
         self.name = name
+
+    def __str__(self) -> str:
+        return self.export(CodeFormat())
+
+    def export(self, code_format: CodeFormat) -> str:
+        """Export to string.
+
+        Args:
+            code_format (CodeFormat): Code format used for export.
+
+        Returns:
+            str: VRML string
+        """
+        buffer = io.StringIO()
+        self.write(buffer, code_format)
+
+        return buffer.getvalue()
+
+    def write(self, fd: TextIO, code_format: CodeFormat) -> None:
+        """Write to a file-like object.
+
+        Args:
+            fd (TextIO): File-like object.
+            code_format (CodeFormat): Code format used for export.
+        """
+        fd.write(self.export(code_format))
@@ -1,10 +1,107 @@
 """Webots VRML types"""
 
-from typing import Union
+import array
+from itertools import islice
+from typing import Union, Iterable, TextIO
+import numpy as np
 from pyLineFollowerTrackGenerator.base.node import Node
 from pyLineFollowerTrackGenerator.base.field import Field
 from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
 
+# Number of values, which are written at once.
+_WRITE_CHUNK_SIZE = 4096
+
+# Format of a floating point number in an array. 9 significant digits are
+# enough to represent a single-precision floating point number exactly.
+_ARRAY_FLOAT_FORMAT = "%.9g"
+
+# Format of an integer number in an array.
+_ARRAY_INT_FORMAT = "%d"
+
+def _write_values(fd: TextIO, name: str, values: Iterable[str]) -> None:
+    """Write a field with multiple values chunk by chunk.
+
+    Args:
+        fd (TextIO): File-like object.
+        name (str): Field name.
+        values (Iterable[str]): Values, already formatted.
+    """
+    values = iter(values)
+    separator = ""
+
+    fd.write(f"{name} [ ")
+
+    chunk = list(islice(values, _WRITE_CHUNK_SIZE))
+    while len(chunk) > 0:
+        fd.write(separator)
+        fd.write(", ".join(chunk))
+
+        separator = ", "
+        chunk = list(islice(values, _WRITE_CHUNK_SIZE))
+
+    fd.write(" ]")
+
+def _to_array(values, num_components: int) -> Union[list, np.ndarray]:
+    """Convert a NumPy array or array.array to a contiguous array with one
+        row per value. Lists are kept as they are.
+
+    Args:
+        values (Union[list, np.ndarray, array.array]): Values
+        num_components (int): Number of components per value, e.g. 3 for a 3D vector.
+            1 for scalar values.
+
+    Returns:
+        Union[list, np.ndarray]: Values as list or array with shape (N,) for scalar values
+            and (N, num_components) otherwise.
+    """
+    if isinstance(values, (np.ndarray, array.array)):
+        values = np.ascontiguousarray(values)
+
+        # A flat array contains the components of all values one after another.
+        if (num_components > 1) and (values.ndim == 1) and ((values.size % num_components) == 0):
+            values = values.reshape(-1, num_components)
+
+    return values
+
+def _is_array_shape_valid(values: np.ndarray, num_components: int) -> bool:
+    is_valid = False
+
+    if num_components == 1:
+        is_valid = values.ndim == 1
+    else:
+        is_valid = (values.ndim == 2) and (values.shape[1] == num_components)
+
+    return is_valid
+
+def _write_array(fd: TextIO, name: str, values: np.ndarray, value_format: str) -> None:
+    """Write a field with multiple values from an array chunk by chunk. The
+        values are formatted in bulk, not one by one.
+
+    Args:
+        fd (TextIO): File-like object.
+        name (str): Field name.
+        values (np.ndarray): Values with one row per value.
+        value_format (str): Format of a single value with one "%s" per component,
+            which is replaced by the number format depended on the array type.
+    """
+    number_format = _ARRAY_INT_FORMAT
+    if np.issubdtype(values.dtype, np.integer) is False:
+        number_format = _ARRAY_FLOAT_FORMAT
+
+    value_format = value_format.replace("%s", number_format)
+
+    fd.write(f"{name} [ ")
+
+    for begin in range(0, len(values), _WRITE_CHUNK_SIZE):
+        chunk = values[begin:begin + _WRITE_CHUNK_SIZE]
+
+        if begin > 0:
+            fd.write(", ")
+
+        fd.write(", ".join([value_format] * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+    fd.write(" ]")
+
 class SFString(Field): # pylint: disable=too-few-public-methods
     """Single string in UTF-8 format.
     """
@@ -95,52 +192,45 @@ class SFColor(Field): # pylint: disable=too-few-public-methods
 class MFColor(Field): # pylint: disable=too-few-public-methods
     """Zero or more colors.
     """
-    def __init__(self, name: str, values: Union[list[list[float]], list[float]]) -> None:
+    def __init__(self, name: str, values: Union[list[list[float]], list[float], np.ndarray]) -> None: # pylint: disable=line-too-long
         super().__init__(name)
-        self.values = values
+        self.values = _to_array(values, 3)
 
         self._sanity_check()
 
     def _sanity_check(self):
-        if len(self.values) > 0:
+        if isinstance(self.values, np.ndarray):
+            if _is_array_shape_valid(self.values, 3) is False:
+                raise ValueError("A color contains always 3 values for RGB.")
+
+        elif len(self.values) > 0:
             if isinstance(self.values[0], list):
                 for value in self.values:
                     if (len(value) % 3) != 0:
                         raise ValueError("A color contains always 3 values for RGB.")
             else:
-                if (len(value) % 3) != 0:
+                if (len(self.values) % 3) != 0:
                     raise ValueError("A color contains always 3 values for RGB.")
 
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ""
-
-        if len(self.values) > 0:
-            if isinstance(self.values[0], list):
-                for index, value_list in enumerate(self.values):
-                    red = value_list[0]
-                    green = value_list[1]
-                    blue = value_list[2]
+        if isinstance(self.values, np.ndarray):
+            _write_array(fd, self.name, self.values, "[ %s %s %s ]")
+        else:
+            value_list = []
 
-                    if index > 0:
-                        value_list_as_str += ", "
-
-                    value_list_as_str += f"[ {red} {green} {blue} ]"
-            else:
-                red = self.values[0]
-                green = self.values[1]
-                blue = self.values[2]
+            if len(self.values) > 0:
+                if isinstance(self.values[0], list):
+                    value_list = (f"[ {value[0]} {value[1]} {value[2]} ]" for value in self.values)
+                else:
+                    value_list = [f"{self.values[0]} {self.values[1]} {self.values[2]}"]
 
-                value_list_as_str += f"{red} {green} {blue}"
-
-        return f"{self.name} [ {value_list_as_str} ]"
+            _write_values(fd, self.name, value_list)
 
 class SFFloat(Field): # pylint: disable=too-few-public-methods
     """One single-precision floating point number.
@@ -163,21 +253,28 @@ class SFFloat(Field): # pylint: disable=too-few-public-methods
 class MFFloat(Field): # pylint: disable=too-few-public-methods
     """Zero or more single-precision floating point numbers.
     """
-    def __init__(self, name: str, values: list[float]) -> None:
+    def __init__(self, name: str, values: Union[list[float], np.ndarray]) -> None:
         super().__init__(name)
-        self.values = values
+        self.values = _to_array(values, 1)
 
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+        self._sanity_check()
+
+    def _sanity_check(self):
+        if isinstance(self.values, np.ndarray):
+            if _is_array_shape_valid(self.values, 1) is False:
+                raise ValueError("The values must be a one-dimensional array.")
+
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ", ".join([str(value) for value in self.values])
-        return f"{self.name} [ {value_list_as_str} ]"
+        if isinstance(self.values, np.ndarray):
+            _write_array(fd, self.name, self.values, "%s")
+        else:
+            _write_values(fd, self.name, (str(value) for value in self.values))
 
 class SFDouble(Field): # pylint: disable=too-few-public-methods
     """One double-precision floating point number.
@@ -204,17 +301,14 @@ class MFDouble(Field): # pylint: disable=too-few-public-methods
         super().__init__(name)
         self.values = values
 
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ", ".join([str(value) for value in self.values])
-        return f"{self.name} [ {value_list_as_str} ]"
+        _write_values(fd, self.name, (str(value) for value in self.values))
 
 class SFInt32(Field): # pylint: disable=too-few-public-methods
     """One 32-bit integer number.
@@ -237,21 +331,28 @@ class SFInt32(Field): # pylint: disable=too-few-public-methods
 class MFInt32(Field): # pylint: disable=too-few-public-methods
     """Zero or more 32-bit integer numbers.
     """
-    def __init__(self, name: str, values: list[int]) -> None:
+    def __init__(self, name: str, values: Union[list[int], np.ndarray]) -> None:
         super().__init__(name)
-        self.values = values
+        self.values = _to_array(values, 1)
 
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+        self._sanity_check()
+
+    def _sanity_check(self):
+        if isinstance(self.values, np.ndarray):
+            if _is_array_shape_valid(self.values, 1) is False:
+                raise ValueError("The values must be a one-dimensional array.")
+
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ", ".join([str(value) for value in self.values])
-        return f"{self.name} [ {value_list_as_str} ]"
+        if isinstance(self.values, np.ndarray):
+            _write_array(fd, self.name, self.values, "%s")
+        else:
+            _write_values(fd, self.name, (str(value) for value in self.values))
 
 class SFNode(Field): # pylint: disable=too-few-public-methods
     """One node.
@@ -260,20 +361,19 @@ class SFNode(Field): # pylint: disable=too-few-public-methods
         super().__init__(name)
         self.value = value
 
-    def export(self, code_format: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, code_format: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             code_format (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value = "NULL"
-        if self.value is not None:
-            value = self.value.export(code_format)
+        fd.write(f"{self.name} ")
 
-        return f"{self.name} {value}"
+        if self.value is None:
+            fd.write("NULL")
+        else:
+            self.value.write(fd, code_format)
 
 class MFNode(Field): # pylint: disable=too-few-public-methods
     """Zero or more nodes.
@@ -282,21 +382,22 @@ class MFNode(Field): # pylint: disable=too-few-public-methods
         super().__init__(name)
         self.values = values
 
-    def __str__(self) -> str:
-        value_list_as_str = ", ".join([str(value) for value in self.values])
-        return f"{self.name} [ {value_list_as_str} ]"
-
-    def export(self, code_format: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, code_format: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             code_format (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ", ".join([value.export(code_format) for value in self.values])
-        return f"{self.name} [ {value_list_as_str} ]"
+        fd.write(f"{self.name} [ ")
+
+        for index, value in enumerate(self.values):
+            if index > 0:
+                fd.write(", ")
+
+            value.write(fd, code_format)
+
+        fd.write(" ]")
 
 class SFRotation(Field): # pylint: disable=too-few-public-methods
     """One arbitrary rotation.
@@ -330,79 +431,45 @@ class SFRotation(Field): # pylint: disable=too-few-public-methods
 class MFRotation(Field): # pylint: disable=too-few-public-methods
     """Zero or more arbitrary rotations.
     """
-    def __init__(self, name: str, values: Union[list[list[float]], list[float]]) -> None:
+    def __init__(self, name: str, values: Union[list[list[float]], list[float], np.ndarray]) -> None: # pylint: disable=line-too-long
         super().__init__(name)
-        self.values = values
+        self.values = _to_array(values, 4)
 
         self._sanity_check()
 
     def _sanity_check(self):
-        if len(self.values) > 0:
+        if isinstance(self.values, np.ndarray):
+            if _is_array_shape_valid(self.values, 4) is False:
+                raise ValueError("A rotation contains always 4 values for x, y, z and a.")
+
+        elif len(self.values) > 0:
             if isinstance(self.values[0], list):
                 for value in self.values:
                     if (len(value) % 4) != 0:
                         raise ValueError("A rotation contains always 4 values for x, y, z and a.")
             else:
-                if (len(value) % 4) != 0:
-                    raise ValueError("A color contains always 4 values for x, y, z and a.")
-
-    def __str__(self) -> str:
-        value_list_as_str = ""
-
-        if len(self.values) > 0:
-            if isinstance(self.values[0], list):
-                for index, value_list in enumerate(self.values):
-                    x = value_list[0]
-                    y = value_list[1]
-                    z = value_list[2]
-                    a = value_list[3]
+                if (len(self.values) % 4) != 0:
+                    raise ValueError("A rotation contains always 4 values for x, y, z and a.")
 
-                    if index > 0:
-                        value_list_as_str += ", "
-
-                    value_list_as_str += f"[ {x} {y} {z} {a} ]"
-            else:
-                x = self.values[0]
-                y = self.values[1]
-                z = self.values[2]
-                a = self.values[3]
-
-                value_list_as_str += f"{x} {y} {z} {a}"
-
-        return f"{self.name} [ {value_list_as_str} ]"
-
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ""
+        if isinstance(self.values, np.ndarray):
+            _write_array(fd, self.name, self.values, "[ %s %s %s %s ]")
+        else:
+            value_list = []
 
-        if len(self.values) > 0:
-            if isinstance(self.values[0], list):
-                for index, value_list in enumerate(self.values):
-                    x = value_list[0]
-                    y = value_list[1]
-                    z = value_list[2]
-                    a = value_list[3]
+            if len(self.values) > 0:
+                if isinstance(self.values[0], list):
+                    value_list = (f"[ {value[0]} {value[1]} {value[2]} {value[3]} ]" for value in self.values) # pylint: disable=line-too-long
+                else:
+                    value_list = [f"{self.values[0]} {self.values[1]} {self.values[2]} {self.values[3]}"] # pylint: disable=line-too-long
 
-                    if index > 0:
-                        value_list_as_str += ", "
-
-                    value_list_as_str += f"[ {x} {y} {z} {a} ]"
-            else:
-                x = self.values[0]
-                y = self.values[1]
-                z = self.values[2]
-                a = self.values[3]
-
-                value_list_as_str += f"{x} {y} {z} {a}"
-
-        return f"{self.name} [ {value_list_as_str} ]"
+            _write_values(fd, self.name, value_list)
 
 class SFVec2f(Field): # pylint: disable=too-few-public-methods
     """One two-dimensional (2D) vector.
@@ -434,50 +501,45 @@ class SFVec2f(Field): # pylint: disable=too-few-public-methods
 class MFVec2f(Field): # pylint: disable=too-few-public-methods
     """Zero or more two-dimensional (2D) vectors.
     """
-    def __init__(self, name: str, values: Union[list[list[float]], list[float]]) -> None:
+    def __init__(self, name: str, values: Union[list[list[float]], list[float], np.ndarray]) -> None: # pylint: disable=line-too-long
         super().__init__(name)
-        self.values = values
+        self.values = _to_array(values, 2)
 
         self._sanity_check()
 
     def _sanity_check(self):
-        if len(self.values) > 0:
+        if isinstance(self.values, np.ndarray):
+            if _is_array_shape_valid(self.values, 2) is False:
+                raise ValueError("A 2D vector contains always 2 values for x and y.")
+
+        elif len(self.values) > 0:
             if isinstance(self.values[0], list):
                 for value in self.values:
                     if (len(value) % 2) != 0:
                         raise ValueError("A 2D vector contains always 2 values for x and y.")
             else:
-                if (len(value) % 2) != 0:
+                if (len(self.values) % 2) != 0:
                     raise ValueError("A 2D vector contains always 2 values for x and y.")
 
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ""
-
-        if len(self.values) > 0:
-            if isinstance(self.values[0], list):
-                for index, value_list in enumerate(self.values):
-                    x = value_list[0]
-                    y = value_list[1]
-
-                    if index > 0:
-                        value_list_as_str += ", "
+        if isinstance(self.values, np.ndarray):
+            _write_array(fd, self.name, self.values, "%s %s")
+        else:
+            value_list = []
 
-                    value_list_as_str += f"{x} {y}"
-            else:
-                x = self.values[0]
-                y = self.values[1]
+            if len(self.values) > 0:
+                if isinstance(self.values[0], list):
+                    value_list = (f"{value[0]} {value[1]}" for value in self.values)
+                else:
+                    value_list = [f"{self.values[0]} {self.values[1]}"]
 
-                value_list_as_str += f"{x} {y}"
-
-        return f"{self.name} [ {value_list_as_str} ]"
+            _write_values(fd, self.name, value_list)
 
 class SFVec3f(Field): # pylint: disable=too-few-public-methods
     """One three-dimensional (3D) vector.
@@ -510,49 +572,42 @@ class SFVec3f(Field): # pylint: disable=too-few-public-methods
 class MFVec3f(Field): # pylint: disable=too-few-public-methods
     """Zero or more three-dimensional (3D) vectors.
     """
-    def __init__(self, name: str, values:  Union[list[list[float]], list[float]]) -> None:
+    def __init__(self, name: str, values: Union[list[list[float]], list[float], np.ndarray]) -> None: # pylint: disable=line-too-long
         super().__init__(name)
-        self.values = values
+        self.values = _to_array(values, 3)
 
         self._sanity_check()
 
     def _sanity_check(self):
-        if len(self.values) > 0:
+        if isinstance(self.values, np.ndarray):
+            if _is_array_shape_valid(self.values, 3) is False:
+                raise ValueError("A 3D vector contains always 3 values for x, y and z.")
+
+        elif len(self.values) > 0:
             if isinstance(self.values[0], list):
                 for value in self.values:
                     if (len(value) % 3) != 0:
                         raise ValueError("A 3D vector contains always 3 values for x, y and z.")
             else:
-                if (len(value) % 3) != 0:
+                if (len(self.values) % 3) != 0:
                     raise ValueError("A 3D vector contains always 3 values for x, y and z.")
 
-    def export(self, _: CodeFormat) -> str:
-        """Export to string.
+    def write(self, fd: TextIO, _: CodeFormat) -> None:
+        """Write to a file-like object.
 
         Args:
+            fd (TextIO): File-like object.
             _ (CodeFormat): Code format used for export.
-
-        Returns:
-            str: VRML string
         """
-        value_list_as_str = ""
-
-        if len(self.values) > 0:
-            if isinstance(self.values[0], list):
-                for index, value_list in enumerate(self.values):
-                    x = value_list[0]
-                    y = value_list[1]
-                    z = value_list[2]
-
-                    if index > 0:
-                        value_list_as_str += ", "
-
-                    value_list_as_str += f"{x} {y} {z}"
-            else:
-                x = self.values[0]
-                y = self.values[1]
-                z = self.values[2]
-
-                value_list_as_str += f"{x} {y} {z}"
-
-        return f"{self.name} [ {value_list_as_str} ]"
+        if isinstance(self.values, np.ndarray):
+            _write_array(fd, self.name, self.values, "%s %s %s")
+        else:
+            value_list = []
+
+            if len(self.values) > 0:
+                if isinstance(self.values[0], list):
+                    value_list = (f"{value[0]} {value[1]} {value[2]}" for value in self.values)
+                else:
+                    value_list = [f"{self.values[0]} {self.values[1]} {self.values[2]}"]
+
+            _write_values(fd, self.name, value_list)
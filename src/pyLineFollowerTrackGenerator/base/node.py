@@ -1,28 +1,73 @@
 """Webots VRML base node"""
 
-from typing import Union
+import copy
+import io
+from typing import Union, TextIO
 from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
 from pyLineFollowerTrackGenerator.base.field import Field
 
+# Exported fields with default value per node type, field name and code format
+# state. A field with default value is exported always the same way in the
+# same code format.
+_DEFAULT_FIELD_EXPORT_CACHE = {}
+
 class Node:
     """Webots VRML base node class.
+        The fields of the schema are created on first access. Until then
+        the field is exported with its default value.
     """
-    def __init__(self, type_name: str) -> None:
+    def __init__(self, type_name: str, field_schema: tuple[tuple[type, str, object], ...] = ()) -> None: # pylint: disable=line-too-long
         self.name = ""
         self._type_name = type_name
+        self._field_schema = {field_name: (field_type, field_value) for field_type, field_name, field_value in field_schema} # pylint: disable=line-too-long
         self._field_dict = {}
 
     def __getitem__(self, index):
         field = None
 
         if isinstance(index, int):
-            field = self._field_dict.items()[index]
+            index = self._get_field_names()[index]
+
+        if isinstance(index, str):
+            field = self._field_dict.get(index)
 
-        elif isinstance(index, str):
-            field = self._field_dict[index]
+            if field is None:
+                field = self._create_field(index)
+                self._field_dict[index] = field
 
         return field
 
+    def _create_field(self, field_name: str) -> Field:
+        field_type, field_value = self._field_schema[field_name]
+
+        # The default value of the schema is shared by all nodes.
+        return field_type(field_name, copy.deepcopy(field_value))
+
+    def _get_field_names(self) -> list[str]:
+        """Get the names of all fields in export order. The schema fields
+            are first, followed by the added fields.
+
+        Returns:
+            list[str]: Field names
+        """
+        field_names = list(self._field_schema)
+
+        for field_name in self._field_dict:
+            if field_name not in self._field_schema:
+                field_names.append(field_name)
+
+        return field_names
+
+    def _write_default_field(self, fd: TextIO, field_name: str, code_format: CodeFormat) -> None:
+        key = (self._type_name, field_name) + code_format.get_state()
+        result = _DEFAULT_FIELD_EXPORT_CACHE.get(key)
+
+        if result is None:
+            result = self._create_field(field_name).export(code_format)
+            _DEFAULT_FIELD_EXPORT_CACHE[key] = result
+
+        fd.write(result)
+
     def add_fields(self, fields: Union[Field, list[Field]]) -> None:
         """Add field(s) to the node.
 
@@ -44,7 +89,19 @@ class Node:
         Returns:
             str: VRML string
         """
-        indent = code_format.indent()
+        buffer = io.StringIO()
+        self.write(buffer, code_format)
+
+        return buffer.getvalue()
+
+    def write(self, fd: TextIO, code_format: CodeFormat) -> None:
+        """Write to a file-like object. Every field is written on its own,
+            therefore the whole node is never hold as one string.
+
+        Args:
+            fd (TextIO): File-like object.
+            code_format (CodeFormat): Code format used for export.
+        """
         line_ending = code_format.line_ending()
 
         # Begin of node
@@ -52,19 +109,26 @@ class Node:
         if len(self.name) > 0:
             node_name = f"DEF {self.name} "
 
-        result = f"{node_name}{self._type_name} {{{line_ending}"
+        fd.write(f"{node_name}{self._type_name} {{{line_ending}")
 
         # Add every node field
         code_format.inc_level()
         indent = code_format.indent()
 
-        for _, field in self._field_dict.items():
-            result += f"{indent}{field.export(code_format)}{line_ending}"
+        for field_name in self._get_field_names():
+            field = self._field_dict.get(field_name)
+
+            fd.write(indent)
+
+            if field is None:
+                self._write_default_field(fd, field_name, code_format)
+            else:
+                field.write(fd, code_format)
+
+            fd.write(line_ending)
 
         code_format.dec_level()
         indent = code_format.indent()
 
         # End of node
-        result += f"{indent}}}{line_ending}"
-
-        return result
+        fd.write(f"{indent}}}{line_ending}")
@@ -1,8 +1,9 @@
 """Webots VRML prototype"""
 
+from typing import TextIO
 from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
 
-class Proto: # pylint: disable=too-few-public-methods
+class Proto:
     """Webots VRML prototype
     """
     def __init__(self, url: str) -> None:
@@ -18,3 +19,12 @@ class Proto: # pylint: disable=too-few-public-methods
             str: VRML string
         """
         return f"EXTERNPROTO \"{self._url}\"{code_format.line_ending()}"
+
+    def write(self, fd: TextIO, code_format: CodeFormat) -> None:
+        """Write to a file-like object.
+
+        Args:
+            fd (TextIO): File-like object.
+            code_format (CodeFormat): Code format used for export.
+        """
+        fd.write(self.export(code_format))
@@ -1,6 +1,8 @@
 """ Webots world file
 """
 
+import io
+from typing import TextIO
 from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
 from pyLineFollowerTrackGenerator.base.node import Node
 from pyLineFollowerTrackGenerator.base.proto import Proto
@@ -26,14 +28,33 @@ class WorldFile:
         Returns:
             str: VRML string
         """
+        buffer = io.StringIO()
+        self.write(buffer, code_format)
+
+        return buffer.getvalue()
+
+    def write(self, fd: TextIO, code_format: CodeFormat) -> None:
+        """Write to a file-like object. The world is written node by node
+            and field by field.
+
+        Args:
+            fd (TextIO): File-like object.
+            code_format (CodeFormat): Code format used for export.
+        """
         line_ending = code_format.line_ending()
 
-        result = self._get_header(code_format)
-        result += "".join(elem.export(code_format) for elem in self._protos)
-        result += f"{line_ending}"
-        result += f"{line_ending}".join(elem.export(code_format) for elem in self._nodes)
+        fd.write(self._get_header(code_format))
+
+        for proto in self._protos:
+            proto.write(fd, code_format)
+
+        fd.write(line_ending)
+
+        for index, node in enumerate(self._nodes):
+            if index > 0:
+                fd.write(line_ending)
 
-        return result
+            node.write(fd, code_format)
 
     def save(self, file_name: str, code_format: CodeFormat) -> None:
         """Save world as a file.
@@ -43,4 +64,4 @@ class WorldFile:
             code_format (CodeFormat): Code format used for export.
         """
         with open(file_name, "w", encoding="utf-8", newline=code_format.line_ending()) as file: # pylint: disable=line-too-long
-            file.write(self.export(code_format))
+            self.write(file, code_format)
@@ -0,0 +1,314 @@
+"""Content-addressed cache of generated worlds, keyed by the track parameters."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable, Union
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.version import __version__
+from pyLineFollowerTrackGenerator.util import get_world_and_image_file_name, get_metrics_file_name
+from pyLineFollowerTrackGenerator.mipmap import get_max_mip_level, get_mip_file_name
+
+################################################################################
+# Variables
+################################################################################
+
+# Arguments which don't influence the generated files.
+_IGNORED_ARGS = ["verbose", "which", "cacheDir", "cacheSize", "cacheLink"]
+
+# Arguments with a file name, where the file content is part of the key.
+_FILE_ARGS = ["gridFileName"]
+
+# Prefix of the cache directory of a package version.
+_VERSION_DIR_PREFIX = "version-"
+
+# Marker file in the cache directory of a package version. Only directories
+# with it are removed, if the package version changes.
+_MARKER_FILE_NAME = ".pyLineFollowerTrackGeneratorCache"
+
+# Block size used to hash files.
+_HASH_BLOCK_SIZE = 1024 * 1024 # [byte]
+
+################################################################################
+# Classes
+################################################################################
+
+class GenerationCache():
+    """Cache of generated worlds. Every entry contains the world, its track
+        images and metrics, stored under the hash of the normalized arguments.
+        The entries are evicted in least recently used order, if the cache
+        exceeds its max. size. Every package version has its own cache, the
+        caches of other versions are removed. A cache directory contains a
+        marker file, so directories which don't belong to a cache are never
+        removed.
+    """
+
+    def __init__(self, directory: str, max_size: int, use_hard_links: bool = False) -> None:
+        """Open the cache in the given directory.
+
+        Args:
+            directory (str): Cache directory, created if it doesn't exist.
+            max_size (int): Max. size of all entries in byte.
+            use_hard_links (bool, optional): Restore files as hard links instead
+                of copies. Defaults to False.
+        """
+        self._directory = os.path.join(directory, _get_version_dir_name())
+        self._max_size = max_size
+        self._use_hard_links = use_hard_links
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        with open(os.path.join(self._directory, _MARKER_FILE_NAME), "a", encoding="utf-8"):
+            pass
+
+        # The entries of other package versions are never hit again.
+        for dir_name in os.listdir(directory):
+            path = os.path.join(directory, dir_name)
+
+            if (dir_name.startswith(_VERSION_DIR_PREFIX) is True) and \
+               (path != self._directory) and \
+               (os.path.isfile(os.path.join(path, _MARKER_FILE_NAME)) is True):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _get_entry_dir(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    def restore(self, key: str, directory: str) -> bool:
+        """Restore the files of a cache entry into the given directory.
+
+        Args:
+            key (str): Cache key, see get_key().
+            directory (str): Output directory.
+
+        Returns:
+            bool: If the entry was found, it will return True otherwise False.
+        """
+        is_hit = False
+        entry_dir = self._get_entry_dir(key)
+
+        if os.path.isdir(entry_dir) is True:
+            for file_name in os.listdir(entry_dir):
+                self._restore_file(os.path.join(entry_dir, file_name), os.path.join(directory, file_name)) # pylint: disable=line-too-long
+
+            # Mark the entry as recently used.
+            os.utime(entry_dir)
+            is_hit = True
+
+        return is_hit
+
+    def _restore_file(self, src: str, dst: str) -> None:
+        # Never write into an existing file, because it may be a hard link into the cache.
+        if os.path.lexists(dst) is True:
+            os.remove(dst)
+
+        is_linked = False
+
+        if self._use_hard_links is True:
+            try:
+                os.link(src, dst)
+                is_linked = True
+            except OSError:
+                # E.g. the cache is on another file system.
+                pass
+
+        if is_linked is False:
+            shutil.copyfile(src, dst)
+
+    def store(self, key: str, file_names: list[str]) -> None:
+        """Store the given files as cache entry and evict the least recently
+            used entries, if the cache exceeds its max. size.
+
+        Args:
+            key (str): Cache key, see get_key().
+            file_names (list[str]): Files of the entry.
+        """
+        entry_dir = self._get_entry_dir(key)
+
+        # Fill a temporary directory first, so a concurrent process never sees
+        # an incomplete entry.
+        tmp_dir = tempfile.mkdtemp(dir=self._directory, prefix=".")
+
+        for file_name in file_names:
+            shutil.copyfile(file_name, os.path.join(tmp_dir, os.path.basename(file_name)))
+
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Stored by a concurrent process meanwhile.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+
+        for dir_name in os.listdir(self._directory):
+            entry_dir = os.path.join(self._directory, dir_name)
+
+            # Skip the temporary directories of entries, which are stored right now.
+            if dir_name.startswith(".") is False:
+                try:
+                    size = sum(entry.stat().st_size for entry in os.scandir(entry_dir))
+                    entries.append((os.stat(entry_dir).st_mtime, size, entry_dir))
+                    total_size += size
+                except OSError:
+                    # Evicted by a concurrent process meanwhile.
+                    pass
+
+        # Least recently used first
+        entries.sort()
+
+        for _, size, entry_dir in entries:
+            if total_size <= self._max_size:
+                break
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_version_dir_name() -> str:
+    return _VERSION_DIR_PREFIX + hashlib.sha256(__version__.encode("utf-8")).hexdigest()[:16]
+
+def _get_file_hash(file_name: str) -> str:
+    file_hash = hashlib.sha256()
+
+    with open(file_name, "rb") as fd:
+        for block in iter(lambda: fd.read(_HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+def get_key(args) -> str:
+    """Get the cache key of a world generation. It is the hash of the
+        normalized program arguments, which contain the command, the seed,
+        the image size, line width, arena size, materials and so on. Input
+        files are hashed by their content, e.g. the control points and
+        start-/stop-line locations of a grid. The package version is part
+        of the key too.
+
+    Args:
+        args (obj): Program arguments
+
+    Returns:
+        str: Cache key
+    """
+    inputs = {
+        "version": __version__
+    }
+
+    for name, value in sorted(vars(args).items()):
+        if name in _FILE_ARGS:
+            inputs[name] = _get_file_hash(value[0])
+        elif name not in _IGNORED_ARGS:
+            inputs[name] = value
+
+    data = json.dumps(inputs, sort_keys=True, default=str)
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+def _get_output_file_names(args) -> list[str]:
+    world_file_name, image_file_name = get_world_and_image_file_name(args.worldFileName[0])
+    mip_levels = min(args.mipLevels, get_max_mip_level(args.imageSize, args.imageSize))
+    file_names = [world_file_name, get_metrics_file_name(world_file_name)]
+
+    for level in range(mip_levels + 1):
+        file_names.append(get_mip_file_name(image_file_name, level))
+
+    return file_names
+
+def _get_cache_key(args, is_random: bool) -> Union[None, str]:
+    key = None
+
+    if (is_random is True) and (args.seed is None):
+        if args.verbose is True:
+            print("No seed given, the world is not cached.")
+
+    else:
+        try:
+            key = get_key(args)
+        except OSError as error:
+            # The generation reports the missing input file.
+            if args.verbose is True:
+                print(f"The world is not cached: {error}")
+
+    return key
+
+def generate_cached(args, generate_world: Callable, is_random: bool = True) -> Ret:
+    """Generate the Webots world with the given generate function or restore
+        it from the generation cache, if the cache directory argument is set.
+        A world, which draws random numbers without seed, is never cached.
+
+    Args:
+        args (obj): Program arguments
+        generate_world (Callable): Generate function of the track module.
+        is_random (bool, optional): The world draws random numbers, e.g. for
+            the track points or the friction. Defaults to True.
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    ret_status = Ret.OK
+    key = None
+
+    if args.cacheDir is not None:
+        key = _get_cache_key(args, is_random)
+
+    if key is None:
+        ret_status = generate_world(args)
+
+    else:
+        cache = GenerationCache(args.cacheDir, args.cacheSize * 1024 * 1024, args.cacheLink)
+        world_file_name, _ = get_world_and_image_file_name(args.worldFileName[0])
+        directory = os.path.dirname(os.path.abspath(world_file_name))
+
+        if cache.restore(key, directory) is True:
+            if args.verbose is True:
+                print(f"Restored {world_file_name} from cache entry {key}.")
+
+        else:
+            # Remove outputs of previous runs, which may be hard links into the cache.
+            for file_name in _get_output_file_names(args):
+                if os.path.lexists(file_name) is True:
+                    os.remove(file_name)
+
+            ret_status = generate_world(args)
+
+            if ret_status == Ret.OK:
+                cache.store(key, _get_output_file_names(args))
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
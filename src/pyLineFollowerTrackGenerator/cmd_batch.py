@@ -0,0 +1,287 @@
+"""Command to generate several Webots worlds in one process, by using a process pool."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import argparse
+import csv
+import json
+import os
+import shlex
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.job_worker import init_worker, run_job, get_job_world_file_names
+from pyLineFollowerTrackGenerator.prg_arg_parser import non_negative_int, positive_int
+from pyLineFollowerTrackGenerator.version import __version__
+
+################################################################################
+# Variables
+################################################################################
+_CMD_NAME = "batch"
+
+# Placeholder in the job arguments, which is replaced by the job index.
+_INDEX_PLACEHOLDER = "{index}"
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _load_jobs(file_name: str) -> list[list[str]]:
+    """Load the job list from a JSON or CSV file.
+
+        JSON: A list of jobs, optional in the "jobs" key of an object. A job
+              is a list of arguments or a command line string.
+        CSV: Every row is a job. Every cell is one argument, or a single
+             cell contains the whole command line.
+
+    Args:
+        file_name (str): Job file name (.json or .csv).
+
+    Returns:
+        list[list[str]]: List of jobs with its arguments.
+    """
+    jobs = []
+
+    with open(file_name, encoding="utf-8", newline="") as fd:
+        if file_name.endswith(".csv") is True:
+            rows = [[cell for cell in row if cell.strip()] for row in csv.reader(fd)]
+        else:
+            data = json.load(fd)
+
+            if isinstance(data, dict):
+                data = data["jobs"]
+
+            rows = [[row] if isinstance(row, str) else row for row in data]
+
+    for row in rows:
+        if len(row) == 1:
+            row = shlex.split(row[0])
+
+        if len(row) > 0:
+            jobs.append([str(arg) for arg in row])
+
+    return jobs
+
+def _check_output_collisions(jobs: list[list[str]]) -> bool:
+    """Check that every job writes its own world. Otherwise the jobs would
+        overwrite the world, images and metrics of each other.
+
+    Args:
+        jobs (list[list[str]]): Jobs with the command and its arguments.
+
+    Returns:
+        bool: If no jobs write the same world, it will return True otherwise False.
+    """
+    is_valid = True
+    indices = {}
+
+    for index, world_file_name in enumerate(get_job_world_file_names(jobs)):
+        if world_file_name is not None:
+            path = os.path.normcase(os.path.abspath(world_file_name))
+
+            if path in indices:
+                print(f"Job {indices[path]} and job {index} write the same world " \
+                      f"{world_file_name}. Use {_INDEX_PLACEHOLDER} in the file name.")
+                is_valid = False
+            else:
+                indices[path] = index
+
+    return is_valid
+
+def _get_failed_result(index: int, job_args: list[str], seed: int, error: Exception) -> dict:
+    return {
+        "index": index,
+        "args": job_args,
+        "seed": seed,
+        "status": Ret.ERROR.name,
+        "error": f"{type(error).__name__}: {error}",
+        "duration": 0.0,
+        "output": ""
+    }
+
+def _write_manifest(file_name: str, seed: int, results: list[dict]) -> None:
+    manifest = {
+        "version": __version__,
+        "seed": seed,
+        "total": len(results),
+        "failed": len([result for result in results if result["status"] != Ret.OK.name]),
+        "jobs": results
+    }
+
+    with open(file_name, "w", encoding="utf-8") as fd:
+        json.dump(manifest, fd, indent=4)
+
+# pylint: disable=too-many-locals
+def _exec(args):
+    """Generate several Webots worlds in parallel.
+
+    Args:
+        args (obj): Program arguments
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pyLineFollowerTrackGenerator.rng import get_seed, spawn_seeds
+
+    ret_status = Ret.OK
+    jobs = []
+
+    if args.jobFile is not None:
+        try:
+            jobs = _load_jobs(args.jobFile)
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Failed to load {args.jobFile}: {error}")
+            ret_status = Ret.ERROR
+
+    elif len(args.cmdLine) > 0:
+        jobs = [list(args.cmdLine) for _ in range(args.count)]
+
+    jobs = [[arg.replace(_INDEX_PLACEHOLDER, str(index)) for arg in job_args] for index, job_args in enumerate(jobs)] # pylint: disable=line-too-long
+
+    if (ret_status == Ret.OK) and (len(jobs) == 0):
+        print("No jobs to run.")
+        ret_status = Ret.ERROR
+
+    if (ret_status == Ret.OK) and (_check_output_collisions(jobs) is False):
+        ret_status = Ret.ERROR
+
+    if ret_status == Ret.OK:
+        # Spawn independent seeds for every job from one root seed, which makes
+        # the whole batch reproducible, independent of the job scheduling.
+        seed = get_seed(args.seed)
+        seeds = spawn_seeds(seed, len(jobs))
+        results = []
+
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as executor:
+            futures = {}
+
+            for index, (job_args, job_seed) in enumerate(zip(jobs, seeds)):
+                futures[executor.submit(run_job, index, job_args, job_seed)] = (index, job_args, job_seed) # pylint: disable=line-too-long
+
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as error: # pylint: disable=broad-exception-caught
+                    # E.g. the worker process terminated abruptly.
+                    result = _get_failed_result(*futures[future], error)
+
+                results.append(result)
+
+                print(f"[{result['index']}] {' '.join(result['args'])}: {result['status']} ({result['duration']:.2f} s)") # pylint: disable=line-too-long
+
+                if (args.verbose is True) and (len(result["output"]) > 0):
+                    print(result["output"])
+
+        results.sort(key=lambda result: result["index"])
+        _write_manifest(args.manifest, seed, results)
+
+        if any(result["status"] != Ret.OK.name for result in results):
+            ret_status = Ret.ERROR
+
+    return ret_status
+
+def cmd_register(arg_sub_parsers):
+    """Register the command specific CLI argument parser and get command
+        specific paramters.
+
+    Args:
+        arg_sub_parsers (obj): Register the parser here
+
+    Returns:
+        obj: Command parameters
+    """
+    cmd_par_dict = {}
+    cmd_par_dict["name"] = _CMD_NAME
+    cmd_par_dict["execFunc"] = _exec
+
+    parser = arg_sub_parsers.add_parser(
+        _CMD_NAME,
+        help="Generate several Webots worlds in one process, e.g. " \
+            "batch -c 10 simple track_{index} -np 20"
+    )
+
+    parser.add_argument(
+        "cmdLine",
+        metavar="CMD_LINE",
+        nargs=argparse.REMAINDER,
+        help="The command with its arguments, which is run COUNT times. " \
+            f"{_INDEX_PLACEHOLDER} is replaced by the job index."
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        metavar="COUNT",
+        required=False,
+        type=positive_int,
+        default=1,
+        help="The number of worlds to generate with CMD_LINE. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-jf",
+        "--jobFile",
+        metavar="JOB_FILE",
+        required=False,
+        type=str,
+        default=None,
+        help="JSON or CSV file with a job list, which is used instead of CMD_LINE."
+    )
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        metavar="MANIFEST",
+        required=False,
+        type=str,
+        default="manifest.json",
+        help="The summary manifest file name (.json). (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-sd",
+        "--seed",
+        metavar="SEED",
+        required=False,
+        type=non_negative_int,
+        default=None,
+        help="The root seed, every job gets its own seed derived from it. (default: random)"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        metavar="WORKERS",
+        required=False,
+        type=positive_int,
+        default=os.cpu_count(),
+        help="The number of worker processes. (default: %(default)d)"
+    )
+
+    return cmd_par_dict
+
+################################################################################
+# Main
+################################################################################
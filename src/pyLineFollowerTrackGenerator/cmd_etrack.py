@@ -25,19 +25,10 @@
 ################################################################################
 # Imports
 ################################################################################
-import numpy as np
-import matplotlib.pyplot as plt
-from pyLineFollowerTrackGenerator.constants import Ret
-from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
-from pyLineFollowerTrackGenerator.base.fields import SFString
-from pyLineFollowerTrackGenerator.base.world_file import WorldFile
-from pyLineFollowerTrackGenerator.base.proto import Proto
-from pyLineFollowerTrackGenerator.util import (
-    get_world_and_image_file_name, create_world_info,
-    create_viewpoint, create_rectangle_arena,
-    create_textured_background, create_textured_background_light,
-    add_friction_to_world, generate_track_image
+from pyLineFollowerTrackGenerator.constants import (
+    RENDERERS, RENDERER_MATPLOTLIB, PNG_FILTERS, PNG_FILTER_NONE, PNG_MODES, PNG_MODE_RGB
 )
+from pyLineFollowerTrackGenerator.prg_arg_parser import non_negative_int, positive_float
 
 # pylint: disable=R0801
 
@@ -45,8 +36,7 @@ from pyLineFollowerTrackGenerator.util import (
 # Variables
 ################################################################################
 _CMD_NAME = "etrack"
-_NUM_OF_POINTS_MIN = 30
-_BASIC_TIME_STEP = 8 # [ms]
+_NUM_OF_POINTS_DEFAULT = 60 # Twice the minimum number of points.
 
 ################################################################################
 # Classes
@@ -56,158 +46,10 @@ _BASIC_TIME_STEP = 8 # [ms]
 # Functions
 ################################################################################
 
-# pylint: disable=line-too-long, too-many-arguments
-def _generate_points_along_x(num_points, distance, x_base, x_tolerance, y_base, y_tolerance, positive) -> list[list[int, int]]:
-    points = []
-
-    for idx in range(num_points):
-        if positive is False:
-            x = x_base - idx * distance
-        else:
-            x = x_base + idx * distance
-
-        y = np.random.uniform(y_base - y_tolerance / 2, y_base + y_tolerance)
-
-        x += x_tolerance
-        y += y_tolerance
-
-        points.append([x, y])
-
-    return points
-
-# pylint: disable=line-too-long, too-many-arguments
-def _generate_points_along_y(num_points, distance, x_base, x_tolerance, y_base, y_tolerance, positive) -> list[list[int, int]]:
-    points = []
-
-    for idx in range(num_points):
-        x = np.random.uniform(x_base - x_tolerance / 2, x_base + x_tolerance)
-
-        if positive is False:
-            y = y_base - idx * distance
-        else:
-            y = y_base + idx * distance
-
-        x += x_tolerance
-        y += y_tolerance
-
-        points.append([x, y])
-
-    return points
-
-# pylint: disable=line-too-long, too-many-statements, too-many-locals
-def _generate_points_along_e(num_points, rect_width, rect_height) -> list[list[int, int]]:
-    """Generate a number of points along a virtual E inside a rectangle with the given
-        width/height.
-
-    Args:
-        num_points (int): Number of points to generate.
-        rect_width (int): Virtual rectangle width in pixels.
-        rect_height (int): Virtual rectangle height in pixels.
-
-    Returns:
-        list[list[int, int]]: Point coordinates (x, y)
-    """
-
-    #        long
-    #   *---------*
-    #   |    short| small
-    #   |  *------*
-    # l |  | short  small
-    # o |  *------*
-    # n |    short| small
-    # g |  *------*
-    #   |  | short  small
-    #   |  *------*
-    #   |    long | small
-    #   *---------*
-    #
-    # -----------------------> x
-    #
-    ratio_long_side = 1
-    ratio_short_side = 2/3 * ratio_long_side
-    ratio_small_side = 1/5 * ratio_long_side
-    num_long_sides = 3
-    num_short_sides = 4
-    num_small_sides = 5
-    num_points_long_side = int(ratio_long_side * num_points / (num_long_sides * ratio_long_side + num_short_sides * ratio_short_side + num_small_sides * ratio_small_side))
-    num_points_short_side = int(num_points_long_side * ratio_short_side)
-    num_points_small_side = int(num_points_long_side * ratio_small_side)
-    tolerance = 10 # [%]
-    width = rect_width * (100 - 2 * tolerance) // 100
-    height = rect_height * (100 - 2 * tolerance) // 100
-    x_tolerance = width * tolerance // 100
-    y_tolerance = height * tolerance // 100
-    distance_long_x = int(ratio_long_side * width / num_points_long_side)
-    distance_long_y = int(ratio_long_side * height / num_points_long_side)
-    distance_short_x = int(ratio_short_side * width / num_points_short_side)
-    distance_small_y = int(ratio_small_side * height / num_points_small_side)
-    points = []
-
-    # Walk along x-axis in positive direction
-    x_base = 0
-    y_base = 0
-    points += _generate_points_along_x(num_points_long_side, distance_long_x, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along y-axis in positive direction
-    x_base = width - 1
-    y_base = 0
-    points += _generate_points_along_y(num_points_small_side, distance_small_y, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along x-axis in negative direction
-    x_base = width - 1
-    y_base = (1 * distance_small_y) - 1
-    points += _generate_points_along_x(num_points_short_side, distance_short_x, x_base, x_tolerance, y_base, y_tolerance, False)
-
-    # Walk along y-axis in positive direction
-    x_base = int((1 - ratio_short_side) * width - 1)
-    y_base = (1 * distance_small_y) - 1
-    points += _generate_points_along_y(num_points_small_side, distance_small_y, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along x-axis in positive direction
-    x_base = int((1 - ratio_short_side) * width - 1)
-    y_base = (2 * distance_small_y) - 1
-    points += _generate_points_along_x(num_points_short_side, distance_short_x, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along y-axis in positive direction
-    x_base = width - 1
-    y_base = (2 * distance_small_y) - 1
-    points += _generate_points_along_y(num_points_small_side, distance_small_y, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along x-axis in negative direction
-    x_base = width - 1
-    y_base = (3 * distance_small_y) - 1
-    points += _generate_points_along_x(num_points_short_side, distance_short_x, x_base, x_tolerance, y_base, y_tolerance, False)
-
-    # Walk along y-axis in positive direction
-    x_base = int((1 - ratio_short_side) * width - 1)
-    y_base = (3 * distance_small_y) - 1
-    points += _generate_points_along_y(num_points_small_side, distance_small_y, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along x-axis in positive direction
-    x_base = int((1 - ratio_short_side) * width - 1)
-    y_base = (4 * distance_small_y) - 1
-    points += _generate_points_along_x(num_points_short_side, distance_short_x, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along y-axis in positive direction
-    x_base = width - 1
-    y_base = (4 * distance_small_y) - 1
-    points += _generate_points_along_y(num_points_small_side, distance_small_y, x_base, x_tolerance, y_base, y_tolerance, True)
-
-    # Walk along x-axis in negative direction
-    x_base = width - 1
-    y_base = (5 * distance_small_y) - 1
-    points += _generate_points_along_x(num_points_long_side, distance_long_x, x_base, x_tolerance, y_base, y_tolerance, False)
-
-    # Walk along y-axis in negative direction
-    x_base = 0
-    y_base = (5 * distance_small_y) - 1
-    points += _generate_points_along_y(num_points_long_side, distance_long_y, x_base, x_tolerance, y_base, y_tolerance, False)
-
-    return points
-
-# pylint: disable=too-many-locals
 def _exec(args):
-    """Generate the Webots world.
+    """Generate the Webots world with a line follower track like a E.
+        The track generation depends on numpy, scipy and matplotlib, which
+        are imported only if the command is executed.
 
     Args:
         args (obj): Program arguments
@@ -215,86 +57,13 @@ def _exec(args):
     Returns:
         Ret: If successful, it will return Ret.OK otherwise a corresponding error.
     """
-    ret_status          = Ret.OK
-    world_title         = args.title
-    world_author        = args.author
-    world_email         = args.email
-    world_description   = args.desc
-    image_width         = args.imageSize # [pixel]
-    image_height        = args.imageSize # [pixel]
-    image_line_width    = args.imageSize * args.lineWidth // args.size # [pixel]
-    arena_width         = args.size # [m]
-    arena_height        = args.size # [m]
-    num_points          = args.numPoints
-    pixel_per_m         = args.imageSize / args.size # [pixel/m]
-    is_debug_mode       = args.debug
-    material_ground     = args.materialGround
-    material_robot      = args.materialRobot
-    material_property   = args.materialProperty
-
-    world_file_name, image_file_name = get_world_and_image_file_name(args.worldFileName[0])
-
-    # Limit lower number of points to enforce that the splines can be drawn
-    # within the image along the virtual rectangle.
-    if num_points < _NUM_OF_POINTS_MIN:
-        num_points = _NUM_OF_POINTS_MIN
-
-        if is_debug_mode is True:
-            print(f"Number of points limited to {num_points}.\n")
-
-    world_info = create_world_info(world_title, world_description, world_author, world_email, _BASIC_TIME_STEP)
-    viewpoint = create_viewpoint(arena_width, arena_height)
+    # pylint: disable=import-outside-toplevel
+    from pyLineFollowerTrackGenerator.track_etrack import generate_world
+    from pyLineFollowerTrackGenerator.cache import generate_cached
 
-    proto_textured_background = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/backgrounds/protos/TexturedBackground.proto") # pylint: disable=line-too-long
-    textured_background = create_textured_background()
-
-    proto_textured_background_light = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/backgrounds/protos/TexturedBackgroundLight.proto") # pylint: disable=line-too-long
-    textured_background_light = create_textured_background_light()
-
-    proto_rectangle_arena = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/floors/protos/RectangleArena.proto") # pylint: disable=line-too-long
-    rectangle_arena = create_rectangle_arena(arena_width, arena_height, image_file_name)
-
-    if add_friction_to_world(world_info, material_ground, material_robot, material_property) is True:
-        rectangle_arena.add_fields(
-            SFString("contactMaterial", material_ground)
-        )
-
-    world_file = WorldFile([
-        proto_textured_background,
-        proto_textured_background_light,
-        proto_rectangle_arena
-    ], [
-        world_info,
-        viewpoint,
-        textured_background,
-        textured_background_light,
-        rectangle_arena
-    ])
-
-    points = _generate_points_along_e(num_points, image_width, image_height)
-
-    # 5 % after the first point
-    start_stop_line_location = 0.05
-
-    fig = generate_track_image( points,
-                                image_width,
-                                image_height,
-                                image_line_width,
-                                pixel_per_m,
-                                start_stop_line_location,
-                                is_debug_mode)
-
-    if is_debug_mode is True:
-        plt.show()
-
-    # Save image in filesystem.
-    fig.savefig(image_file_name, dpi="figure")
-
-    code_format = CodeFormat()
-    world_file.save(world_file_name, code_format)
-
-    return ret_status
+    return generate_cached(args, generate_world)
 
+# pylint: disable=line-too-long
 def cmd_register(arg_sub_parsers):
     """Register the command specific CLI argument parser and get command
         specific paramters.
@@ -329,6 +98,41 @@ def cmd_register(arg_sub_parsers):
         default="anonymous",
         help="The authors name. (default: %(default)s)"
     )
+    parser.add_argument(
+        "-al",
+        "--arenaMipLevel",
+        metavar="ARENA_MIP_LEVEL",
+        required=False,
+        type=int,
+        default=0,
+        help="The mip level of the track image, which is used as ground in the arena. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-cd",
+        "--cacheDir",
+        metavar="CACHE_DIR",
+        required=False,
+        type=str,
+        default=None,
+        help="The directory of the generation cache. Worlds with a seed are restored from it, if they were generated with the same parameters before. (default: no cache)"
+    )
+    parser.add_argument(
+        "-cl",
+        "--cacheLink",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Restore the files from the generation cache as hard links instead of copies."
+    )
+    parser.add_argument(
+        "-cs",
+        "--cacheSize",
+        metavar="CACHE_SIZE",
+        required=False,
+        type=int,
+        default=1024,
+        help="The max. size of the generation cache in [MiB]. The least recently used worlds are evicted. (default: %(default)d)"
+    )
     parser.add_argument(
         "-d",
         "--desc",
@@ -398,15 +202,82 @@ def cmd_register(arg_sub_parsers):
         default="dry",
         help="The contact material property e.g. dry, wet, etc. used for friction. (default: %(default)s)"
     )
+    parser.add_argument(
+        "-ma",
+        "--maxAttempts",
+        metavar="MAX_ATTEMPTS",
+        required=False,
+        type=int,
+        default=1,
+        help="The max. number of attempts to generate a track, which doesn't cross itself and keeps the min. clearance. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-mc",
+        "--minClearance",
+        metavar="MIN_CLEARANCE",
+        required=False,
+        type=positive_float,
+        default=0.03,
+        help="The min. distance in [m] between the line middle of two parts of the track. (default: %(default)f)"
+    )
     parser.add_argument(
         "-np",
         "--numPoints",
         metavar="NUM_POINTS",
         required=False,
         type=int,
-        default=2 * _NUM_OF_POINTS_MIN,
+        default=_NUM_OF_POINTS_DEFAULT,
         help="The total number of points used to generate the arena. (default: %(default)d)"
     )
+    parser.add_argument(
+        "-ml",
+        "--mipLevels",
+        metavar="MIP_LEVELS",
+        required=False,
+        type=int,
+        default=0,
+        help="The number of mip levels of the track image, each with the half resolution of the previous one. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-pc",
+        "--pngCompression",
+        metavar="PNG_COMPRESSION",
+        required=False,
+        type=int,
+        choices=range(10),
+        default=6,
+        help="The zlib compression level [0..9] of the track image. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-pf",
+        "--pngFilter",
+        metavar="PNG_FILTER",
+        required=False,
+        type=str,
+        choices=PNG_FILTERS,
+        default=PNG_FILTER_NONE,
+        help=f"The PNG scanline filter of the track image: {', '.join(PNG_FILTERS)}. (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-pm",
+        "--pngMode",
+        metavar="PNG_MODE",
+        required=False,
+        type=str,
+        choices=PNG_MODES,
+        default=PNG_MODE_RGB,
+        help=f"The PNG color mode of the track image: {', '.join(PNG_MODES)}. (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-r",
+        "--renderer",
+        metavar="RENDERER",
+        required=False,
+        type=str,
+        choices=RENDERERS,
+        default=RENDERER_MATPLOTLIB,
+        help=f"The renderer used for the track image: {', '.join(RENDERERS)}. (default: %(default)s)"
+    )
     parser.add_argument(
         "-s",
         "--size",
@@ -416,6 +287,15 @@ def cmd_register(arg_sub_parsers):
         default=2,
         help="The arena width/length in [m]. (default: %(default)d)"
     )
+    parser.add_argument(
+        "-sd",
+        "--seed",
+        metavar="SEED",
+        required=False,
+        type=non_negative_int,
+        default=None,
+        help="The seed used to generate the track. The same seed generates the same track. (default: random)"
+    )
     parser.add_argument(
         "-t",
         "--title",
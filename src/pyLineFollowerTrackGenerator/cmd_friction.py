@@ -26,7 +26,6 @@
 # Imports
 ################################################################################
 from pyLineFollowerTrackGenerator.constants import Ret
-from pyLineFollowerTrackGenerator.friction import Friction
 
 ################################################################################
 # Variables
@@ -51,6 +50,9 @@ def _exec(args):
     Returns:
         Ret: If successful, it will return Ret.OK otherwise a corresponding error.
     """
+    # pylint: disable=import-outside-toplevel
+    from pyLineFollowerTrackGenerator.friction import Friction
+
     ret_status = Ret.OK
     friction_db = Friction()
 
@@ -0,0 +1,153 @@
+"""Command to generate a closed line follower track in a grid for the grid command."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from pyLineFollowerTrackGenerator.prg_arg_parser import non_negative_int
+
+################################################################################
+# Variables
+################################################################################
+_CMD_NAME = "gridgen"
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _exec(args):
+    """Generate a closed line follower track in a grid and save it as grid file.
+        The track generation depends on numpy, which is imported only if the
+        command is executed.
+
+    Args:
+        args (obj): Program arguments
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pyLineFollowerTrackGenerator.grid_tour import generate_grid
+
+    return generate_grid(args)
+
+# pylint: disable=line-too-long
+def cmd_register(arg_sub_parsers):
+    """Register the command specific CLI argument parser and get command
+        specific paramters.
+
+    Args:
+        arg_sub_parsers (obj): Register the parser here
+
+    Returns:
+        obj: Command parameters
+    """
+    cmd_par_dict = {}
+    cmd_par_dict["name"] = _CMD_NAME
+    cmd_par_dict["execFunc"] = _exec
+
+    parser = arg_sub_parsers.add_parser(
+        _CMD_NAME,
+        help="Generate a closed line follower track in a grid, which can be used by the grid command."
+    )
+
+    parser.add_argument(
+        "gridFileName",
+        metavar="GRID_FILE_NAME",
+        type=str,
+        nargs=1,
+        help="Grid file name (.json or .npy)."
+    )
+    parser.add_argument(
+        "-c",
+        "--candidates",
+        metavar="CANDIDATES",
+        required=False,
+        type=int,
+        default=1000,
+        help="The number of generated tracks, the one closest to the target length is selected. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-dbg",
+        "--debug",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Shows debug information on console."
+    )
+    parser.add_argument(
+        "-gh",
+        "--gridHeight",
+        metavar="GRID_HEIGHT",
+        required=False,
+        type=int,
+        default=8,
+        help="The grid height in number of point distances. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-gw",
+        "--gridWidth",
+        metavar="GRID_WIDTH",
+        required=False,
+        type=int,
+        default=8,
+        help="The grid width in number of point distances. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-l",
+        "--length",
+        metavar="LENGTH",
+        required=False,
+        type=float,
+        default=None,
+        help="The target track length in [m]. (default: the whole grid is used)"
+    )
+    parser.add_argument(
+        "-pd",
+        "--pointDistance",
+        metavar="POINT_DISTANCE",
+        required=False,
+        type=float,
+        default=0.1,
+        help="The point distance in the grid in [m]. (default: %(default)f)"
+    )
+    parser.add_argument(
+        "-sd",
+        "--seed",
+        metavar="SEED",
+        required=False,
+        type=non_negative_int,
+        default=None,
+        help="The seed used to generate the track. The same seed generates the same track. (default: random)"
+    )
+
+    return cmd_par_dict
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,347 @@
+"""Command to serve the generation of Webots worlds via a local HTTP/JSON API."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import base64
+import itertools
+import json
+import os
+import shlex
+import signal
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.job_worker import init_worker, run_job
+from pyLineFollowerTrackGenerator.version import __version__
+
+################################################################################
+# Variables
+################################################################################
+_CMD_NAME = "serve"
+
+# Path of the job requests.
+_JOBS_PATH = "/jobs"
+
+# Path of the server status.
+_STATUS_PATH = "/status"
+
+# Max. size of a job request body.
+_MAX_REQUEST_SIZE = 1024 * 1024 # [byte]
+
+################################################################################
+# Classes
+################################################################################
+
+class _JobServer(ThreadingHTTPServer):
+    """HTTP server, which runs the received jobs on a pool of worker processes.
+        The number of jobs, which are running or wait for a worker, is bounded.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, address: tuple[str, int], executor: ProcessPoolExecutor, num_workers: int, queue_size: int, is_verbose: bool) -> None: # pylint: disable=line-too-long
+        super().__init__(address, _JobRequestHandler)
+        self.executor = executor
+        self.is_verbose = is_verbose
+        self.max_pending_jobs = num_workers + queue_size
+        self._job_slots = threading.BoundedSemaphore(self.max_pending_jobs)
+        self._job_counter = itertools.count()
+        self._lock = threading.Lock()
+        self._num_pending_jobs = 0
+
+    def acquire_job_slot(self) -> bool:
+        """Acquire a slot for a job, without waiting for a free one.
+
+        Returns:
+            bool: If a slot is available, it will return True otherwise False.
+        """
+        is_acquired = self._job_slots.acquire(blocking=False) # pylint: disable=consider-using-with
+
+        if is_acquired is True:
+            with self._lock:
+                self._num_pending_jobs += 1
+
+        return is_acquired
+
+    def release_job_slot(self) -> None:
+        """Release the slot of a finished job.
+        """
+        with self._lock:
+            self._num_pending_jobs -= 1
+
+        self._job_slots.release()
+
+    def get_num_pending_jobs(self) -> int:
+        """Get the number of jobs, which are running or wait for a worker.
+
+        Returns:
+            int: Number of pending jobs
+        """
+        with self._lock:
+            num_pending_jobs = self._num_pending_jobs
+
+        return num_pending_jobs
+
+    def get_job_index(self) -> int:
+        """Get the index of the next job.
+
+        Returns:
+            int: Job index
+        """
+        with self._lock:
+            index = next(self._job_counter)
+
+        return index
+
+class _JobRequestHandler(BaseHTTPRequestHandler):
+    """Handles the requests of the HTTP/JSON API:
+
+        GET /status: Server status.
+        POST /jobs: Run a job and respond with its result and generated files.
+    """
+
+    def _send_json(self, status: HTTPStatus, data: dict) -> None:
+        body = json.dumps(data).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def log_message(self, format, *args) -> None: # pylint: disable=redefined-builtin
+        if self.server.is_verbose is True:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None: # pylint: disable=invalid-name
+        """Handle a GET request.
+        """
+        if self.path == _STATUS_PATH:
+            self._send_json(HTTPStatus.OK, {
+                "version": __version__,
+                "pendingJobs": self.server.get_num_pending_jobs(),
+                "maxPendingJobs": self.server.max_pending_jobs
+            })
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}.")
+
+    def do_POST(self) -> None: # pylint: disable=invalid-name
+        """Handle a POST request.
+        """
+        job_args = None
+
+        if self.path != _JOBS_PATH:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}.")
+        else:
+            job_args = self._read_job_args()
+
+        if job_args is not None:
+            if self.server.acquire_job_slot() is False:
+                self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Job queue is full.")
+            else:
+                result = None
+
+                try:
+                    result = self._run_job(job_args)
+                except Exception as error: # pylint: disable=broad-exception-caught
+                    self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"Job failed: {error}")
+                finally:
+                    self.server.release_job_slot()
+
+                if result is None:
+                    pass
+                elif "error" in result:
+                    self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, result)
+                else:
+                    self._send_json(HTTPStatus.OK, result)
+
+    def _read_job_args(self) -> list[str]:
+        """Read the job arguments from the request body. The body is a JSON
+            object with the command and its arguments in the "args" key, either
+            as list of arguments or as command line string. If the request is
+            invalid, the error response is sent.
+
+        Returns:
+            list[str]: Command and its arguments or None if the request is invalid.
+        """
+        job_args = None
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+
+            if length < 0:
+                raise ValueError(f"Invalid Content-Length {length}.")
+
+            if length > _MAX_REQUEST_SIZE:
+                self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Job request is too large.")
+            else:
+                data = json.loads(self.rfile.read(length).decode("utf-8"))
+                job_args = data["args"]
+
+                if isinstance(job_args, str):
+                    job_args = shlex.split(job_args)
+
+                job_args = [str(arg) for arg in job_args]
+
+        except (ValueError, KeyError, TypeError) as error:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid job request: {error}")
+            job_args = None
+
+        return job_args
+
+    def _run_job(self, job_args: list[str]) -> dict:
+        """Run a job on a worker in a temporary output directory and add all
+            generated files base64 encoded to its result.
+
+        Args:
+            job_args (list[str]): Command and its arguments.
+
+        Returns:
+            dict: Job result
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyLineFollowerTrackGenerator.rng import get_seed
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            future = self.server.executor.submit(run_job, self.server.get_job_index(), job_args, get_seed(None), output_dir) # pylint: disable=line-too-long
+            result = future.result()
+            result["files"] = {}
+
+            for file_name in sorted(os.listdir(output_dir)):
+                with open(os.path.join(output_dir, file_name), "rb") as fd:
+                    result["files"][file_name] = base64.b64encode(fd.read()).decode("ascii")
+
+        return result
+
+################################################################################
+# Functions
+################################################################################
+
+def _init_worker() -> None:
+    """Initialize a worker process of the server. A Ctrl+C stops only the
+        server, which shuts the workers down.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker()
+
+def _exec(args):
+    """Serve the generation of Webots worlds via a local HTTP/JSON API,
+        until the server is interrupted.
+
+    Args:
+        args (obj): Program arguments
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    ret_status = Ret.OK
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        # Start all workers now, so the first jobs don't wait for their initialization.
+        wait([executor.submit(os.getpid) for _ in range(args.workers)])
+
+        try:
+            with _JobServer((args.host, args.port), executor, args.workers, args.queueSize, args.verbose) as server: # pylint: disable=line-too-long
+                host, port = server.server_address[:2]
+                print(f"Serving on http://{host}:{port}{_JOBS_PATH}, press Ctrl+C to stop.")
+
+                server.serve_forever()
+
+        except OSError as error:
+            print(f"Failed to serve on {args.host}:{args.port}: {error}")
+            ret_status = Ret.ERROR
+
+        except KeyboardInterrupt:
+            pass
+
+    return ret_status
+
+def cmd_register(arg_sub_parsers):
+    """Register the command specific CLI argument parser and get command
+        specific paramters.
+
+    Args:
+        arg_sub_parsers (obj): Register the parser here
+
+    Returns:
+        obj: Command parameters
+    """
+    cmd_par_dict = {}
+    cmd_par_dict["name"] = _CMD_NAME
+    cmd_par_dict["execFunc"] = _exec
+
+    parser = arg_sub_parsers.add_parser(
+        _CMD_NAME,
+        help="Serve the generation of Webots worlds via a local HTTP/JSON API."
+    )
+
+    parser.add_argument(
+        "-ho",
+        "--host",
+        metavar="HOST",
+        required=False,
+        type=str,
+        default="127.0.0.1",
+        help="The host address the server listens on. (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-p",
+        "--port",
+        metavar="PORT",
+        required=False,
+        type=int,
+        default=8080,
+        help="The port the server listens on. (default: %(default)d)"
+    )
+    parser.add_argument(
+        "-qs",
+        "--queueSize",
+        metavar="QUEUE_SIZE",
+        required=False,
+        type=int,
+        default=16,
+        help="The max. number of jobs, which wait for a worker. Further jobs are rejected. (default: %(default)d)" # pylint: disable=line-too-long
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        metavar="WORKERS",
+        required=False,
+        type=int,
+        default=os.cpu_count(),
+        help="The number of worker processes. (default: %(default)d)"
+    )
+
+    return cmd_par_dict
+
+################################################################################
+# Main
+################################################################################
@@ -31,6 +31,39 @@ from enum import IntEnum
 # Variables
 ################################################################################
 
+# Available renderers of the track image.
+RENDERER_MATPLOTLIB = "matplotlib"
+RENDERER_NUMPY = "numpy"
+RENDERER_TILED = "tiled"
+RENDERERS = [RENDERER_MATPLOTLIB, RENDERER_NUMPY, RENDERER_TILED]
+
+# Available PNG scanline filters. The adaptive filter selects the best one per row.
+PNG_FILTER_NONE = "none"
+PNG_FILTER_SUB = "sub"
+PNG_FILTER_UP = "up"
+PNG_FILTER_AVERAGE = "average"
+PNG_FILTER_PAETH = "paeth"
+PNG_FILTER_ADAPTIVE = "adaptive"
+PNG_FILTERS = [PNG_FILTER_NONE, PNG_FILTER_SUB, PNG_FILTER_UP, PNG_FILTER_AVERAGE, PNG_FILTER_PAETH, PNG_FILTER_ADAPTIVE] # pylint: disable=line-too-long
+
+# Available PNG color modes. The gray modes store the luminance with 8, 4, 2 or
+# 1 bit, the palette mode stores the index into a palette of the track colors.
+PNG_MODE_RGB = "rgb"
+PNG_MODE_GRAY = "gray"
+PNG_MODE_GRAY4 = "gray4"
+PNG_MODE_GRAY2 = "gray2"
+PNG_MODE_GRAY1 = "gray1"
+PNG_MODE_PALETTE = "palette"
+PNG_MODES = [PNG_MODE_RGB, PNG_MODE_GRAY, PNG_MODE_GRAY4, PNG_MODE_GRAY2, PNG_MODE_GRAY1, PNG_MODE_PALETTE] # pylint: disable=line-too-long
+
+# Colors used in the track images as RGB.
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "orange": (255, 165, 0)
+}
+
 class Ret(IntEnum):
     """This type shall be used for return status information.
     """
@@ -25,15 +25,26 @@
 ################################################################################
 # Imports
 ################################################################################
+import hashlib
 import json
-import random
+import marshal
+import os
 from typing import Union
+import numpy as np
 
 ################################################################################
 # Variables
 ################################################################################
 FRICTION_FILE_NAME = "./database/friction.json"
 
+# The compiled cache of a friction database is stored in the user cache directory.
+_CACHE_DIR_NAME = "pyLineFollowerTrackGenerator"
+_CACHE_FILE_PREFIX = "friction-"
+_CACHE_FILE_EXTENSION = ".cache"
+
+# Increase the version if the content of the compiled cache changes.
+_CACHE_VERSION = 2
+
 ################################################################################
 # Classes
 ################################################################################
@@ -45,24 +56,155 @@ class Friction():
 
     def __init__(self):
         self._friction_data = {}
+        self._friction_index = {}
 
     def _load(self, file_name: str) -> bool:
+        status = self._load_cache(file_name)
+
+        if status is False:
+            status = self._load_json(file_name)
+
+        return status
+
+    def _load_json(self, file_name: str) -> bool:
         status = False
 
         try:
-            with open(file_name, encoding="utf-8") as json_data:
-                self._friction_data = json.load(json_data)
+            with open(file_name, "rb") as fd:
+                content = fd.read()
+
+            self._friction_data = json.loads(content.decode("utf-8"))
 
             status = self._check_friction_data()
 
             if status is False:
                 self._friction_data = {}
 
+            self._build_index()
+
+            if status is True:
+                self._save_cache(file_name, self._get_hash(content))
+
         except FileNotFoundError:
             print(f"{file_name} not found.")
 
         return status
 
+    @staticmethod
+    def _get_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def _get_cache_file_name(file_name: str) -> str:
+        """Get the file name of the compiled cache of a friction database. It
+            is stored in the user cache directory, e.g. ~/.cache, and not in
+            the database directory. Every database has its own cache, named by
+            the hash of its absolute path.
+
+        Args:
+            file_name (str): Friction database file name.
+
+        Returns:
+            str: Cache file name
+        """
+        if os.name == "nt":
+            cache_home = os.environ.get("LOCALAPPDATA", "")
+        else:
+            cache_home = os.environ.get("XDG_CACHE_HOME", "")
+
+        # A relative cache directory shall be ignored.
+        if os.path.isabs(cache_home) is False:
+            cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+
+        path_hash = hashlib.sha256(os.path.abspath(file_name).encode("utf-8")).hexdigest()[:16]
+        cache_file_name = _CACHE_FILE_PREFIX + path_hash + _CACHE_FILE_EXTENSION
+
+        return os.path.join(cache_home, _CACHE_DIR_NAME, cache_file_name)
+
+    def _load_cache(self, file_name: str) -> bool:
+        """Load the validated and indexed friction data from the compiled cache.
+            The cache is used if the friction database has the same modification
+            time or the same content like at the time the cache was created.
+
+        Args:
+            file_name (str): Friction database file name.
+
+        Returns:
+            bool: If the cache is up to date and loaded, it will return True
+                otherwise False.
+        """
+        status = False
+
+        try:
+            file_stat = os.stat(file_name)
+
+            # The cache contains only plain data, which can't execute code on loading.
+            with open(self._get_cache_file_name(file_name), "rb") as fd:
+                cache = marshal.loads(fd.read())
+
+            if (cache["version"] == _CACHE_VERSION) and \
+               (cache["fileName"] == os.path.abspath(file_name)):
+                is_modified = (cache["mtime"] != file_stat.st_mtime_ns) or \
+                              (cache["size"] != file_stat.st_size)
+                file_hash = cache["hash"]
+
+                # The modification time changes e.g. by a checkout, although
+                # the content may be the same.
+                if is_modified is True:
+                    with open(file_name, "rb") as fd:
+                        file_hash = self._get_hash(fd.read())
+
+                if cache["hash"] == file_hash:
+                    self._friction_data = cache["frictionData"]
+                    self._friction_index = cache["frictionIndex"]
+                    status = True
+
+                    if is_modified is True:
+                        self._save_cache(file_name, file_hash)
+
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            # The cache doesn't exist or is corrupt, it will be rebuild.
+            status = False
+
+        return status
+
+    def _save_cache(self, file_name: str, file_hash: str) -> None:
+        """Save the validated and indexed friction data as compiled cache.
+            If the cache can't be written, e.g. because of a read-only folder,
+            the friction data is loaded from the database next time again.
+
+        Args:
+            file_name (str): Friction database file name.
+            file_hash (str): Hash of the friction database content.
+        """
+        cache_file_name = self._get_cache_file_name(file_name)
+        tmp_file_name = f"{cache_file_name}.{os.getpid()}.tmp"
+
+        try:
+            file_stat = os.stat(file_name)
+            cache = {
+                "version": _CACHE_VERSION,
+                "fileName": os.path.abspath(file_name),
+                "mtime": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "hash": file_hash,
+                "frictionData": self._friction_data,
+                "frictionIndex": self._friction_index
+            }
+
+            os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+
+            # Replace the cache at once, because several processes may load
+            # the friction data in parallel.
+            with open(tmp_file_name, "wb") as fd:
+                fd.write(marshal.dumps(cache))
+
+            os.replace(tmp_file_name, cache_file_name)
+
+        except OSError:
+            if os.path.exists(tmp_file_name) is True:
+                os.remove(tmp_file_name)
+
     def _check_friction_data(self) -> bool:
         status = True
 
@@ -80,6 +222,57 @@ class Friction():
 
         return status
 
+    @staticmethod
+    def _get_key(material1: str, material2: str) -> tuple[str, str]:
+        """Get the key of a material pair in the index. The key is independent
+            of the material order.
+
+        Args:
+            material1 (str): Name of material 1
+            material2 (str): Name of material 2
+
+        Returns:
+            tuple[str, str]: Key
+        """
+        if material2 < material1:
+            material1, material2 = material2, material1
+
+        return (material1, material2)
+
+    def _build_index(self) -> None:
+        """Build the index of all material pairs. If a material pair is
+            several times in the database, the last one is used.
+        """
+        self._friction_index = {}
+
+        for material_pair in self._friction_data.get("friction", []):
+            key = self._get_key(material_pair["material1"], material_pair["material2"])
+            self._friction_index[key] = material_pair
+
+    def _get_friction_range(self, material_pair: dict, kind_of: str, material_property: str) -> tuple[float, float]: # pylint: disable=line-too-long
+        """Get the friction range of the material pair.
+
+        Args:
+            material_pair (dict): The material pair.
+            kind_of (str): Kind of friction, which is "static" or "sliding".
+            material_property (str): Material property, like e.g. dry or wet.
+
+        Returns:
+            tuple[float, float]: Friction (min, max). A single friction value has
+                the same min and max. If not available, it will be NaN.
+        """
+        friction_range = (np.nan, np.nan)
+
+        if kind_of in material_pair:
+            if material_property in material_pair[kind_of]:
+                friction = material_pair[kind_of][material_property]
+                if isinstance(friction, dict):
+                    friction_range = (friction["min"], friction["max"])
+                else:
+                    friction_range = (friction, friction)
+
+        return friction_range
+
     def _print_friction(self, kind_of, indention) -> None:
         for key, value in kind_of.items():
             if isinstance(value, dict):
@@ -147,13 +340,14 @@ class Friction():
 
                     count += 1
 
-    def _get_static_friction(self, material_pair: dict, material_property: str) -> float:
+    def _get_static_friction(self, material_pair: dict, material_property: str, rng: np.random.Generator) -> float: # pylint: disable=line-too-long
         """Get the static friction of the material pair and the required property,
             like e.g. dry or wet.
 
         Args:
             material_pair (dict): The material pair.
             material_property (str): Material property, like e.g. dry or wet.
+            rng (np.random.Generator): Random number generator used for a friction range.
 
         Returns:
             float: Static friction
@@ -166,19 +360,20 @@ class Friction():
                 if isinstance(friction, dict):
                     friction_min = friction["min"]
                     friction_max = friction["max"]
-                    static_friction_value = random.uniform(friction_min, friction_max)
+                    static_friction_value = float(rng.uniform(friction_min, friction_max))
                 else:
                     static_friction_value = friction
 
         return static_friction_value
 
-    def _get_dynamic_friction(self, material_pair: dict, material_property: str) -> float:
+    def _get_dynamic_friction(self, material_pair: dict, material_property: str, rng: np.random.Generator) -> float: # pylint: disable=line-too-long
         """Get the dynamic friction of the material pair and the required property,
             like e.g. dry or wet.
 
         Args:
             material_pair (dict): The material pair.
             material_property (str): Material property, like e.g. dry or wet.
+            rng (np.random.Generator): Random number generator used for a friction range.
 
         Returns:
             float: Dynamic friction
@@ -191,14 +386,14 @@ class Friction():
                 if isinstance(friction, dict):
                     friction_min = friction["min"]
                     friction_max = friction["max"]
-                    dynamic_friction_value = random.uniform(friction_min, friction_max)
+                    dynamic_friction_value = float(rng.uniform(friction_min, friction_max))
                 else:
                     dynamic_friction_value = friction
 
         return dynamic_friction_value
 
     # pylint: disable=line-too-long
-    def get_friction(self, material1: str, material2: str, material_property: str) -> tuple[Union[None,float], Union[None,float]]:
+    def get_friction(self, material1: str, material2: str, material_property: str, rng: Union[None,np.random.Generator] = None) -> tuple[Union[None,float], Union[None,float]]:
         """Get friction between the two materials and by considering whether its
             e.g. dry.
 
@@ -206,6 +401,9 @@ class Friction():
             material1 (str): Name of material 1
             material2 (str): Name of material 2
             material_property (str): Material property like e.g. dry, wet, etc.
+            rng (Union[None,np.random.Generator]): Random number generator used if the
+                                    friction is a range. Defaults to None, which means a
+                                    new not seeded one.
 
         Returns:
             tuple[Union[None,float], Union[None,float]]: If material pair found,
@@ -214,15 +412,56 @@ class Friction():
         static_friction_value = None
         dynamic_friction_value = None
 
-        if "friction" in self._friction_data:
-            for material_pair in self._friction_data["friction"]:
-                if material1 in (material_pair["material1"], material_pair["material2"]):
-                    if material2 in (material_pair["material1"], material_pair["material2"]):
-                        static_friction_value = self._get_static_friction(material_pair, material_property)
-                        dynamic_friction_value  = self._get_dynamic_friction(material_pair, material_property)
+        if rng is None:
+            rng = np.random.default_rng()
+
+        material_pair = self._friction_index.get(self._get_key(material1, material2))
+
+        if material_pair is not None:
+            static_friction_value = self._get_static_friction(material_pair, material_property, rng)
+            dynamic_friction_value  = self._get_dynamic_friction(material_pair, material_property, rng)
 
         return (static_friction_value, dynamic_friction_value)
 
+    # pylint: disable=line-too-long
+    def get_friction_many(self, material_pairs: list[tuple[str, str]], material_property: str, rng: Union[None,np.random.Generator] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Get the friction of many material pairs at once, e.g. to sweep over
+            material combinations.
+
+        Args:
+            material_pairs (list[tuple[str, str]]): Material pairs (material 1, material 2).
+            material_property (str): Material property like e.g. dry, wet, etc.
+            rng (Union[None,np.random.Generator]): Random number generator used if the
+                                    friction is a range. Defaults to None, which means a
+                                    new not seeded one.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Static and dynamic friction of every material pair.
+                                    If not available, the friction is NaN.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        # Friction min and max of every material pair for static and dynamic friction.
+        friction_ranges = np.full((2, len(material_pairs), 2), np.nan)
+
+        for index, (material1, material2) in enumerate(material_pairs):
+            material_pair = self._friction_index.get(self._get_key(material1, material2))
+
+            if material_pair is not None:
+                friction_ranges[0, index] = self._get_friction_range(material_pair, "static", material_property)
+                friction_ranges[1, index] = self._get_friction_range(material_pair, "sliding", material_property)
+
+        friction_min = friction_ranges[:, :, 0]
+        friction_max = friction_ranges[:, :, 1]
+        friction_values = friction_min.copy()
+
+        # Only a friction range needs a random value.
+        is_range = friction_min < friction_max
+        friction_values[is_range] = rng.uniform(friction_min[is_range], friction_max[is_range])
+
+        return (friction_values[0], friction_values[1])
+
 ################################################################################
 # Functions
 ################################################################################
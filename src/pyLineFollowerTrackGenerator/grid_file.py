@@ -0,0 +1,352 @@
+"""Load and save the track points of a grid track, as JSON or NPY file.
+
+    JSON: {"track": [{"x": 1, "y": 0}, {"x": 2, "y": 0, "startStopLine": true}, ...]}
+    NPY: int32 array with shape (N, 3), every row is x, y and the start-/stop-line flag (0/1).
+"""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import json
+import os
+from typing import Iterator
+import numpy as np
+
+# pylint: disable=line-too-long
+
+################################################################################
+# Variables
+################################################################################
+
+# Size of a chunk, which is read from a JSON file at once.
+_CHUNK_SIZE = 64 * 1024 # [byte]
+
+# Min. size of a point in a JSON file, used to estimate the number of points.
+_POINT_SIZE_MIN = 16 # [byte]
+
+_JSON_WHITESPACE = " \t\n\r"
+
+################################################################################
+# Classes
+################################################################################
+
+class GridFileError(ValueError):
+    """The grid file is invalid.
+    """
+
+class _JsonTrackReader(): # pylint: disable=too-few-public-methods
+    """Reads the points of the track array of a grid JSON file one by one,
+        without loading the whole file.
+    """
+
+    def __init__(self, fd) -> None:
+        self._fd = fd
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._is_eof = False
+
+    def _read(self) -> bool:
+        """Read the next chunk into the buffer and drop the already parsed part.
+
+        Returns:
+            bool: If a chunk was read, it will return True otherwise False.
+        """
+        chunk = self._fd.read(_CHUNK_SIZE)
+
+        if len(chunk) == 0:
+            self._is_eof = True
+        else:
+            self._buffer = self._buffer[self._pos:] + chunk
+            self._pos = 0
+
+        return not self._is_eof
+
+    def _skip(self, characters: str) -> str:
+        """Skip the given characters and get the next one.
+
+        Args:
+            characters (str): Characters to skip.
+
+        Returns:
+            str: Next character or a empty string at the end of the file.
+        """
+        character = ""
+
+        while character == "":
+            while (self._pos < len(self._buffer)) and (self._buffer[self._pos] in characters):
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                character = self._buffer[self._pos]
+            elif self._read() is False:
+                break
+
+        return character
+
+    def _decode(self, description: str):
+        """Decode the next JSON value. Further chunks are read, until the
+            value is complete.
+
+        Args:
+            description (str): Description of the value for the error message.
+
+        Returns:
+            obj: Value
+        """
+        value = None
+        is_decoded = False
+
+        while is_decoded is False:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+
+                # A number at the end of the buffer may continue in the next chunk.
+                if (end < len(self._buffer)) or (self._read() is False):
+                    self._pos = end
+                    is_decoded = True
+
+            except json.JSONDecodeError as error:
+                # The value may be incomplete, until the next chunk is read.
+                if self._read() is False:
+                    raise GridFileError(f"Invalid {description}: {error.msg}") from error
+
+        return value
+
+    def _find_track(self) -> None:
+        """Walk through the members of the top-level object until the track
+            and move behind the begin of its array. The values of all other
+            members are skipped, including the nested ones.
+        """
+        if self._skip(_JSON_WHITESPACE) != "{":
+            raise GridFileError("The grid file contains no JSON object.")
+
+        self._pos += 1
+        key = None
+
+        while key != "track":
+            if self._skip(_JSON_WHITESPACE) != '"':
+                raise GridFileError("No track found.")
+
+            key = self._decode("key")
+
+            if self._skip(_JSON_WHITESPACE) != ":":
+                raise GridFileError(f"Invalid member {key}.")
+
+            self._pos += 1
+
+            if key != "track":
+                self._skip(_JSON_WHITESPACE)
+                self._decode(f"value of {key}")
+                character = self._skip(_JSON_WHITESPACE)
+
+                if character == ",":
+                    self._pos += 1
+                elif character == "}":
+                    raise GridFileError("No track found.")
+                else:
+                    raise GridFileError(f"Invalid member {key}.")
+
+        if self._skip(_JSON_WHITESPACE) != "[":
+            raise GridFileError("The track is no array.")
+
+        self._pos += 1
+
+    def get_points(self) -> Iterator[dict]:
+        """Get the points of the track one by one.
+
+        Yields:
+            dict: Point
+        """
+        index = 0
+
+        self._find_track()
+
+        while self._skip(_JSON_WHITESPACE + ",") not in ("]", ""):
+            yield self._decode(f"point {index}")
+            index += 1
+
+        if self._skip(_JSON_WHITESPACE) != "]":
+            raise GridFileError("The track array is not closed.")
+
+################################################################################
+# Functions
+################################################################################
+
+def _check_move(index: int, dx: int, dy: int) -> None:
+    """Check that the move from the previous point is a line or a quarter circle.
+
+    Args:
+        index (int): Index of the point.
+        dx (int): Distance in x-direction to the previous point.
+        dy (int): Distance in y-direction to the previous point.
+    """
+    is_line = (dx == 0) != (dy == 0)
+    is_arc = (dx != 0) and (abs(dx) == abs(dy))
+
+    if (is_line is False) and (is_arc is False):
+        raise GridFileError(f"Invalid move to point {index}: ({dx}, {dy}) is neither a line nor a quarter circle.")
+
+def _get_coordinate(index: int, value) -> int:
+    """Get a coordinate of a point as integer. A JSON number with an integral
+        value, like 1.0, is an integer too. A boolean is no coordinate.
+
+    Args:
+        index (int): Index of the point.
+        value (obj): Coordinate
+
+    Returns:
+        int: Coordinate
+    """
+    is_valid = False
+
+    if isinstance(value, bool) is True:
+        pass
+    elif isinstance(value, int) is True:
+        is_valid = True
+    elif isinstance(value, float) is True:
+        is_valid = value.is_integer()
+
+    if is_valid is False:
+        raise GridFileError(f"Invalid point {index}: x and y must be integers.")
+
+    return int(value)
+
+def _load_json(file_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load the grid points from a JSON file. The points are parsed one by
+        one into a preallocated array and every move is checked on the fly.
+
+    Args:
+        file_name (str): Grid file name (.json)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Points with shape (N, 2) and the start-/stop-line flags with shape (N,).
+    """
+    capacity = max(os.path.getsize(file_name) // _POINT_SIZE_MIN, 1)
+    points = np.empty((capacity, 2), dtype=np.int32)
+    start_stop_lines = np.zeros(capacity, dtype=bool)
+    num_points = 0
+
+    with open(file_name, encoding="utf-8") as fd:
+        for point in _JsonTrackReader(fd).get_points():
+            try:
+                x = _get_coordinate(num_points, point["x"])
+                y = _get_coordinate(num_points, point["y"])
+            except (KeyError, TypeError) as error:
+                raise GridFileError(f"Invalid point {num_points}: x and y are required.") from error
+
+            if num_points > 0:
+                _check_move(num_points, x - int(points[num_points - 1, 0]), y - int(points[num_points - 1, 1]))
+
+            if num_points == capacity:
+                capacity *= 2
+                points = np.resize(points, (capacity, 2))
+                start_stop_lines = np.resize(start_stop_lines, capacity)
+
+            points[num_points] = (x, y)
+            start_stop_lines[num_points] = "startStopLine" in point
+            num_points += 1
+
+    return points[:num_points], start_stop_lines[:num_points]
+
+def _load_npy(file_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load the grid points from a NPY file and check all moves at once.
+
+    Args:
+        file_name (str): Grid file name (.npy)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Points with shape (N, 2) and the start-/stop-line flags with shape (N,).
+    """
+    try:
+        data = np.load(file_name, allow_pickle=False)
+    except ValueError as error:
+        raise GridFileError(f"Invalid NPY file: {error}") from error
+
+    if (data.ndim != 2) or (data.shape[1] != 3) or (np.issubdtype(data.dtype, np.integer) is False):
+        raise GridFileError(f"Invalid NPY file: integer array with shape (N, 3) expected, but got {data.dtype} {data.shape}.")
+
+    points = data[:, :2].astype(np.int32)
+    start_stop_lines = data[:, 2] != 0
+
+    deltas = np.diff(points, axis=0)
+    is_line = (deltas[:, 0] == 0) != (deltas[:, 1] == 0)
+    is_arc = (deltas[:, 0] != 0) & (np.abs(deltas[:, 0]) == np.abs(deltas[:, 1]))
+    invalid = np.flatnonzero(~(is_line | is_arc))
+
+    if len(invalid) > 0:
+        _check_move(int(invalid[0]) + 1, int(deltas[invalid[0], 0]), int(deltas[invalid[0], 1]))
+
+    return points, start_stop_lines
+
+def load_grid(file_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load the grid points of a track from a JSON or NPY file.
+        Every move between two points must be a line or a quarter circle.
+
+    Args:
+        file_name (str): Grid file name (.json or .npy)
+
+    Raises:
+        GridFileError: The file is invalid, the message contains the index of the first invalid point.
+        OSError: The file can not be read.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Points with shape (N, 2) and dtype int32
+            and the start-/stop-line flags with shape (N,).
+    """
+    if file_name.endswith(".npy") is True:
+        points, start_stop_lines = _load_npy(file_name)
+    else:
+        points, start_stop_lines = _load_json(file_name)
+
+    return points, start_stop_lines
+
+def save_grid(file_name: str, points: np.ndarray, start_stop_lines: np.ndarray) -> None:
+    """Save the grid points of a track as JSON or NPY file.
+
+    Args:
+        file_name (str): Grid file name (.json or .npy)
+        points (np.ndarray): Points with shape (N, 2).
+        start_stop_lines (np.ndarray): Start-/stop-line flags with shape (N,).
+    """
+    if file_name.endswith(".npy") is True:
+        np.save(file_name, np.column_stack((points, start_stop_lines)).astype(np.int32))
+    else:
+        track = []
+
+        for (x, y), start_stop_line in zip(np.asarray(points).tolist(), np.asarray(start_stop_lines, dtype=bool).tolist()):
+            point = {"x": x, "y": y}
+
+            if start_stop_line is True:
+                point["startStopLine"] = True
+
+            track.append(point)
+
+        with open(file_name, "w", encoding="utf-8") as fd:
+            json.dump({"track": track}, fd, indent=4)
+
+################################################################################
+# Main
+################################################################################
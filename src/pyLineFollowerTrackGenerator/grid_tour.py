@@ -0,0 +1,326 @@
+"""Procedural generation of closed line follower tracks in a grid.
+
+    A random region of blocks is grown and a random spanning tree connects its
+    blocks. Every block consists of 2 x 2 cells and the walk around the spanning
+    tree visits every cell of the region exactly once, which is a closed tour.
+    The tour is driven through the cell centers with quarter circles in the
+    corners, therefore it consists only of lines and quarter circles with a
+    radius of 1 grid point distance.
+"""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import time
+from typing import Union
+import numpy as np
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.rng import get_seed, create_rng
+from pyLineFollowerTrackGenerator.grid_file import save_grid
+
+################################################################################
+# Variables
+################################################################################
+
+# Number of grid point distances a block covers, see module description.
+_BLOCK_SIZE = 4
+
+# Length of a cell step in grid point distances, between two cell centers.
+_CELL_STEP_LENGTH = 2
+
+# A corner replaces two half cell steps by a quarter circle with radius 1.
+_CORNER_LENGTH_DIFF = 2 - np.pi / 2
+
+# The cell tour is a bit shorter than 8 grid point distances per block, because of the corners.
+_LENGTH_PER_BLOCK = 7.5
+
+# Variation of the number of blocks between the candidates.
+_NUM_BLOCKS_VARIATION = 0.2
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+# pylint: disable=line-too-long, too-many-locals
+def _grow_tree(num_blocks_x: int, num_blocks_y: int, num_blocks: int, rng: np.random.Generator) -> tuple[list[int], list[tuple[int, int]]]:
+    """Grow a random region of blocks with a random spanning tree. The occupied
+        blocks are kept as bits of an integer.
+
+    Args:
+        num_blocks_x (int): Number of blocks in x-direction.
+        num_blocks_y (int): Number of blocks in y-direction.
+        num_blocks (int): Number of blocks of the region.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        tuple[list[int], list[tuple[int, int]]]: Block indices of the region and
+            the edges of the spanning tree as pairs of block indices.
+    """
+    random_values = iter(rng.random(8 * num_blocks + 1).tolist())
+    start = int(next(random_values) * num_blocks_x * num_blocks_y)
+    occupancy = 1 << start
+    num_occupied = 1
+    frontier = []
+    blocks = [start]
+    tree = []
+    block = start
+
+    while True:
+        block_x, block_y = block % num_blocks_x, block // num_blocks_x
+
+        if block_x > 0:
+            frontier.append((block, block - 1))
+        if block_x < num_blocks_x - 1:
+            frontier.append((block, block + 1))
+        if block_y > 0:
+            frontier.append((block, block - num_blocks_x))
+        if block_y < num_blocks_y - 1:
+            frontier.append((block, block + num_blocks_x))
+
+        block = None
+
+        while (num_occupied < num_blocks) and (len(frontier) > 0) and (block is None):
+            # Take a random edge of the frontier by swapping it with the last one.
+            index = int(next(random_values, 0.0) * len(frontier))
+            frontier[index], frontier[-1] = frontier[-1], frontier[index]
+            edge = frontier.pop()
+
+            if (occupancy >> edge[1]) & 1 == 0:
+                occupancy |= 1 << edge[1]
+                num_occupied += 1
+                blocks.append(edge[1])
+                tree.append(edge)
+                block = edge[1]
+
+        if block is None:
+            break
+
+    return blocks, tree
+
+# pylint: disable=too-many-locals
+def _get_cell_tour(num_blocks_x: int, blocks: list[int], tree: list[tuple[int, int]]) -> np.ndarray:
+    """Get the closed tour around the spanning tree, which visits every cell of the region once.
+        Every block is a ring of its 4 cells. A tree edge between two blocks opens
+        both rings on the shared side and connects them.
+
+    Args:
+        num_blocks_x (int): Number of blocks in x-direction.
+        blocks (list[int]): Block indices of the region.
+        tree (list[tuple[int, int]]): Edges of the spanning tree.
+
+    Returns:
+        np.ndarray: Cells (x, y) in driving order with shape (N, 2).
+    """
+    num_cells_x = 2 * num_blocks_x
+    neighbours = {}
+
+    def connect(cell_a, cell_b):
+        neighbours.setdefault(cell_a, set()).add(cell_b)
+        neighbours.setdefault(cell_b, set()).add(cell_a)
+
+    def disconnect(cell_a, cell_b):
+        neighbours[cell_a].discard(cell_b)
+        neighbours[cell_b].discard(cell_a)
+
+    def get_cell(block, dx, dy):
+        return (2 * (block % num_blocks_x) + dx) + (2 * (block // num_blocks_x) + dy) * num_cells_x
+
+    for block in blocks:
+        connect(get_cell(block, 0, 0), get_cell(block, 1, 0))
+        connect(get_cell(block, 1, 0), get_cell(block, 1, 1))
+        connect(get_cell(block, 1, 1), get_cell(block, 0, 1))
+        connect(get_cell(block, 0, 1), get_cell(block, 0, 0))
+
+    for block_a, block_b in tree:
+        block_a, block_b = min(block_a, block_b), max(block_a, block_b)
+
+        # Neighbour in x-direction?
+        if block_b // num_blocks_x == block_a // num_blocks_x:
+            disconnect(get_cell(block_a, 1, 0), get_cell(block_a, 1, 1))
+            disconnect(get_cell(block_b, 0, 0), get_cell(block_b, 0, 1))
+            connect(get_cell(block_a, 1, 0), get_cell(block_b, 0, 0))
+            connect(get_cell(block_a, 1, 1), get_cell(block_b, 0, 1))
+        else:
+            disconnect(get_cell(block_a, 0, 1), get_cell(block_a, 1, 1))
+            disconnect(get_cell(block_b, 0, 0), get_cell(block_b, 1, 0))
+            connect(get_cell(block_a, 0, 1), get_cell(block_b, 0, 0))
+            connect(get_cell(block_a, 1, 1), get_cell(block_b, 1, 0))
+
+    # Walk along the ring.
+    start = next(iter(neighbours))
+    tour = [start]
+    previous = None
+    cell = start
+
+    while True:
+        cell_a, cell_b = neighbours[cell]
+        cell_next = cell_a if cell_a != previous else cell_b
+
+        if cell_next == start:
+            break
+
+        tour.append(cell_next)
+        previous, cell = cell, cell_next
+
+    tour = np.array(tour)
+
+    return np.stack((tour % num_cells_x, tour // num_cells_x), axis=1)
+
+def _get_tour_length(cells: np.ndarray) -> float:
+    """Get the track length of a closed cell tour in grid point distances.
+
+    Args:
+        cells (np.ndarray): Cells in driving order with shape (N, 2).
+
+    Returns:
+        float: Length
+    """
+    directions_in = cells - np.roll(cells, 1, axis=0)
+    directions_out = np.roll(cells, -1, axis=0) - cells
+    num_corners = np.count_nonzero(np.any(directions_in != directions_out, axis=1))
+
+    return len(cells) * _CELL_STEP_LENGTH - num_corners * _CORNER_LENGTH_DIFF
+
+def get_track_points(cells: np.ndarray) -> np.ndarray:
+    """Get the grid points of the track through the centers of a closed cell tour.
+        The track starts on a cell border, which is driven in positive x-direction,
+        like the grid track begins. It is closed, the last point is the first point.
+
+    Args:
+        cells (np.ndarray): Cells in driving order with shape (N, 2).
+
+    Returns:
+        np.ndarray: Grid points with shape (M, 2).
+    """
+    # Start with a step in positive x-direction, there is one in every closed tour.
+    start = int(np.flatnonzero((np.roll(cells, -1, axis=0) - cells)[:, 0] == 1)[0])
+    cells = np.roll(cells, -(start + 1), axis=0)
+
+    cells_previous = np.roll(cells, 1, axis=0)
+    cells_next = np.roll(cells, -1, axis=0)
+    is_corner = np.any((cells - cells_previous) != (cells_next - cells), axis=1)
+
+    # The cell centers are at odd grid points, the cell borders between them at even ones.
+    entries = cells_previous + cells + 1
+    exits = cells + cells_next + 1
+    start_point = entries[0]
+
+    points = np.concatenate((
+        [start_point],
+        np.stack((entries[is_corner], exits[is_corner]), axis=1).reshape(-1, 2),
+        [start_point]
+    ))
+
+    # Two corners next to each other share the border point.
+    is_new = np.concatenate(([True], np.any(points[1:] != points[:-1], axis=1)))
+
+    return points[is_new]
+
+# pylint: disable=too-many-arguments, too-many-locals
+def generate_tour(num_points_x: int, num_points_y: int, target_length: Union[None, float], num_candidates: int, rng: np.random.Generator) -> tuple[np.ndarray, float]:
+    """Generate candidates of closed tours and select the one, which is the closest to the target length.
+
+    Args:
+        num_points_x (int): Number of grid point distances in x-direction.
+        num_points_y (int): Number of grid point distances in y-direction.
+        target_length (Union[None, float]): Target length in grid point distances. If None, the whole grid is used.
+        num_candidates (int): Number of candidates.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        tuple[np.ndarray, float]: Grid points of the track with shape (M, 2) and its length in grid point distances.
+    """
+    num_blocks_x = max(num_points_x // _BLOCK_SIZE, 1)
+    num_blocks_y = max(num_points_y // _BLOCK_SIZE, 1)
+    num_blocks_max = num_blocks_x * num_blocks_y
+
+    if target_length is None:
+        num_blocks_target = num_blocks_max
+        target_length = num_blocks_max * _LENGTH_PER_BLOCK
+    else:
+        num_blocks_target = target_length / _LENGTH_PER_BLOCK
+
+    num_blocks_min = int(np.clip(np.floor(num_blocks_target * (1 - _NUM_BLOCKS_VARIATION)), 1, num_blocks_max))
+    num_blocks_range = int(np.clip(np.ceil(num_blocks_target * (1 + _NUM_BLOCKS_VARIATION)), 1, num_blocks_max)) - num_blocks_min + 1
+
+    best_cells = None
+    best_length = 0.0
+
+    for num_blocks in (num_blocks_min + rng.integers(0, num_blocks_range, size=max(num_candidates, 1))).tolist():
+        blocks, tree = _grow_tree(num_blocks_x, num_blocks_y, num_blocks, rng)
+        cells = _get_cell_tour(num_blocks_x, blocks, tree)
+        length = _get_tour_length(cells)
+
+        if (best_cells is None) or (abs(length - target_length) < abs(best_length - target_length)):
+            best_cells = cells
+            best_length = length
+
+    return get_track_points(best_cells), best_length
+
+def generate_grid(args) -> Ret:
+    """Generate a closed grid track and save it as grid file.
+
+    Args:
+        args (obj): Program arguments
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    ret_status = Ret.OK
+    seed = get_seed(args.seed)
+    rng = create_rng(seed)
+    target_length = None
+
+    if args.length is not None:
+        target_length = args.length / args.pointDistance
+
+    if (args.gridWidth < _BLOCK_SIZE) or (args.gridHeight < _BLOCK_SIZE):
+        print(f"The grid must be at least {_BLOCK_SIZE} x {_BLOCK_SIZE} points.")
+        ret_status = Ret.ERROR
+    else:
+        time_begin = time.perf_counter()
+        points, length = generate_tour(args.gridWidth, args.gridHeight, target_length, args.candidates, rng)
+        duration = time.perf_counter() - time_begin
+
+        # The start-/stop-line is drawn at the begin of the part, which ends at the flagged point.
+        start_stop_lines = np.zeros(len(points), dtype=bool)
+        start_stop_lines[1] = True
+
+        save_grid(args.gridFileName[0], points, start_stop_lines)
+
+        print(f"Track length: {length * args.pointDistance:.2f} m, {len(points)} points, seed: {seed}")
+
+        if args.debug is True:
+            print(f"{args.candidates} candidates in {duration:.3f} s.")
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,310 @@
+"""Image sinks, which receive the rendered track images. A sink writes the
+    images as PNG files, into memory, into a directory or a ZIP archive or
+    keeps the raw pixels without PNG encoding.
+"""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from typing import BinaryIO, Callable, Union
+import numpy as np
+from pyLineFollowerTrackGenerator.constants import PNG_FILTER_NONE, PNG_MODE_RGB, COLORS
+from pyLineFollowerTrackGenerator.png import PngWriter, RgbConverter
+
+# pylint: disable=line-too-long
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+class ImageWriter():
+    """Writes a single RGB image band by band of image rows into a sink.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.close()
+        except ValueError:
+            # If writing failed, the image is incomplete anyway.
+            if exc_type is None:
+                raise
+
+    def write(self, rows: np.ndarray) -> None:
+        """Write the next band of image rows.
+
+        Args:
+            rows (np.ndarray): RGB image rows with shape (rows, width, 3) and dtype uint8.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Complete the image.
+        """
+
+class _PngStreamWriter(ImageWriter):
+    """Writes the image as PNG into a binary stream, converted to the PNG mode.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, fd: BinaryIO, width: int, height: int, compression_level: int, png_filter: str, rgb_converter: RgbConverter, on_close: Union[None, Callable[[], None]]) -> None:
+        self._on_close = on_close
+        self._rgb_converter = rgb_converter
+        self._png_writer = PngWriter(fd, width, height, rgb_converter.channels, compression_level, png_filter, rgb_converter.bit_depth, rgb_converter.palette)
+
+    def write(self, rows: np.ndarray) -> None:
+        self._png_writer.write(self._rgb_converter.convert(rows))
+
+    def close(self) -> None:
+        try:
+            self._png_writer.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+class _ArrayWriter(ImageWriter):
+    """Writes the image into a RGBA array.
+    """
+
+    def __init__(self, image: np.ndarray) -> None:
+        self._image = image
+        self._num_rows = 0
+
+    def write(self, rows: np.ndarray) -> None:
+        self._image[self._num_rows:self._num_rows + rows.shape[0], :, :3] = rows
+        self._num_rows += rows.shape[0]
+
+class ImageSink():
+    """Base class of all image sinks. Every image is identified by its image
+        file name, like it is used in the world.
+    """
+
+    def __init__(self, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE, png_mode: str = PNG_MODE_RGB) -> None:
+        """Create the image sink.
+
+        Args:
+            compression_level (int, optional): zlib compression level [0..9]. Defaults to 6.
+            png_filter (str, optional): PNG scanline filter, see PNG_FILTERS. Defaults to PNG_FILTER_NONE.
+            png_mode (str, optional): PNG color mode, see PNG_MODES. Defaults to PNG_MODE_RGB.
+        """
+        self._compression_level = compression_level
+        self._png_filter = png_filter
+
+        # The palette contains all colors of the track images.
+        self._rgb_converter = RgbConverter(png_mode, list(COLORS.values()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _create_png_writer(self, fd: BinaryIO, width: int, height: int, on_close: Union[None, Callable[[], None]]) -> ImageWriter:
+        return _PngStreamWriter(fd, width, height, self._compression_level, self._png_filter, self._rgb_converter, on_close)
+
+    def open(self, image_file_name: str, width: int, height: int) -> ImageWriter:
+        """Open a image to write it band by band of image rows.
+
+        Args:
+            image_file_name (str): Image file name.
+            width (int): Image width in pixel.
+            height (int): Image height in pixel.
+
+        Returns:
+            ImageWriter: Image writer, which must be closed after all rows are written.
+        """
+        raise NotImplementedError
+
+    def write(self, image_file_name: str, image: np.ndarray) -> None:
+        """Write a whole image.
+
+        Args:
+            image_file_name (str): Image file name.
+            image (np.ndarray): RGB image with shape (height, width, 3) and dtype uint8.
+        """
+        with self.open(image_file_name, image.shape[1], image.shape[0]) as image_writer:
+            image_writer.write(image)
+
+    def close(self) -> None:
+        """Close the sink, after all images are written.
+        """
+
+class FileImageSink(ImageSink):
+    """Writes every image as PNG file with its image file name.
+    """
+
+    def open(self, image_file_name: str, width: int, height: int) -> ImageWriter:
+        fd = open(image_file_name, "wb") # pylint: disable=consider-using-with
+
+        return self._create_png_writer(fd, width, height, fd.close)
+
+class DirectoryImageSink(ImageSink):
+    """Writes every image as PNG file into a directory. Only the base name of
+        the image file name is used.
+    """
+
+    def __init__(self, directory: str, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE, png_mode: str = PNG_MODE_RGB) -> None:
+        """Create the image sink. The directory is created, if it doesn't exist.
+
+        Args:
+            directory (str): Directory of the images.
+            compression_level (int, optional): zlib compression level [0..9]. Defaults to 6.
+            png_filter (str, optional): PNG scanline filter, see PNG_FILTERS. Defaults to PNG_FILTER_NONE.
+            png_mode (str, optional): PNG color mode, see PNG_MODES. Defaults to PNG_MODE_RGB.
+        """
+        super().__init__(compression_level, png_filter, png_mode)
+        self._directory = directory
+
+        os.makedirs(directory, exist_ok=True)
+
+    def open(self, image_file_name: str, width: int, height: int) -> ImageWriter:
+        fd = open(os.path.join(self._directory, os.path.basename(image_file_name)), "wb") # pylint: disable=consider-using-with
+
+        return self._create_png_writer(fd, width, height, fd.close)
+
+class ZipImageSink(ImageSink):
+    """Writes every image as PNG into a ZIP archive. Only the base name of
+        the image file name is used. The PNG is compressed already, therefore
+        it is stored without further compression.
+
+        A ZIP archive can be written only entry by entry, but several images
+        may be written at the same time, e.g. the mip levels. Therefore every
+        image is written into a temporary file first.
+    """
+
+    def __init__(self, zip_file_name: str, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE, png_mode: str = PNG_MODE_RGB) -> None:
+        """Create the ZIP archive.
+
+        Args:
+            zip_file_name (str): ZIP archive file name.
+            compression_level (int, optional): zlib compression level [0..9]. Defaults to 6.
+            png_filter (str, optional): PNG scanline filter, see PNG_FILTERS. Defaults to PNG_FILTER_NONE.
+            png_mode (str, optional): PNG color mode, see PNG_MODES. Defaults to PNG_MODE_RGB.
+        """
+        super().__init__(compression_level, png_filter, png_mode)
+        self._zip_file = zipfile.ZipFile(zip_file_name, "w", zipfile.ZIP_STORED) # pylint: disable=consider-using-with
+
+    def _add_entry(self, entry_name: str, fd: BinaryIO) -> None:
+        fd.seek(0)
+
+        # Large images may exceed the ZIP limit of 2 GiB per entry.
+        with self._zip_file.open(entry_name, "w", force_zip64=True) as entry_fd:
+            shutil.copyfileobj(fd, entry_fd)
+
+        fd.close()
+
+    def open(self, image_file_name: str, width: int, height: int) -> ImageWriter:
+        fd = tempfile.TemporaryFile() # pylint: disable=consider-using-with
+
+        return self._create_png_writer(fd, width, height, lambda: self._add_entry(os.path.basename(image_file_name), fd))
+
+    def close(self) -> None:
+        self._zip_file.close()
+
+class MemoryImageSink(ImageSink):
+    """Writes every image as PNG into a io.BytesIO buffer.
+    """
+
+    def __init__(self, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE, png_mode: str = PNG_MODE_RGB) -> None:
+        super().__init__(compression_level, png_filter, png_mode)
+        self._buffers = {}
+
+    def open(self, image_file_name: str, width: int, height: int) -> ImageWriter:
+        fd = io.BytesIO()
+        self._buffers[image_file_name] = fd
+
+        return self._create_png_writer(fd, width, height, None)
+
+    def get_buffer(self, image_file_name: str) -> io.BytesIO:
+        """Get the PNG of an image.
+
+        Args:
+            image_file_name (str): Image file name.
+
+        Returns:
+            io.BytesIO: PNG
+        """
+        return self._buffers[image_file_name]
+
+    def get_image_file_names(self) -> list[str]:
+        """Get the file names of all written images.
+
+        Returns:
+            list[str]: Image file names
+        """
+        return list(self._buffers)
+
+class ArrayImageSink(ImageSink):
+    """Keeps every image as raw RGBA array, without PNG encoding.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._images = {}
+
+    def open(self, image_file_name: str, width: int, height: int) -> ImageWriter:
+        image = np.full((height, width, 4), 255, dtype=np.uint8)
+        self._images[image_file_name] = image
+
+        return _ArrayWriter(image)
+
+    def get_image(self, image_file_name: str) -> np.ndarray:
+        """Get the pixels of an image.
+
+        Args:
+            image_file_name (str): Image file name.
+
+        Returns:
+            np.ndarray: RGBA image with shape (height, width, 4) and dtype uint8.
+        """
+        return self._images[image_file_name]
+
+    def get_image_file_names(self) -> list[str]:
+        """Get the file names of all written images.
+
+        Returns:
+            list[str]: Image file names
+        """
+        return list(self._images)
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,257 @@
+"""Worker process, which generates Webots worlds from command lines."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import contextlib
+import io
+import os
+import sys
+import time
+import traceback
+from typing import Union
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.prg_arg_parser import PrgArgParser
+
+################################################################################
+# Variables
+################################################################################
+
+# Parser and commands of a worker process, created once by init_worker().
+_WORKER_CONTEXT = {
+    "prgArgParser": None,
+    "commands": []
+}
+
+# Arguments with a file or directory name, which are relative to the working
+# directory of the process, which submits the job.
+_PATH_ARGS = ["gridFileName"]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_job_cmd_reg_list() -> list:
+    # Only commands which generate a world can be used as job.
+    # pylint: disable=import-outside-toplevel
+    from pyLineFollowerTrackGenerator.cmd_etrack import cmd_register as cmd_etrack_register
+    from pyLineFollowerTrackGenerator.cmd_grid import cmd_register as cmd_grid_register
+    from pyLineFollowerTrackGenerator.cmd_simple import cmd_register as cmd_simple_register
+
+    return [
+        cmd_etrack_register,
+        cmd_grid_register,
+        cmd_simple_register
+    ]
+
+def init_worker() -> None:
+    """Initialize a worker process. All heavy imports and the renderer are
+        initialized once here, instead of once per job. The friction database
+        is loaded by the first job, which uses materials, and kept for all
+        further jobs.
+    """
+    # pylint: disable=import-outside-toplevel, unused-import
+    import matplotlib
+
+    # A worker has no display.
+    matplotlib.use("Agg")
+
+    # The commands import the track generation on execution.
+    import pyLineFollowerTrackGenerator.track_etrack
+    import pyLineFollowerTrackGenerator.track_grid
+    import pyLineFollowerTrackGenerator.track_simple
+    from pyLineFollowerTrackGenerator.render import init_render_context
+
+    init_render_context()
+
+    _WORKER_CONTEXT["prgArgParser"], _WORKER_CONTEXT["commands"] = _create_job_parser()
+
+def _create_job_parser() -> tuple[PrgArgParser, list]:
+    prg_arg_parser = PrgArgParser()
+    prg_arg_sub_parsers = prg_arg_parser.get_sub_parsers()
+    commands = [cmd_reg_func(prg_arg_sub_parsers) for cmd_reg_func in _get_job_cmd_reg_list()]
+
+    return prg_arg_parser, commands
+
+def get_job_world_file_names(jobs: list[list[str]]) -> list[Union[None, str]]:
+    """Get the world file names of the jobs, without running them. The
+        images and metrics of a job are named after its world.
+
+    Args:
+        jobs (list[list[str]]): Jobs with the command and its arguments.
+
+    Returns:
+        list[Union[None, str]]: World file name (.wbt) of every job or None,
+            if the job arguments are invalid. The job reports the error itself.
+    """
+    prg_arg_parser, _ = _create_job_parser()
+    world_file_names = []
+
+    for job_args in jobs:
+        world_file_name = None
+
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), \
+                 contextlib.redirect_stderr(io.StringIO()):
+                prg_arg_parser.parse_args(job_args)
+
+            world_file_name = getattr(prg_arg_parser.get_args(), "worldFileName", [None])[0]
+
+        except SystemExit:
+            pass
+
+        # The world file name gets its extension like by get_world_and_image_file_name().
+        if (world_file_name is not None) and (world_file_name.endswith(".wbt") is False):
+            world_file_name += ".wbt"
+
+        world_file_names.append(world_file_name)
+
+    return world_file_names
+
+def _get_cmd_exec_func(cmd_name: str):
+    exec_func = None
+
+    for cmd in _WORKER_CONTEXT["commands"]:
+        if cmd["name"] == cmd_name:
+            exec_func = cmd["execFunc"]
+            break
+
+    return exec_func
+
+def _move_to_output_dir(args, output_dir: str) -> None:
+    """Move the world into the output directory. The world is generated in
+        the output directory as working directory, so it references its
+        track image without path. Therefore all other paths are made absolute.
+
+    Args:
+        args (obj): Program arguments
+        output_dir (str): Output directory.
+    """
+    for name in _PATH_ARGS:
+        value = getattr(args, name, None)
+
+        if isinstance(value, list):
+            setattr(args, name, [os.path.abspath(file_name) for file_name in value])
+        elif value is not None:
+            setattr(args, name, os.path.abspath(value))
+
+    args.worldFileName = [os.path.basename(args.worldFileName[0])]
+    os.chdir(output_dir)
+
+# pylint: disable=too-many-locals, line-too-long
+def run_job(index: int, job_args: list[str], seed: int, output_dir: Union[None, str] = None) -> dict:
+    """Run a single job in a worker process by using the command specific
+        exec function.
+
+    Args:
+        index (int): Job index.
+        job_args (list[str]): Command and its arguments.
+        seed (int): Seed of the track, used if the job arguments contain no seed.
+        output_dir (Union[None, str], optional): Directory, where the world is
+            generated in. Defaults to None, which means the world file name
+            of the job arguments is used as it is.
+
+    Returns:
+        dict: Job result for the manifest. If the job raised an exception,
+            its status is ERROR and the "error" key contains the message.
+    """
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pyplot as plt
+    from pyLineFollowerTrackGenerator.util import get_world_and_image_file_name, get_metrics_file_name # pylint: disable=line-too-long
+
+    result = {
+        "index": index,
+        "args": job_args,
+        "seed": seed,
+        "status": Ret.ERROR.name
+    }
+    output = io.StringIO()
+    working_dir = os.getcwd()
+    time_begin = time.perf_counter()
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            prg_arg_parser = _WORKER_CONTEXT["prgArgParser"]
+            prg_arg_parser.parse_args(job_args)
+            args = prg_arg_parser.get_args()
+            exec_func = _get_cmd_exec_func(args.cmd)
+
+            if exec_func is None:
+                ret_status = Ret.ERROR_UNKNOWN_COMMAND
+
+            # The cache removes directories, therefore the client of a job in an
+            # output directory, e.g. of the server, can't select its directory.
+            elif (output_dir is not None) and (args.cacheDir is not None):
+                print("The cache directory can't be set by the job.")
+                ret_status = Ret.ERROR
+
+            else:
+                if output_dir is not None:
+                    _move_to_output_dir(args, output_dir)
+
+                world_file_name, image_file_name = get_world_and_image_file_name(args.worldFileName[0]) # pylint: disable=line-too-long
+                result["worldFileName"] = world_file_name
+                result["imageFileName"] = image_file_name
+                result["metricsFileName"] = get_metrics_file_name(world_file_name)
+
+                # The generated world info contains the command line parameters.
+                sys.argv = [sys.argv[0]] + job_args
+
+                # Every job gets its own seed, independent of the worker which runs it.
+                if args.seed is None:
+                    args.seed = seed
+
+                result["seed"] = args.seed
+
+                ret_status = exec_func(args)
+
+            result["status"] = Ret(ret_status).name
+
+        except SystemExit:
+            # The argument parser exits on invalid job arguments.
+            pass
+
+        except Exception as error: # pylint: disable=broad-exception-caught
+            # A failed job shall not abort the other jobs of the worker.
+            result["error"] = f"{type(error).__name__}: {error}"
+            traceback.print_exc()
+
+        finally:
+            # Release the figures, because the worker process is long living.
+            plt.close("all")
+            os.chdir(working_dir)
+
+    result["duration"] = time.perf_counter() - time_begin
+    result["output"] = output.getvalue()
+
+    return result
+
+################################################################################
+# Main
+################################################################################
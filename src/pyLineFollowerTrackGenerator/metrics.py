@@ -0,0 +1,163 @@
+"""Geometry metrics of a line follower track, e.g. for filtering generated tracks."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import json
+from typing import Any, Union
+import numpy as np
+from scipy.interpolate import splev
+from pyLineFollowerTrackGenerator.arc_length import ArcLengthTable
+
+################################################################################
+# Variables
+################################################################################
+
+# Distance between two samples of a spline, where the curvature is determined.
+_SAMPLING_STEP = 0.001 # [m]
+
+# Max. curvature of a straight part of the track.
+_STRAIGHT_CURVATURE_MAX = 1.0 # [1/m]
+
+# Bin edges of the curvature histogram. The last bin contains all greater curvatures too.
+_CURVATURE_BIN_EDGES = [0, 0.5, 1, 2, 4, 8, 16, 32, 64] # [1/m]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _count_runs(is_set: np.ndarray, is_closed: bool) -> int:
+    """Count the runs of consecutive set elements.
+
+    Args:
+        is_set (np.ndarray): Flags
+        is_closed (bool): If the track is closed, a run may wrap around its end.
+
+    Returns:
+        int: Number of runs
+    """
+    if is_closed is True:
+        previous = np.roll(is_set, 1)
+    else:
+        previous = np.concatenate(([False], is_set[:-1]))
+
+    num_runs = int(np.count_nonzero(is_set & ~previous))
+
+    # A closed track which is completely set has no begin of a run.
+    if (num_runs == 0) and (np.all(is_set)) and (len(is_set) > 0):
+        num_runs = 1
+
+    return num_runs
+
+# pylint: disable=line-too-long
+def get_metrics(lengths: np.ndarray, curvatures: np.ndarray, start_stop_line_positions: list[float], is_closed: bool = True) -> dict:
+    """Get the metrics of a track, which is given by consecutive parts with
+        their length and curvature.
+
+    Args:
+        lengths (np.ndarray): Length of every part in m.
+        curvatures (np.ndarray): Curvature of every part in 1/m.
+        start_stop_line_positions (list[float]): Positions of the start-/stop-lines along the track in m.
+        is_closed (bool, optional): Is the track closed? Defaults to True.
+
+    Returns:
+        dict: Metrics
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    curvatures = np.abs(np.asarray(curvatures, dtype=float))
+
+    is_straight = curvatures <= _STRAIGHT_CURVATURE_MAX
+    curvature_max = float(curvatures.max()) if len(curvatures) > 0 else 0.0
+
+    # The histogram contains the track length per curvature bin.
+    histogram, _ = np.histogram(np.minimum(curvatures, _CURVATURE_BIN_EDGES[-1]), bins=_CURVATURE_BIN_EDGES, weights=lengths)
+
+    return {
+        "length": float(lengths.sum()),
+        "minTurnRadius": 1.0 / curvature_max if curvature_max > 0 else None,
+        "numStraights": _count_runs(is_straight, is_closed),
+        "numCurves": _count_runs(~is_straight, is_closed),
+        "straightLength": float(lengths[is_straight].sum()),
+        "curveLength": float(lengths[~is_straight].sum()),
+        "startStopLinePositions": [float(position) for position in start_stop_line_positions],
+        "curvatureHistogram": {
+            "binEdges": _CURVATURE_BIN_EDGES,
+            "lengths": histogram.tolist()
+        }
+    }
+
+# pylint: disable=too-many-locals
+def get_spline_metrics(tck: Any, pixel_per_m: float, start_stop_line_locations: list[float], arc_length_table: Union[None, ArcLengthTable] = None) -> dict: # pylint: disable=line-too-long
+    """Get the metrics of a closed track spline. The spline is sampled in
+        equal distances along the track and the curvature is determined by
+        the first and second derivative at every sample.
+
+    Args:
+        tck (tuple[t,c,k]): Vector of knots, the B-spline coefficients, and the degree of the spline in pixels.
+        pixel_per_m (float): Conversion factor pixel per m.
+        start_stop_line_locations (list[float]): Locations of the start-/stop-lines as fraction of the track length [0..1].
+        arc_length_table (Union[None, ArcLengthTable], optional): Arc-length table of the spline.
+            Defaults to None, which means it is created.
+
+    Returns:
+        dict: Metrics
+    """
+    if arc_length_table is None:
+        arc_length_table = ArcLengthTable(tck)
+    u = arc_length_table.get_u_by_step(_SAMPLING_STEP * pixel_per_m)
+
+    # Every sample represents the part of the track up to the next sample.
+    u_middle = (u[:-1] + u[1:]) / 2
+
+    x, y = splev(u, tck, der=0)
+    dx, dy = splev(u_middle, tck, der=1)
+    ddx, ddy = splev(u_middle, tck, der=2)
+
+    lengths = np.hypot(np.diff(x), np.diff(y)) / pixel_per_m
+    speed = np.hypot(dx, dy)
+    curvatures = np.divide(np.abs(dx * ddy - dy * ddx), speed ** 3, out=np.zeros_like(speed), where=speed > 0) * pixel_per_m
+
+    track_length = arc_length_table.get_length() / pixel_per_m
+    start_stop_line_positions = [location * track_length for location in start_stop_line_locations]
+
+    return get_metrics(lengths, curvatures, start_stop_line_positions, is_closed=True)
+
+def save_metrics(metrics: dict, file_name: str) -> None:
+    """Save the metrics to a JSON file.
+
+    Args:
+        metrics (dict): Metrics
+        file_name (str): File name (.json)
+    """
+    with open(file_name, "w", encoding="utf-8") as fd:
+        json.dump(metrics, fd, indent=4)
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,174 @@
+"""Mip pyramid of the track image, which provides the image in several
+    resolutions (1/2, 1/4, ...) by area filtering a single rendered image.
+"""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import numpy as np
+from pyLineFollowerTrackGenerator.image_sink import ImageSink
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+class MipPyramidWriter():
+    """Writes the mip levels 1..N of an image as separate images into a sink.
+        The image is given band by band of image rows, e.g. by the tiled renderer.
+        Every level keeps at most one row, which waits for its neighbour.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, image_sink: ImageSink, image_file_name: str, width: int, height: int, num_levels: int) -> None: # pylint: disable=line-too-long
+        """Open the images of all mip levels.
+
+        Args:
+            image_sink (ImageSink): Image sink of the mip levels.
+            image_file_name (str): The image file name of level 0.
+            width (int): Image width of level 0 in pixel.
+            height (int): Image height of level 0 in pixel.
+            num_levels (int): Number of mip levels, see get_max_mip_level().
+        """
+        if num_levels > get_max_mip_level(width, height):
+            raise ValueError(f"A {width} x {height} image has no mip level {num_levels}.")
+
+        self._image_writers = []
+        self._pending_rows = []
+
+        for level in range(1, num_levels + 1):
+            self._image_writers.append(image_sink.open(get_mip_file_name(image_file_name, level), width >> level, height >> level)) # pylint: disable=line-too-long
+            self._pending_rows.append(None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write(self, rows: np.ndarray) -> None:
+        """Write the next band of image rows of level 0.
+
+        Args:
+            rows (np.ndarray): RGB image rows with shape (rows, width, 3).
+        """
+        for index, image_writer in enumerate(self._image_writers):
+            if self._pending_rows[index] is not None:
+                rows = np.concatenate((self._pending_rows[index], rows))
+
+            num_rows = rows.shape[0] & ~1
+            self._pending_rows[index] = rows[num_rows:] if num_rows < rows.shape[0] else None
+
+            if num_rows == 0:
+                break
+
+            rows = downsample(rows[:num_rows])
+            image_writer.write(rows)
+
+    def close(self) -> None:
+        """Close the images of all mip levels.
+        """
+        for image_writer in self._image_writers:
+            image_writer.close()
+
+        self._image_writers = []
+
+################################################################################
+# Functions
+################################################################################
+
+def get_max_mip_level(width: int, height: int) -> int:
+    """Get the max. mip level of an image. Every level has the half width and
+        height of the previous one, therefore both must be divisible by 2.
+
+    Args:
+        width (int): Image width in pixel.
+        height (int): Image height in pixel.
+
+    Returns:
+        int: Max. mip level
+    """
+    level = 0
+
+    while (width > 1) and (height > 1) and (width % 2 == 0) and (height % 2 == 0):
+        width //= 2
+        height //= 2
+        level += 1
+
+    return level
+
+def get_mip_file_name(image_file_name: str, level: int) -> str:
+    """Get the file name of a mip level, e.g. "simple.mip2.png" for level 2
+        of "simple.png". Level 0 is the image itself.
+
+    Args:
+        image_file_name (str): The image file name (.png).
+        level (int): Mip level.
+
+    Returns:
+        str: Image file name of the mip level.
+    """
+    mip_file_name = image_file_name
+
+    if level > 0:
+        mip_file_name = image_file_name[:-len(".png")] + f".mip{level}.png"
+
+    return mip_file_name
+
+def downsample(image: np.ndarray) -> np.ndarray:
+    """Downsample an image to the half width and height, by averaging 2 x 2
+        pixels (box filter).
+
+    Args:
+        image (np.ndarray): Image with shape (height, width, channels) and dtype uint8,
+            width and height must be even.
+
+    Returns:
+        np.ndarray: Image with shape (height / 2, width / 2, channels) and dtype uint8.
+    """
+    height, width, channels = image.shape
+    blocks = image.reshape(height // 2, 2, width // 2, 2, channels).astype(np.uint16)
+
+    # Add 2 to round to the nearest value.
+    return ((blocks.sum(axis=(1, 3)) + 2) >> 2).astype(np.uint8)
+
+def save_mip_pyramid(image_sink: ImageSink, image_file_name: str, image: np.ndarray, num_levels: int) -> None: # pylint: disable=line-too-long
+    """Write the mip levels 1..N of an image as separate images into a sink.
+
+    Args:
+        image_sink (ImageSink): Image sink of the mip levels.
+        image_file_name (str): The image file name of level 0.
+        image (np.ndarray): RGB image of level 0 with shape (height, width, 3).
+        num_levels (int): Number of mip levels, see get_max_mip_level().
+    """
+    with MipPyramidWriter(image_sink, image_file_name, image.shape[1], image.shape[0], num_levels) as mip_pyramid_writer: # pylint: disable=line-too-long
+        mip_pyramid_writer.write(image)
+
+################################################################################
+# Main
+################################################################################
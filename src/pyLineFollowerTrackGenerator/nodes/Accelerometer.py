@@ -4,20 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f, SFBool, SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Accelerometer(Node): # pylint: disable=too-few-public-methods
     """Webots Accelerometer VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Accelerometer")
-        self.add_fields([
-            SFString("name", "accelerometer"),
-            MFVec3f("lookupTable", []),
-            SFBool("xAxis", True),
-            SFBool("yAxis", True),
-            SFBool("zAxis", True),
-            SFFloat("resolution", -1)
-        ])
+        super().__init__("Accelerometer", NODE_SCHEMA["Accelerometer"])
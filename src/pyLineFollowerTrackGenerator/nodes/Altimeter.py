@@ -4,17 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Altimeter(Node): # pylint: disable=too-few-public-methods
     """Webots Altimeter VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Altimeter")
-        self.add_fields([
-            SFString("name", "altimeter"),
-            SFFloat("accuracy", 0),
-            SFFloat("resolution", -1)
-        ])
+        super().__init__("Altimeter", NODE_SCHEMA["Altimeter"])
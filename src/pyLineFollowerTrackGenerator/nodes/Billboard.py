@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFNode
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Billboard(Node): # pylint: disable=too-few-public-methods
     """Webots Billboard VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Billboard")
-        self.add_fields([
-            MFNode("children", [])
-        ])
+        super().__init__("Billboard", NODE_SCHEMA["Billboard"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFVec3f
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Box(Node): # pylint: disable=too-few-public-methods
     """Webots Box VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Box")
-        self.add_fields([
-            SFVec3f("size", [ 2, 2, 2 ])
-        ])
+        super().__init__("Box", NODE_SCHEMA["Box"])
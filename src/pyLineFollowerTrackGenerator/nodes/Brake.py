@@ -4,9 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Brake(Node): # pylint: disable=too-few-public-methods
     """Webots Brake VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Brake")
+        super().__init__("Brake", NODE_SCHEMA["Brake"])
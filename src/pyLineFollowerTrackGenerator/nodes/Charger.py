@@ -4,18 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFBool, SFColor, MFFloat, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Charger(Node): # pylint: disable=too-few-public-methods
     """Webots Charger VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Charger")
-        self.add_fields([
-            MFFloat("battery", []),
-            SFFloat("radius", 0.04),
-            SFColor("emissiveColor", [ 0, 1, 0 ]),
-            SFBool("gradual", True)
-        ])
+        super().__init__("Charger", NODE_SCHEMA["Charger"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFColor
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Color(Node): # pylint: disable=too-few-public-methods
     """Webots Color VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Color")
-        self.add_fields([
-            MFColor("color", [])
-        ])
+        super().__init__("Color", NODE_SCHEMA["Color"])
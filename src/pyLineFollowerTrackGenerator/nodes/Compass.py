@@ -4,19 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Compass(Node): # pylint: disable=too-few-public-methods
     """Webots Compass VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Compass")
-        self.add_fields([
-            MFVec3f("lookupTable", []),
-            SFBool("xAxis", True),
-            SFBool("yAxis", True),
-            SFBool("zAxis", True),
-            SFFloat("resolution", -1)
-        ])
+        super().__init__("Compass", NODE_SCHEMA["Compass"])
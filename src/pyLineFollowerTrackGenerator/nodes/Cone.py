@@ -4,19 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFInt32, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Cone(Node): # pylint: disable=too-few-public-methods
     """Webots Cone VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Cone")
-        self.add_fields([
-            SFFloat("bottomRadius", 1),
-            SFFloat("height", 2),
-            SFBool("side", True),
-            SFBool("bottom", True),
-            SFInt32("subdivision", 12)
-        ])
+        super().__init__("Cone", NODE_SCHEMA["Cone"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Coordinate(Node): # pylint: disable=too-few-public-methods
     """Webots Coordinate VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Coordinate")
-        self.add_fields([
-            MFVec3f("point", [])
-        ])
+        super().__init__("Coordinate", NODE_SCHEMA["Coordinate"])
@@ -4,20 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFInt32, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Cylinder(Node): # pylint: disable=too-few-public-methods
     """Webots Cylinder VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Cylinder")
-        self.add_fields([
-            SFBool("bottom", True),
-            SFFloat("height", 2),
-            SFFloat("radius", 1),
-            SFBool("side", True),
-            SFBool("top", True),
-            SFInt32("subdivision", 12)
-        ])
+        super().__init__("Cylinder", NODE_SCHEMA["Cylinder"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Damping(Node): # pylint: disable=too-few-public-methods
     """Webots Damping VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Damping")
-        self.add_fields([
-            SFFloat("linear", 0.2),
-            SFFloat("angular", 0.2)
-        ])
+        super().__init__("Damping", NODE_SCHEMA["Damping"])
@@ -4,9 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Device(Node): # pylint: disable=too-few-public-methods
     """Webots Device VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Device")
+        super().__init__("Device", NODE_SCHEMA["Device"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFInt32
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Display(Node): # pylint: disable=too-few-public-methods
     """Webots Display VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Display")
-        self.add_fields([
-            SFInt32("width", 64),
-            SFInt32("height", 64)
-        ])
+        super().__init__("Display", NODE_SCHEMA["Display"])
@@ -4,21 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f, SFInt32, SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class DistanceSensor(Node): # pylint: disable=too-few-public-methods
     """Webots DistanceSensor VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("DistanceSensor")
-        self.add_fields([
-            MFVec3f("lookupTable", [[0, 0, 0], [0.1, 1000, 0]]),
-            SFString("type", "generic"),
-            SFInt32("numberOfRays", 1),
-            SFFloat("aperture", 1.5708),
-            SFFloat("gaussianWidth", 1),
-            SFFloat("resolution", -1),
-            SFFloat("redColorSensitivity", 1)
-        ])
+        super().__init__("DistanceSensor", NODE_SCHEMA["DistanceSensor"])
@@ -4,20 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFInt32, MFFloat, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class ElevationGrid(Node): # pylint: disable=too-few-public-methods
     """Webots ElevationGrid VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("ElevationGrid")
-        self.add_fields([
-            MFFloat("height", []),
-            SFInt32("xDimension", 0),
-            SFFloat("xSpacing", 1),
-            SFInt32("yDimension", 0),
-            SFFloat("ySpacing", 1),
-            SFFloat("thickness", 1)
-        ])
+        super().__init__("ElevationGrid", NODE_SCHEMA["ElevationGrid"])
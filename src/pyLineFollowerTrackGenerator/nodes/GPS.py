@@ -4,20 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class GPS(Node): # pylint: disable=too-few-public-methods
     """Webots GPS VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("GPS")
-        self.add_fields([
-            SFString("type", "satellite"),
-            SFFloat("accuracy", 0),
-            SFFloat("noiseCorrelation", 0),
-            SFFloat("resolution", -1),
-            SFFloat("speedNoise", 0),
-            SFFloat("speedResolution", -1)
-        ])
+        super().__init__("GPS", NODE_SCHEMA["GPS"])
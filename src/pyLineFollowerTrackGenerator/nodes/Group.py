@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFNode
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Group(Node): # pylint: disable=too-few-public-methods
     """Webots Group VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Group")
-        self.add_fields([
-            MFNode("children", [])
-        ])
+        super().__init__("Group", NODE_SCHEMA["Group"])
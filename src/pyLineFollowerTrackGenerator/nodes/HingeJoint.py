@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFNode, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class HingeJoint(Node): # pylint: disable=too-few-public-methods
     """Webots HingeJoint VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("HingeJoint")
-        self.add_fields([
-            MFNode("device", []),
-            SFFloat("position", 0)
-        ])
+        super().__init__("HingeJoint", NODE_SCHEMA["HingeJoint"])
@@ -4,18 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFInt32, SFBool, MFString
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class ImageTexture(Node): # pylint: disable=too-few-public-methods
     """Webots ImageTexture VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("ImageTexture")
-        self.add_fields([
-            MFString("url", []),
-            SFBool("repeatS", True),
-            SFBool("repeatT", True),
-            SFInt32("filtering", 4)
-        ])
+        super().__init__("ImageTexture", NODE_SCHEMA["ImageTexture"])
@@ -4,25 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFInt32, SFNode, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class IndexedFaceSet(Node): # pylint: disable=too-few-public-methods
     """Webots IndexedFaceSet VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("IndexedFaceSet")
-        self.add_fields([
-            SFNode("coord", None),
-            SFNode("normal", None),
-            SFNode("texCoord", None),
-            SFBool("solid", True),
-            SFBool("ccw", True),
-            SFBool("convex", True),
-            SFBool("normalPerVertex", True),
-            MFInt32("coordIndex", []),
-            MFInt32("normalIndex", []),
-            MFInt32("texCoordIndex", []),
-            SFFloat("creaseAngle", 0)
-        ])
+        super().__init__("IndexedFaceSet", NODE_SCHEMA["IndexedFaceSet"])
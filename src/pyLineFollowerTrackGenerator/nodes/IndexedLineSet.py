@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFInt32, SFNode
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class IndexedLineSet(Node): # pylint: disable=too-few-public-methods
     """Webots IndexedLineSet VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("IndexedLineSet")
-        self.add_fields([
-            SFNode("coord", None),
-            MFInt32("coordIndex", [])
-        ])
+        super().__init__("IndexedLineSet", NODE_SCHEMA["IndexedLineSet"])
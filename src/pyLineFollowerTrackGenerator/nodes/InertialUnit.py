@@ -4,19 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class InertialUnit(Node): # pylint: disable=too-few-public-methods
     """Webots InertialUnit VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("InertialUnit")
-        self.add_fields([
-            SFBool("xAxis", True),
-            SFBool("zAxis", True),
-            SFBool("yAxis", True),
-            SFFloat("resolution", -1),
-            SFFloat("noise", 0)
-        ])
+        super().__init__("InertialUnit", NODE_SCHEMA["InertialUnit"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFNode
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Joint(Node): # pylint: disable=too-few-public-methods
     """Webots Joint VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Joint")
-        self.add_fields([
-            SFNode("jointParameters", None),
-            SFNode("endPoint", None)
-        ])
+        super().__init__("Joint", NODE_SCHEMA["Joint"])
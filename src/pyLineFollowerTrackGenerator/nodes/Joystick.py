@@ -4,9 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Joystick(Node): # pylint: disable=too-few-public-methods
     """Webots Joystick VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Joystick")
+        super().__init__("Joystick", NODE_SCHEMA["Joystick"])
@@ -4,9 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Keyboard(Node): # pylint: disable=too-few-public-methods
     """Webots Keyboard VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Keyboard")
+        super().__init__("Keyboard", NODE_SCHEMA["Keyboard"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFBool, MFColor
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class LED(Node): # pylint: disable=too-few-public-methods
     """Webots LED VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("LED")
-        self.add_fields([
-            MFColor("color", [1, 0, 0]),
-            SFBool("gradual", False)
-        ])
+        super().__init__("LED", NODE_SCHEMA["LED"])
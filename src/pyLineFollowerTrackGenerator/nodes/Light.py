@@ -4,19 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFColor, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Light(Node): # pylint: disable=too-few-public-methods
     """Webots Light VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Light")
-        self.add_fields([
-            SFFloat("ambientIntensity", 0),
-            SFColor("color", [ 1, 1, 1 ]),
-            SFFloat("intensity", 1),
-            SFBool("on", True),
-            SFBool("castShadows", False)
-        ])
+        super().__init__("Light", NODE_SCHEMA["Light"])
@@ -4,17 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class LinearMotor(Node): # pylint: disable=too-few-public-methods
     """Webots LinearMotor VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("LinearMotor")
-        self.add_fields([
-            SFString("name", [ "linear, motor" ]),
-            SFFloat("maxForce", 10),
-            SFString("sound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/linear_motor.wav") # pylint: disable=line-too-long
-        ])
+        super().__init__("LinearMotor", NODE_SCHEMA["LinearMotor"])
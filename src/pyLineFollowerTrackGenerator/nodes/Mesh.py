@@ -4,18 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFString, SFInt32, SFBool, MFString
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Mesh(Node): # pylint: disable=too-few-public-methods
     """Webots Mesh VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Mesh")
-        self.add_fields([
-            MFString("url", []),
-            SFBool("ccw", True),
-            SFString("name", ""),
-            SFInt32("materialIndex", -1)
-        ])
+        super().__init__("Mesh", NODE_SCHEMA["Mesh"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Normal(Node): # pylint: disable=too-few-public-methods
     """Webots Normal VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Normal")
-        self.add_fields([
-            MFVec3f("vector", [])
-        ])
+        super().__init__("Normal", NODE_SCHEMA["Normal"])
@@ -4,19 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFColor, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Pen(Node): # pylint: disable=too-few-public-methods
     """Webots Pen VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Pen")
-        self.add_fields([
-            SFColor("inkColor", [ 0, 0, 0 ]),
-            SFFloat("inkDensity", 0.5),
-            SFFloat("leadSize", 0.002),
-            SFFloat("maxDistance", 0.0),
-            SFBool("write", True)
-        ])
+        super().__init__("Pen", NODE_SCHEMA["Pen"])
@@ -4,19 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f, SFNode, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Physics(Node): # pylint: disable=too-few-public-methods
     """Webots Physics VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Physics")
-        self.add_fields([
-            SFFloat("density", 1000),
-            SFFloat("mass", -1),
-            MFVec3f("centerOfMass", []),
-            MFVec3f("inertiaMatrix", []),
-            SFNode("damping", None)
-        ])
+        super().__init__("Physics", NODE_SCHEMA["Physics"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFVec2f
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Plane(Node): # pylint: disable=too-few-public-methods
     """Webots Plane VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Plane")
-        self.add_fields([
-            SFVec2f("size", [ 1, 1 ])
-        ])
+        super().__init__("Plane", NODE_SCHEMA["Plane"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFNode
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class PointSet(Node): # pylint: disable=too-few-public-methods
     """Webots PointSet VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("PointSet")
-        self.add_fields([
-            SFNode("color", None),
-            SFNode("coord", None)
-        ])
+        super().__init__("PointSet", NODE_SCHEMA["PointSet"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class PositionSensor(Node): # pylint: disable=too-few-public-methods
     """Webots PositionSensor VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("PositionSensor")
-        self.add_fields([
-            SFFloat("noise", 0),
-            SFFloat("resolution", -1)
-        ])
+        super().__init__("PositionSensor", NODE_SCHEMA["PositionSensor"])
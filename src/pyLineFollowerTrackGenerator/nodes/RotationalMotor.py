@@ -4,17 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class RotationalMotor(Node): # pylint: disable=too-few-public-methods
     """Webots RotationalMotor VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("RotationalMotor")
-        self.add_fields([
-            SFString("name", [ "rotational, motor" ]),
-            SFFloat("maxTorque", 10),
-            SFString("sound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/rotational_motor.wav") # pylint: disable=line-too-long
-        ])
+        super().__init__("RotationalMotor", NODE_SCHEMA["RotationalMotor"])
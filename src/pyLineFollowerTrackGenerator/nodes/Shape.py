@@ -4,18 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFNode, SFBool
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Shape(Node): # pylint: disable=too-few-public-methods
     """Webots Shape VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Shape")
-        self.add_fields([
-            SFNode("appearance", None),
-            SFNode("geometry", None),
-            SFBool("castShadows", True),
-            SFBool("isPickable", True)
-        ])
+        super().__init__("Shape", NODE_SCHEMA["Shape"])
@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFNode, SFString
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Slot(Node): # pylint: disable=too-few-public-methods
     """Webots Slot VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Slot")
-        self.add_fields([
-            SFString("type", ""),
-            SFNode("endPoint", None)
-        ])
+        super().__init__("Slot", NODE_SCHEMA["Slot"])
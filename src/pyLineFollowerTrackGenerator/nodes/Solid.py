@@ -4,26 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFColor, SFString, MFNode, SFVec3f, SFFloat, SFNode, SFBool
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Solid(Node): # pylint: disable=too-few-public-methods
     """Webots Solid VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Solid")
-        self.add_fields([
-            SFString("name", "solid"),
-            SFString("model", ""),
-            SFString("description", ""),
-            SFString("contactMaterial", "default"),
-            MFNode("immersionProperties", []),
-            SFNode("boundingObject", None),
-            SFNode("physics", None),
-            SFBool("locked", False),
-            SFFloat("radarCrossSection", 0.0),
-            MFColor("recognitionColors", []),
-            SFVec3f("linearVelocity", [ 0, 0, 0 ]),
-            SFVec3f("angularVelocity", [ 0, 0, 0 ])
-        ])
+        super().__init__("Solid", NODE_SCHEMA["Solid"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFString
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class SolidReference(Node): # pylint: disable=too-few-public-methods
     """Webots SolidReference VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("SolidReference")
-        self.add_fields([
-            SFString("solidName", "")
-        ])
+        super().__init__("SolidReference", NODE_SCHEMA["SolidReference"])
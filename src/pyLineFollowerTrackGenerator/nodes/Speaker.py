@@ -4,9 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Speaker(Node): # pylint: disable=too-few-public-methods
     """Webots Speaker VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Speaker")
+        super().__init__("Speaker", NODE_SCHEMA["Speaker"])
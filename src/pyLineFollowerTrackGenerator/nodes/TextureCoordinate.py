@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec2f
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class TextureCoordinate(Node): # pylint: disable=too-few-public-methods
     """Webots TextureCoordinate VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("TextureCoordinate")
-        self.add_fields([
-            MFVec2f("point", [])
-        ])
+        super().__init__("TextureCoordinate", NODE_SCHEMA["TextureCoordinate"])
@@ -4,17 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    MFVec3f, SFString, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class TouchSensor(Node): # pylint: disable=too-few-public-methods
     """Webots TouchSensor VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("TouchSensor")
-        self.add_fields([
-            SFString("type", "bumper"),
-            MFVec3f("lookupTable", [[0, 0, 0], [5000, 50000, 0]]),
-            SFFloat("resolution", -1)
-        ])
+        super().__init__("TouchSensor", NODE_SCHEMA["TouchSensor"])
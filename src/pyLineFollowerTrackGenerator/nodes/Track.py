@@ -4,18 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFVec2f, SFInt32, SFNode, MFNode
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Track(Node): # pylint: disable=too-few-public-methods
     """Webots Track VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Track")
-        self.add_fields([
-            MFNode("device", []),
-            SFVec2f("textureAnimation", [ 0, 0 ]),
-            SFNode("animatedGeometry", None),
-            SFInt32("geometriesCount", 10)
-        ])
+        super().__init__("Track", NODE_SCHEMA["Track"])
@@ -4,17 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFVec2f, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class TrackWheel(Node): # pylint: disable=too-few-public-methods
     """Webots TrackWheel VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("TrackWheel")
-        self.add_fields([
-            SFVec2f("position", [ 0, 0 ]),
-            SFFloat("radius", 0.1),
-            SFBool("inner", True)
-        ])
+        super().__init__("TrackWheel", NODE_SCHEMA["TrackWheel"])
@@ -4,15 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFVec3f
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Transform(Node): # pylint: disable=too-few-public-methods
     """Webots Transform VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Transform")
-        self.add_fields([
-            SFVec3f("scale", [ 1, 1, 1 ])
-        ])
+        super().__init__("Transform", NODE_SCHEMA["Transform"])
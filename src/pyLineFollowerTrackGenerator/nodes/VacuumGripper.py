@@ -4,18 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFInt32, SFBool, SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class VacuumGripper(Node): # pylint: disable=too-few-public-methods
     """Webots VacuumGripper VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("VacuumGripper")
-        self.add_fields([
-            SFBool("isOn", False),
-            SFFloat("tensileStrength", -1),
-            SFFloat("shearStrength", -1),
-            SFInt32("contactPoints", 3)
-        ])
+        super().__init__("VacuumGripper", NODE_SCHEMA["VacuumGripper"])
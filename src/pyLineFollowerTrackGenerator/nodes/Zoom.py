@@ -4,16 +4,10 @@
 # pylint: disable=invalid-name
 
 from pyLineFollowerTrackGenerator.base.node import Node
-from pyLineFollowerTrackGenerator.base.fields import (
-    SFFloat
-)
+from pyLineFollowerTrackGenerator.nodes.schema import NODE_SCHEMA
 
 class Zoom(Node): # pylint: disable=too-few-public-methods
     """Webots Zoom VRML node.
     """
     def __init__(self) -> None:
-        super().__init__("Zoom")
-        self.add_fields([
-            SFFloat("maxFieldOfView", 1.5),
-            SFFloat("minFieldOfView", 0.5)
-        ])
+        super().__init__("Zoom", NODE_SCHEMA["Zoom"])
@@ -21,3 +21,47 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import importlib
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def get(node_name: str) -> type:
+    """Get a Webots VRML node class by its name, e.g. get("Camera").
+        The node module is imported on first use.
+
+    Args:
+        node_name (str): Name of the Webots VRML node.
+
+    Raises:
+        KeyError: If there is no node with the given name.
+
+    Returns:
+        type: Node class
+    """
+    if (node_name.isidentifier() is False) or (node_name[0].isupper() is False):
+        raise KeyError(node_name)
+
+    try:
+        module = importlib.import_module(f"{__name__}.{node_name}")
+    except ModuleNotFoundError as error:
+        raise KeyError(node_name) from error
+
+    return getattr(module, node_name)
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,672 @@
+"""Webots VRML node field schema
+    This code is automatically generated. Don't modify it manually.
+"""
+# pylint: disable=line-too-long, too-many-lines
+
+from pyLineFollowerTrackGenerator.base.fields import (
+    MFColor, MFFloat, MFInt32, MFNode, MFString, MFVec2f, MFVec3f, SFBool, SFColor, SFDouble, SFFloat, SFInt32, SFNode, SFRotation, SFString, SFVec2f, SFVec3f
+)
+
+# Field type, field name and default value of every node field.
+NODE_SCHEMA = {
+    "Accelerometer": (
+        (SFString, "name", "accelerometer"),
+        (MFVec3f, "lookupTable", []),
+        (SFBool, "xAxis", True),
+        (SFBool, "yAxis", True),
+        (SFBool, "zAxis", True),
+        (SFFloat, "resolution", -1),
+    ),
+    "Altimeter": (
+        (SFString, "name", "altimeter"),
+        (SFFloat, "accuracy", 0),
+        (SFFloat, "resolution", -1),
+    ),
+    "Appearance": (
+        (SFNode, "material", None),
+        (SFNode, "texture", None),
+        (SFNode, "textureTransform", None),
+        (SFString, "name", "appearance"),
+    ),
+    "Background": (
+        (MFColor, "skyColor", [0, 0, 0]),
+        (MFString, "backUrl", []),
+        (MFString, "bottomUrl", []),
+        (MFString, "frontUrl", []),
+        (MFString, "leftUrl", []),
+        (MFString, "rightUrl", []),
+        (MFString, "topUrl", []),
+        (MFString, "backIrradianceUrl", []),
+        (MFString, "bottomIrradianceUrl", []),
+        (MFString, "frontIrradianceUrl", []),
+        (MFString, "leftIrradianceUrl", []),
+        (MFString, "rightIrradianceUrl", []),
+        (MFString, "topIrradianceUrl", []),
+        (SFFloat, "luminosity", 1),
+    ),
+    "BallJoint": (
+        (SFNode, "jointParameters", None),
+        (SFNode, "jointParameters2", None),
+        (SFNode, "jointParameters3", None),
+        (MFNode, "device3", []),
+        (SFFloat, "position3", 0),
+    ),
+    "BallJointParameters": (
+        (SFVec3f, "anchor", [ 0, 0, 0 ]),
+    ),
+    "Billboard": (
+        (MFNode, "children", []),
+    ),
+    "Box": (
+        (SFVec3f, "size", [ 2, 2, 2 ]),
+    ),
+    "Brake": (),
+    "CadShape": (
+        (MFString, "url", []),
+        (SFBool, "ccw", True),
+        (SFBool, "castShadows", True),
+        (SFBool, "isPickable", True),
+    ),
+    "Camera": (
+        (SFFloat, "fieldOfView", 0.7854),
+        (SFInt32, "width", 64),
+        (SFInt32, "height", 64),
+        (SFString, "projection", "planar"),
+        (SFFloat, "near", 0.01),
+        (SFFloat, "far", 0.0),
+        (SFFloat, "exposure", 1.0),
+        (SFBool, "antiAliasing", False),
+        (SFFloat, "ambientOcclusionRadius", 0),
+        (SFFloat, "bloomThreshold", -1.0),
+        (SFFloat, "motionBlur", 0.0),
+        (SFFloat, "noise", 0.0),
+        (SFString, "noiseMaskUrl", ""),
+        (SFNode, "lens", None),
+        (SFNode, "focus", None),
+        (SFNode, "zoom", None),
+        (SFNode, "recognition", None),
+        (SFNode, "lensFlare", None),
+    ),
+    "Capsule": (
+        (SFBool, "bottom", True),
+        (SFFloat, "height", 2),
+        (SFFloat, "radius", 1),
+        (SFBool, "side", True),
+        (SFBool, "top", True),
+        (SFInt32, "subdivision", 12),
+    ),
+    "Charger": (
+        (MFFloat, "battery", []),
+        (SFFloat, "radius", 0.04),
+        (SFColor, "emissiveColor", [ 0, 1, 0 ]),
+        (SFBool, "gradual", True),
+    ),
+    "Color": (
+        (MFColor, "color", []),
+    ),
+    "Compass": (
+        (MFVec3f, "lookupTable", []),
+        (SFBool, "xAxis", True),
+        (SFBool, "yAxis", True),
+        (SFBool, "zAxis", True),
+        (SFFloat, "resolution", -1),
+    ),
+    "Cone": (
+        (SFFloat, "bottomRadius", 1),
+        (SFFloat, "height", 2),
+        (SFBool, "side", True),
+        (SFBool, "bottom", True),
+        (SFInt32, "subdivision", 12),
+    ),
+    "Connector": (
+        (SFString, "type", "symmetric"),
+        (SFBool, "isLocked", False),
+        (SFBool, "autoLock", False),
+        (SFBool, "unilateralLock", True),
+        (SFBool, "unilateralUnlock", True),
+        (SFFloat, "distanceTolerance", 0.01),
+        (SFFloat, "axisTolerance", 0.2),
+        (SFFloat, "rotationTolerance", 0.2),
+        (SFInt32, "numberOfRotations", 4),
+        (SFBool, "snap", True),
+        (SFFloat, "tensileStrength", -1),
+        (SFFloat, "shearStrength", -1),
+    ),
+    "ContactProperties": (
+        (SFString, "material1", "default"),
+        (SFString, "material2", "default"),
+        (MFFloat, "coulombFriction", [ 1 ]),
+        (SFVec2f, "frictionRotation", [ 0, 0 ]),
+        (SFVec3f, "rollingFriction", [ 0, 0, 0 ]),
+        (SFFloat, "bounce", 0.5),
+        (SFFloat, "bounceVelocity", 0.01),
+        (MFFloat, "forceDependentSlip", [ 0 ]),
+        (SFFloat, "softERP", 0.2),
+        (SFFloat, "softCFM", 0.001),
+        (SFString, "bumpSound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/bump.wav"),
+        (SFString, "rollSound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/roll.wav"),
+        (SFString, "slideSound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/slide.wav"),
+        (SFInt32, "maxContactJoints", 10),
+    ),
+    "Coordinate": (
+        (MFVec3f, "point", []),
+    ),
+    "Cylinder": (
+        (SFBool, "bottom", True),
+        (SFFloat, "height", 2),
+        (SFFloat, "radius", 1),
+        (SFBool, "side", True),
+        (SFBool, "top", True),
+        (SFInt32, "subdivision", 12),
+    ),
+    "Damping": (
+        (SFFloat, "linear", 0.2),
+        (SFFloat, "angular", 0.2),
+    ),
+    "Device": (),
+    "DirectionalLight": (
+        (SFVec3f, "direction", [ 0, 0, -1 ]),
+    ),
+    "Display": (
+        (SFInt32, "width", 64),
+        (SFInt32, "height", 64),
+    ),
+    "DistanceSensor": (
+        (MFVec3f, "lookupTable", [[0, 0, 0], [0.1, 1000, 0]]),
+        (SFString, "type", "generic"),
+        (SFInt32, "numberOfRays", 1),
+        (SFFloat, "aperture", 1.5708),
+        (SFFloat, "gaussianWidth", 1),
+        (SFFloat, "resolution", -1),
+        (SFFloat, "redColorSensitivity", 1),
+    ),
+    "ElevationGrid": (
+        (MFFloat, "height", []),
+        (SFInt32, "xDimension", 0),
+        (SFFloat, "xSpacing", 1),
+        (SFInt32, "yDimension", 0),
+        (SFFloat, "ySpacing", 1),
+        (SFFloat, "thickness", 1),
+    ),
+    "Emitter": (
+        (SFString, "type", "radio"),
+        (SFFloat, "range", -1),
+        (SFFloat, "maxRange", -1),
+        (SFFloat, "aperture", -1),
+        (SFInt32, "channel", 0),
+        (SFInt32, "baudRate", -1),
+        (SFInt32, "byteSize", 8),
+        (SFInt32, "bufferSize", -1),
+        (MFInt32, "allowedChannels", []),
+    ),
+    "Fluid": (
+        (SFString, "description", ""),
+        (SFString, "name", "fluid"),
+        (SFString, "model", ""),
+        (SFString, "description", ""),
+        (SFFloat, "density", 1000),
+        (SFFloat, "viscosity", 0.001),
+        (SFVec3f, "streamVelocity", [ 0, 0, 0 ]),
+        (SFNode, "boundingObject", None),
+        (SFBool, "locked", False),
+    ),
+    "Focus": (
+        (SFFloat, "focalDistance", 0),
+        (SFFloat, "focalLength", 0),
+        (SFFloat, "maxFocalDistance", 0),
+        (SFFloat, "minFocalDistance", 0),
+    ),
+    "Fog": (
+        (SFColor, "color", [ 1, 1, 1 ]),
+        (SFString, "fogType", "LINEAR"),
+        (SFFloat, "visibilityRange", 0),
+    ),
+    "GPS": (
+        (SFString, "type", "satellite"),
+        (SFFloat, "accuracy", 0),
+        (SFFloat, "noiseCorrelation", 0),
+        (SFFloat, "resolution", -1),
+        (SFFloat, "speedNoise", 0),
+        (SFFloat, "speedResolution", -1),
+    ),
+    "Group": (
+        (MFNode, "children", []),
+    ),
+    "Gyro": (
+        (MFVec3f, "lookupTable", []),
+        (SFBool, "xAxis", True),
+        (SFBool, "yAxis", True),
+        (SFBool, "zAxis", True),
+        (SFFloat, "resolution", -1),
+    ),
+    "Hinge2Joint": (
+        (SFNode, "jointParameters", None),
+        (SFNode, "jointParameters2", None),
+        (MFNode, "device2", []),
+        (SFFloat, "position2", 0),
+    ),
+    "HingeJoint": (
+        (MFNode, "device", []),
+        (SFFloat, "position", 0),
+    ),
+    "HingeJointParameters": (
+        (SFVec3f, "anchor", [ 0, 0, 0 ]),
+        (SFVec3f, "axis", [ 1, 0, 0 ]),
+        (SFFloat, "suspensionSpringConstant", 0),
+        (SFFloat, "suspensionDampingConstant", 0),
+        (SFVec3f, "suspensionAxis", [ 1, 0, 0 ]),
+        (SFFloat, "stopERP", -1),
+        (SFFloat, "stopCFM", -1),
+    ),
+    "ImageTexture": (
+        (MFString, "url", []),
+        (SFBool, "repeatS", True),
+        (SFBool, "repeatT", True),
+        (SFInt32, "filtering", 4),
+    ),
+    "ImmersionProperties": (
+        (SFString, "fluidName", ""),
+        (SFString, "referenceArea", [ "immersed, area" ]),
+        (SFVec3f, "dragForceCoefficients", [ 0, 0, 0 ]),
+        (SFVec3f, "dragTorqueCoefficients", [ 0, 0, 0 ]),
+        (SFFloat, "viscousResistanceForceCoefficient", 0),
+        (SFFloat, "viscousResistanceTorqueCoefficient", 0),
+    ),
+    "IndexedFaceSet": (
+        (SFNode, "coord", None),
+        (SFNode, "normal", None),
+        (SFNode, "texCoord", None),
+        (SFBool, "solid", True),
+        (SFBool, "ccw", True),
+        (SFBool, "convex", True),
+        (SFBool, "normalPerVertex", True),
+        (MFInt32, "coordIndex", []),
+        (MFInt32, "normalIndex", []),
+        (MFInt32, "texCoordIndex", []),
+        (SFFloat, "creaseAngle", 0),
+    ),
+    "IndexedLineSet": (
+        (SFNode, "coord", None),
+        (MFInt32, "coordIndex", []),
+    ),
+    "InertialUnit": (
+        (SFBool, "xAxis", True),
+        (SFBool, "zAxis", True),
+        (SFBool, "yAxis", True),
+        (SFFloat, "resolution", -1),
+        (SFFloat, "noise", 0),
+    ),
+    "Joint": (
+        (SFNode, "jointParameters", None),
+        (SFNode, "endPoint", None),
+    ),
+    "JointParameters": (
+        (SFFloat, "position", 0),
+        (SFVec3f, "axis", [ 0, 0, 1 ]),
+        (SFFloat, "minStop", 0),
+        (SFFloat, "maxStop", 0),
+        (SFFloat, "springConstant", 0),
+        (SFFloat, "dampingConstant", 0),
+        (SFFloat, "staticFriction", 0),
+    ),
+    "Joystick": (),
+    "Keyboard": (),
+    "LED": (
+        (MFColor, "color", [1, 0, 0]),
+        (SFBool, "gradual", False),
+    ),
+    "Lens": (
+        (SFVec2f, "center", [ 0.5, 0.5 ]),
+        (SFVec2f, "radialCoefficients", [ 0, 0 ]),
+        (SFVec2f, "tangentialCoefficients", [ 0, 0 ]),
+    ),
+    "LensFlare": (
+        (SFFloat, "transparency", 0.4),
+        (SFFloat, "scale", 1.5),
+        (SFFloat, "bias", -0.9),
+        (SFFloat, "dispersal", 0.6),
+        (SFInt32, "samples", 4),
+        (SFFloat, "haloWidth", 0.4),
+        (SFFloat, "chromaDistortion", 2.0),
+        (SFInt32, "blurIterations", 2),
+    ),
+    "Lidar": (
+        (SFFloat, "tiltAngle", 0.0),
+        (SFInt32, "horizontalResolution", 512),
+        (SFFloat, "fieldOfView", 1.5708),
+        (SFFloat, "verticalFieldOfView", 0.2),
+        (SFInt32, "numberOfLayers", 4),
+        (SFFloat, "near", 0.01),
+        (SFFloat, "minRange", 0.01),
+        (SFFloat, "maxRange", 1.0),
+        (SFString, "type", "fixed"),
+        (SFString, "projection", "cylindrical"),
+        (SFFloat, "noise", 0.0),
+        (SFFloat, "resolution", -1.0),
+        (SFFloat, "defaultFrequency", 10),
+        (SFFloat, "minFrequency", 1),
+        (SFFloat, "maxFrequency", 25),
+        (SFNode, "rotatingHead", None),
+    ),
+    "Light": (
+        (SFFloat, "ambientIntensity", 0),
+        (SFColor, "color", [ 1, 1, 1 ]),
+        (SFFloat, "intensity", 1),
+        (SFBool, "on", True),
+        (SFBool, "castShadows", False),
+    ),
+    "LightSensor": (
+        (MFVec3f, "lookupTable", [[0, 0, 0], [1, 1000, 0]]),
+        (SFColor, "colorFilter", [ 1, 1, 1 ]),
+        (SFBool, "occlusion", False),
+        (SFFloat, "resolution", -1),
+    ),
+    "LinearMotor": (
+        (SFString, "name", [ "linear, motor" ]),
+        (SFFloat, "maxForce", 10),
+        (SFString, "sound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/linear_motor.wav"),
+    ),
+    "Material": (
+        (SFFloat, "ambientIntensity", 0.2),
+        (SFColor, "diffuseColor", [ 0.8, 0.8, 0.8 ]),
+        (SFColor, "emissiveColor", [ 0, 0, 0 ]),
+        (SFFloat, "shininess", 0.2),
+        (SFColor, "specularColor", [ 0, 0, 0 ]),
+        (SFFloat, "transparency", 0),
+    ),
+    "Mesh": (
+        (MFString, "url", []),
+        (SFBool, "ccw", True),
+        (SFString, "name", ""),
+        (SFInt32, "materialIndex", -1),
+    ),
+    "Motor": (
+        (SFFloat, "acceleration", -1),
+        (SFFloat, "consumptionFactor", 10),
+        (SFVec3f, "controlPID", [ 10, 0, 0 ]),
+        (SFFloat, "minPosition", 0),
+        (SFFloat, "maxPosition", 0),
+        (SFFloat, "maxVelocity", 10),
+        (SFFloat, "multiplier", 1),
+        (SFString, "sound", ""),
+        (MFNode, "muscles", []),
+    ),
+    "Muscle": (
+        (SFDouble, "volume", 0.01),
+        (SFVec3f, "startOffset", [ 0, 0, 0 ]),
+        (SFVec3f, "endOffset", [ 0, 0, 0 ]),
+        (MFColor, "color", []),
+        (SFBool, "castShadows", True),
+        (SFBool, "visible", True),
+    ),
+    "Normal": (
+        (MFVec3f, "vector", []),
+    ),
+    "PBRAppearance": (
+        (SFColor, "baseColor", [ 1, 1, 1 ]),
+        (SFNode, "baseColorMap", None),
+        (SFFloat, "transparency", 0),
+        (SFFloat, "roughness", 0),
+        (SFNode, "roughnessMap", None),
+        (SFFloat, "metalness", 1),
+        (SFNode, "metalnessMap", None),
+        (SFFloat, "IBLStrength", 1),
+        (SFNode, "normalMap", None),
+        (SFFloat, "normalMapFactor", 1),
+        (SFNode, "occlusionMap", None),
+        (SFFloat, "occlusionMapStrength", 1),
+        (SFColor, "emissiveColor", [ 0, 0, 0 ]),
+        (SFNode, "emissiveColorMap", None),
+        (SFFloat, "emissiveIntensity", 1),
+        (SFNode, "textureTransform", None),
+        (SFString, "name", "PBRAppearance"),
+    ),
+    "Pen": (
+        (SFColor, "inkColor", [ 0, 0, 0 ]),
+        (SFFloat, "inkDensity", 0.5),
+        (SFFloat, "leadSize", 0.002),
+        (SFFloat, "maxDistance", 0.0),
+        (SFBool, "write", True),
+    ),
+    "Physics": (
+        (SFFloat, "density", 1000),
+        (SFFloat, "mass", -1),
+        (MFVec3f, "centerOfMass", []),
+        (MFVec3f, "inertiaMatrix", []),
+        (SFNode, "damping", None),
+    ),
+    "Plane": (
+        (SFVec2f, "size", [ 1, 1 ]),
+    ),
+    "PointLight": (
+        (SFVec3f, "attenuation", [ 1, 0, 0 ]),
+        (SFVec3f, "location", [ 0, 0, 0 ]),
+        (SFFloat, "radius", 100),
+    ),
+    "PointSet": (
+        (SFNode, "color", None),
+        (SFNode, "coord", None),
+    ),
+    "PositionSensor": (
+        (SFFloat, "noise", 0),
+        (SFFloat, "resolution", -1),
+    ),
+    "Propeller": (
+        (SFVec3f, "shaftAxis", [ 1, 0, 0 ]),
+        (SFVec3f, "centerOfThrust", [ 0, 0, 0 ]),
+        (SFVec2f, "thrustConstants", [ 1, 0 ]),
+        (SFVec2f, "torqueConstants", [ 1, 0 ]),
+        (SFFloat, "fastHelixThreshold", 75.4),
+        (SFNode, "device", None),
+        (SFNode, "fastHelix", None),
+        (SFNode, "slowHelix", None),
+    ),
+    "Radar": (
+        (SFFloat, "minRange", 1),
+        (SFFloat, "maxRange", 50.0),
+        (SFFloat, "horizontalFieldOfView", 0.78),
+        (SFFloat, "verticalFieldOfView", 0.1),
+        (SFFloat, "minAbsoluteRadialSpeed", 0.0),
+        (SFFloat, "minRadialSpeed", 1),
+        (SFFloat, "maxRadialSpeed", -1),
+        (SFFloat, "cellDistance", 0.0),
+        (SFFloat, "cellSpeed", 0.0),
+        (SFFloat, "rangeNoise", 0.0),
+        (SFFloat, "speedNoise", 0.0),
+        (SFFloat, "angularNoise", 0.0),
+        (SFFloat, "antennaGain", 20.0),
+        (SFFloat, "frequency", 24.0),
+        (SFFloat, "transmittedPower", 1.0),
+        (SFFloat, "minDetectableSignal", -100),
+        (SFBool, "occlusion", False),
+    ),
+    "RangeFinder": (
+        (SFFloat, "fieldOfView", 0.7854),
+        (SFInt32, "width", 64),
+        (SFInt32, "height", 64),
+        (SFString, "projection", "planar"),
+        (SFFloat, "near", 0.01),
+        (SFFloat, "minRange", 0.01),
+        (SFFloat, "maxRange", 1.0),
+        (SFFloat, "motionBlur", 0.0),
+        (SFFloat, "noise", 0.0),
+        (SFFloat, "resolution", -1.0),
+        (SFNode, "lens", None),
+    ),
+    "Receiver": (
+        (SFString, "type", "radio"),
+        (SFFloat, "aperture", -1),
+        (SFInt32, "channel", 0),
+        (SFInt32, "baudRate", -1),
+        (SFInt32, "byteSize", 8),
+        (SFInt32, "bufferSize", -1),
+        (SFFloat, "signalStrengthNoise", 0),
+        (SFFloat, "directionNoise", 0),
+        (MFInt32, "allowedChannels", []),
+    ),
+    "Recognition": (
+        (SFFloat, "maxRange", 100),
+        (SFInt32, "maxObjects", -1),
+        (SFInt32, "occlusion", 1),
+        (SFColor, "frameColor", [ 1, 0, 0 ]),
+        (SFInt32, "frameThickness", 1),
+        (SFBool, "segmentation", False),
+    ),
+    "Robot": (
+        (SFString, "controller", "<generic>"),
+        (MFString, "controllerArgs", []),
+        (SFString, "customData", ""),
+        (SFBool, "supervisor", False),
+        (SFBool, "synchronization", True),
+        (MFFloat, "battery", []),
+        (SFFloat, "cpuConsumption", 10),
+        (SFBool, "selfCollision", False),
+        (SFString, "window", "<generic>"),
+        (SFString, "remoteControl", "<none>"),
+    ),
+    "RotationalMotor": (
+        (SFString, "name", [ "rotational, motor" ]),
+        (SFFloat, "maxTorque", 10),
+        (SFString, "sound", "https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/default/worlds/sounds/rotational_motor.wav"),
+    ),
+    "Shape": (
+        (SFNode, "appearance", None),
+        (SFNode, "geometry", None),
+        (SFBool, "castShadows", True),
+        (SFBool, "isPickable", True),
+    ),
+    "Skin": (
+        (SFVec3f, "translation", [ 0, 0, 0 ]),
+        (SFRotation, "rotation", [ 0, 0, 1, 0 ]),
+        (SFVec3f, "scale", [ 1, 1, 1 ]),
+        (SFString, "name", "skin"),
+        (SFString, "modelUrl", ""),
+        (MFNode, "appearance", []),
+        (MFNode, "bones", []),
+        (SFBool, "castShadows", True),
+        (SFFloat, "translationStep", 0.01),
+        (SFFloat, "rotationStep", 0.261799387),
+    ),
+    "SliderJoint": (
+        (MFNode, "device", []),
+        (SFFloat, "position", 0),
+    ),
+    "Slot": (
+        (SFString, "type", ""),
+        (SFNode, "endPoint", None),
+    ),
+    "Solid": (
+        (SFString, "name", "solid"),
+        (SFString, "model", ""),
+        (SFString, "description", ""),
+        (SFString, "contactMaterial", "default"),
+        (MFNode, "immersionProperties", []),
+        (SFNode, "boundingObject", None),
+        (SFNode, "physics", None),
+        (SFBool, "locked", False),
+        (SFFloat, "radarCrossSection", 0.0),
+        (MFColor, "recognitionColors", []),
+        (SFVec3f, "linearVelocity", [ 0, 0, 0 ]),
+        (SFVec3f, "angularVelocity", [ 0, 0, 0 ]),
+    ),
+    "SolidReference": (
+        (SFString, "solidName", ""),
+    ),
+    "Speaker": (),
+    "Sphere": (
+        (SFFloat, "radius", 1),
+        (SFInt32, "subdivision", 1),
+        (SFBool, "ico", True),
+    ),
+    "SpotLight": (
+        (SFFloat, "ambientIntensity", 0),
+        (SFVec3f, "attenuation", [ 1, 0, 0 ]),
+        (SFFloat, "beamWidth", 1.570796),
+        (SFColor, "color", [ 1, 1, 1 ]),
+        (SFFloat, "cutOffAngle", 0.785398),
+        (SFVec3f, "direction", [ 0, 0, -1 ]),
+        (SFFloat, "intensity", 1),
+        (SFVec3f, "location", [ 0, 0, 10 ]),
+        (SFBool, "on", True),
+        (SFFloat, "radius", 100),
+        (SFBool, "castShadows", False),
+    ),
+    "TextureCoordinate": (
+        (MFVec2f, "point", []),
+    ),
+    "TextureTransform": (
+        (SFVec2f, "center", [ 0, 0 ]),
+        (SFFloat, "rotation", 0),
+        (SFVec2f, "scale", [ 1, 1 ]),
+        (SFVec2f, "translation", [ 0, 0 ]),
+    ),
+    "TouchSensor": (
+        (SFString, "type", "bumper"),
+        (MFVec3f, "lookupTable", [[0, 0, 0], [5000, 50000, 0]]),
+        (SFFloat, "resolution", -1),
+    ),
+    "Track": (
+        (MFNode, "device", []),
+        (SFVec2f, "textureAnimation", [ 0, 0 ]),
+        (SFNode, "animatedGeometry", None),
+        (SFInt32, "geometriesCount", 10),
+    ),
+    "TrackWheel": (
+        (SFVec2f, "position", [ 0, 0 ]),
+        (SFFloat, "radius", 0.1),
+        (SFBool, "inner", True),
+    ),
+    "Transform": (
+        (SFVec3f, "scale", [ 1, 1, 1 ]),
+    ),
+    "VacuumGripper": (
+        (SFBool, "isOn", False),
+        (SFFloat, "tensileStrength", -1),
+        (SFFloat, "shearStrength", -1),
+        (SFInt32, "contactPoints", 3),
+    ),
+    "Viewpoint": (
+        (SFFloat, "fieldOfView", 0.785398),
+        (SFRotation, "orientation", [ 0, 0, 1, 0 ]),
+        (SFVec3f, "position", [ -10, 0, 0 ]),
+        (SFString, "description", ""),
+        (SFFloat, "near", 0.05),
+        (SFFloat, "far", 0.0),
+        (SFFloat, "exposure", 1.0),
+        (SFString, "follow", ""),
+        (SFString, "followType", "Tracking Shot"),
+        (SFFloat, "followSmoothness", 0.5),
+        (SFNode, "lensFlare", None),
+        (SFFloat, "ambientOcclusionRadius", 2),
+        (SFFloat, "bloomThreshold", 21),
+    ),
+    "WorldInfo": (
+        (SFString, "title", ""),
+        (MFString, "info", []),
+        (SFString, "window", "<none>"),
+        (SFFloat, "gravity", 9.81),
+        (SFFloat, "CFM", 0.00001),
+        (SFFloat, "ERP", 0.2),
+        (SFString, "physics", "<none>"),
+        (SFFloat, "basicTimeStep", 32),
+        (SFFloat, "FPS", 60),
+        (SFInt32, "optimalThreadCount", 1),
+        (SFFloat, "physicsDisableTime", 1),
+        (SFFloat, "physicsDisableLinearThreshold", 0.01),
+        (SFFloat, "physicsDisableAngularThreshold", 0.01),
+        (SFNode, "defaultDamping", None),
+        (SFFloat, "inkEvaporation", 0),
+        (SFString, "coordinateSystem", "ENU"),
+        (SFString, "gpsCoordinateSystem", "local"),
+        (SFVec3f, "gpsReference", [ 0, 0, 0 ]),
+        (SFFloat, "lineScale", 0.1),
+        (SFFloat, "dragForceScale", 30.0),
+        (SFFloat, "dragTorqueScale", 5.0),
+        (SFInt32, "randomSeed", 0),
+        (MFNode, "contactProperties", []),
+    ),
+    "Zoom": (
+        (SFFloat, "maxFieldOfView", 1.5),
+        (SFFloat, "minFieldOfView", 0.5),
+    )
+}
@@ -0,0 +1,458 @@
+"""Minimal PNG encoder for rendered track images."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import io
+import struct
+import zlib
+from typing import BinaryIO, Union
+import numpy as np
+from pyLineFollowerTrackGenerator.constants import (
+    PNG_FILTER_NONE, PNG_FILTER_SUB, PNG_FILTER_UP, PNG_FILTER_AVERAGE,
+    PNG_FILTER_PAETH, PNG_FILTER_ADAPTIVE, PNG_MODE_RGB, PNG_MODE_GRAY,
+    PNG_MODE_GRAY4, PNG_MODE_GRAY2, PNG_MODE_GRAY1, PNG_MODE_PALETTE
+)
+
+################################################################################
+# Variables
+################################################################################
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG color type depended on the number of channels.
+_COLOR_TYPE = {
+    1: 0,   # Grayscale
+    3: 2,   # RGB
+    4: 6    # RGBA
+}
+_COLOR_TYPE_PALETTE = 3
+
+# Bit depth of the gray PNG modes.
+_GRAY_BIT_DEPTH = {
+    PNG_MODE_GRAY: 8,
+    PNG_MODE_GRAY4: 4,
+    PNG_MODE_GRAY2: 2,
+    PNG_MODE_GRAY1: 1
+}
+
+# Number of anti-aliasing levels between two colors in the palette, including
+# both colors. 4 levels results in blends with 25 %, 50 % and 75 %.
+_PALETTE_BLEND_LEVELS = 4
+
+# The nearest palette color is looked up by the upper 5 bit of every channel.
+_PALETTE_LOOKUP_BITS = 5
+
+# Number of rows, which are filtered at once by the adaptive filter.
+_ADAPTIVE_BLOCK_SIZE = 64
+
+# PNG filter type, which is written at the begin of every scanline.
+_FILTER_TYPE = {
+    PNG_FILTER_NONE: 0,
+    PNG_FILTER_SUB: 1,
+    PNG_FILTER_UP: 2,
+    PNG_FILTER_AVERAGE: 3,
+    PNG_FILTER_PAETH: 4
+}
+
+################################################################################
+# Classes
+################################################################################
+
+class PngWriter():
+    """Writes an 8 bit image as PNG band by band of image rows into a binary
+        stream. Every compressed part is written as its own IDAT chunk,
+        therefore only the current band is kept in memory.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, fd: BinaryIO, width: int, height: int, channels: int, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE, bit_depth: int = 8, palette: Union[None, np.ndarray] = None) -> None: # pylint: disable=line-too-long
+        """Write the PNG header.
+
+        Args:
+            fd (BinaryIO): Binary stream, e.g. a file or io.BytesIO.
+            width (int): Image width in pixel.
+            height (int): Image height in pixel.
+            channels (int): Number of channels, see encode_png().
+            compression_level (int, optional): zlib compression level [0..9]. Defaults to 6.
+            png_filter (str, optional): Scanline filter, see PNG_FILTERS.
+                Defaults to PNG_FILTER_NONE.
+            bit_depth (int, optional): Bits per sample (1, 2, 4 or 8), less than 8 bit
+                only for a single channel. Defaults to 8.
+            palette (Union[None, np.ndarray], optional): RGB palette with shape (K, 3),
+                then the single channel is the palette index. Defaults to None.
+        """
+        self._fd = fd
+        self._height = height
+        self._num_rows = 0
+        self._png_filter = png_filter
+        self._bit_depth = bit_depth
+        self._compressor = zlib.compressobj(compression_level)
+
+        # The filters predict the first row by a row of zeros.
+        self._prior_row = np.zeros((width * channels * bit_depth + 7) // 8, dtype=np.uint8)
+
+        self._fd.write(_get_header(width, height, channels, bit_depth, palette))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # If an exception interrupted the writing, the image is incomplete.
+        # Nothing more is written, so the exception is not masked.
+        if exc_type is None:
+            self.close()
+        else:
+            self._compressor = None
+
+    def write(self, rows: np.ndarray) -> None:
+        """Write the next band of image rows.
+
+        Args:
+            rows (np.ndarray): Image rows with shape (rows, width[, channels]).
+        """
+        if rows.shape[0] > 0:
+            self._num_rows += rows.shape[0]
+            scanlines, self._prior_row = _get_scanlines(_pack(rows, self._bit_depth), self._prior_row, self._png_filter) # pylint: disable=line-too-long
+            data = self._compressor.compress(scanlines)
+
+            if len(data) > 0:
+                self._fd.write(_chunk(b"IDAT", data))
+
+    def close(self) -> None:
+        """Write the remaining compressed data and the end of the PNG.
+            The stream itself is not closed.
+        """
+        if self._compressor is not None:
+            self._fd.write(_chunk(b"IDAT", self._compressor.flush()))
+            self._fd.write(_chunk(b"IEND", b""))
+            self._compressor = None
+
+            if self._num_rows != self._height:
+                raise ValueError(f"Image height is {self._height}, but {self._num_rows} rows are written.") # pylint: disable=line-too-long
+
+class RgbConverter(): # pylint: disable=too-few-public-methods
+    """Converts RGB images to the samples of a PNG color mode.
+    """
+
+    def __init__(self, png_mode: str = PNG_MODE_RGB, colors: Union[None, list[tuple[int, int, int]]] = None) -> None: # pylint: disable=line-too-long
+        """Create the converter.
+
+        Args:
+            png_mode (str, optional): PNG color mode, see PNG_MODES. Defaults to PNG_MODE_RGB.
+            colors (Union[None, list[tuple[int, int, int]]], optional): Colors of the palette
+                mode, see create_palette(). Defaults to None.
+        """
+        self.png_mode = png_mode
+        self.channels = 3
+        self.bit_depth = 8
+        self.palette = None
+        self._lookup_table = None
+
+        if png_mode in _GRAY_BIT_DEPTH:
+            self.channels = 1
+            self.bit_depth = _GRAY_BIT_DEPTH[png_mode]
+
+        elif png_mode == PNG_MODE_PALETTE:
+            self.channels = 1
+            self.palette = create_palette(colors)
+            self._lookup_table = _create_palette_lookup_table(self.palette)
+
+            for bit_depth in (1, 2, 4, 8):
+                if len(self.palette) <= (1 << bit_depth):
+                    self.bit_depth = bit_depth
+                    break
+
+        elif png_mode != PNG_MODE_RGB:
+            raise ValueError(f"Unsupported PNG mode: {png_mode}.")
+
+    def convert(self, rows: np.ndarray) -> np.ndarray:
+        """Convert RGB image rows to the samples of the PNG mode.
+
+        Args:
+            rows (np.ndarray): RGB image rows with shape (rows, width, 3) and dtype uint8.
+
+        Returns:
+            np.ndarray: Samples with shape (rows, width, 3) for RGB, otherwise (rows, width).
+        """
+        if self.png_mode in _GRAY_BIT_DEPTH:
+            # Luminance like ITU-R BT.601, scaled to the number of gray levels with rounding.
+            luminance = (rows.astype(np.uint32) * np.array([299, 587, 114], dtype=np.uint32)).sum(axis=2) # pylint: disable=line-too-long
+            max_level = (1 << self.bit_depth) - 1
+            rows = ((luminance * max_level + 127500) // 255000).astype(np.uint8)
+
+        elif self.png_mode == PNG_MODE_PALETTE:
+            shift = 8 - _PALETTE_LOOKUP_BITS
+            index = rows >> shift
+            rows = self._lookup_table[(index[:, :, 0].astype(np.uint32) << (2 * _PALETTE_LOOKUP_BITS)) | (index[:, :, 1].astype(np.uint32) << _PALETTE_LOOKUP_BITS) | index[:, :, 2]] # pylint: disable=line-too-long
+
+        return rows
+
+################################################################################
+# Functions
+################################################################################
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(chunk_type + data) & 0xffffffff
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+# pylint: disable=too-many-arguments
+def _get_header(width: int, height: int, channels: int, bit_depth: int = 8, palette: Union[None, np.ndarray] = None) -> bytes: # pylint: disable=line-too-long
+    if channels not in _COLOR_TYPE:
+        raise ValueError(f"Unsupported number of channels: {channels}.")
+
+    if (bit_depth not in (1, 2, 4, 8)) or ((bit_depth < 8) and (channels != 1)):
+        raise ValueError(f"Unsupported bit depth: {bit_depth}.")
+
+    color_type = _COLOR_TYPE[channels] if palette is None else _COLOR_TYPE_PALETTE
+    header = _PNG_SIGNATURE + _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0)) # pylint: disable=line-too-long
+
+    if palette is not None:
+        header += _chunk(b"PLTE", np.asarray(palette, dtype=np.uint8).tobytes())
+
+    return header
+
+def _pack(rows: np.ndarray, bit_depth: int) -> np.ndarray:
+    """Pack the samples of a single channel image with less than 8 bit into
+        bytes. The first sample is in the most significant bits and every
+        row starts with a new byte.
+
+    Args:
+        rows (np.ndarray): Image rows with shape (rows, width[, channels]).
+        bit_depth (int): Bits per sample.
+
+    Returns:
+        np.ndarray: Image rows with shape (rows, bytes per row) if packed,
+            otherwise the given rows.
+    """
+    if bit_depth < 8:
+        samples_per_byte = 8 // bit_depth
+        samples = rows.reshape(rows.shape[0], -1)
+        num_bytes = (samples.shape[1] + samples_per_byte - 1) // samples_per_byte
+
+        padded = np.zeros((samples.shape[0], num_bytes * samples_per_byte), dtype=np.uint8)
+        padded[:, :samples.shape[1]] = samples
+        padded = padded.reshape((samples.shape[0], num_bytes, samples_per_byte))
+
+        shifts = np.arange(samples_per_byte - 1, -1, -1, dtype=np.uint8) * bit_depth
+        rows = np.bitwise_or.reduce(padded << shifts, axis=2).astype(np.uint8)
+
+    return rows
+
+def _filter(lines: np.ndarray, prior_lines: np.ndarray, bytes_per_pixel: int, filter_type: int) -> np.ndarray: # pylint: disable=line-too-long
+    """Filter the scanlines with the given PNG filter type. All predictions
+        use the unfiltered bytes, therefore all rows are filtered at once.
+
+    Args:
+        lines (np.ndarray): Scanlines with shape (rows, bytes per row).
+        prior_lines (np.ndarray): Scanline above every scanline with the same shape.
+        bytes_per_pixel (int): Bytes per pixel, which is the distance to the left byte.
+        filter_type (int): PNG filter type [0..4].
+
+    Returns:
+        np.ndarray: Filtered scanlines with the same shape and dtype uint8.
+    """
+    left = np.zeros_like(lines)
+    left[:, bytes_per_pixel:] = lines[:, :-bytes_per_pixel]
+
+    if filter_type == 1:
+        prediction = left
+    elif filter_type == 2:
+        prediction = prior_lines
+    elif filter_type == 3:
+        prediction = ((left.astype(np.uint16) + prior_lines) >> 1).astype(np.uint8)
+    elif filter_type == 4:
+        prior_left = np.zeros_like(prior_lines)
+        prior_left[:, bytes_per_pixel:] = prior_lines[:, :-bytes_per_pixel]
+
+        # Paeth predictor: the neighbour, which is closest to left + above - above left.
+        estimate = left.astype(np.int16) + prior_lines - prior_left
+        distance_left = np.abs(estimate - left)
+        distance_above = np.abs(estimate - prior_lines)
+        distance_above_left = np.abs(estimate - prior_left)
+        prediction = np.where((distance_left <= distance_above) & (distance_left <= distance_above_left), left, # pylint: disable=line-too-long
+                                np.where(distance_above <= distance_above_left, prior_lines, prior_left)).astype(np.uint8) # pylint: disable=line-too-long
+    else:
+        prediction = np.zeros_like(lines)
+
+    return lines - prediction
+
+def _filter_adaptive(lines: np.ndarray, prior_lines: np.ndarray, bytes_per_pixel: int, raw: np.ndarray) -> None: # pylint: disable=line-too-long
+    """Filter every scanline with the PNG filter type, which results in the
+        smallest sum of absolute signed differences, like the libpng heuristic.
+        The rows are filtered in blocks to limit the memory.
+
+    Args:
+        lines (np.ndarray): Scanlines with shape (rows, bytes per row).
+        prior_lines (np.ndarray): Scanline above every scanline with the same shape.
+        bytes_per_pixel (int): Bytes per pixel, which is the distance to the left byte.
+        raw (np.ndarray): Filtered scanlines with shape (rows, 1 + bytes per row),
+            every one starts with its filter type.
+    """
+    for row_begin in range(0, lines.shape[0], _ADAPTIVE_BLOCK_SIZE):
+        block = slice(row_begin, row_begin + _ADAPTIVE_BLOCK_SIZE)
+        best_costs = None
+
+        for filter_type in range(5):
+            filtered = _filter(lines[block], prior_lines[block], bytes_per_pixel, filter_type)
+            costs = np.abs(filtered.view(np.int8).astype(np.int16)).sum(axis=1, dtype=np.int64)
+
+            if best_costs is None:
+                best_costs = costs
+                raw[block, 0] = filter_type
+                raw[block, 1:] = filtered
+            else:
+                is_better = costs < best_costs
+                best_costs = np.where(is_better, costs, best_costs)
+                raw[block, 0][is_better] = filter_type
+                raw[block, 1:][is_better] = filtered[is_better]
+
+def _get_scanlines(image: np.ndarray, prior_row: Union[None, np.ndarray] = None, png_filter: str = PNG_FILTER_NONE) -> tuple[bytes, np.ndarray]: # pylint: disable=line-too-long
+    """Get the filtered scanlines of an 8 bit image.
+
+    Args:
+        image (np.ndarray): Image, see encode_png().
+        prior_row (Union[None, np.ndarray], optional): Row above the first image row,
+            a row of zeros for the first row of an image. Defaults to None.
+        png_filter (str, optional): Scanline filter, see PNG_FILTERS. Defaults to PNG_FILTER_NONE.
+
+    Returns:
+        tuple[bytes, np.ndarray]: Scanlines, every one starts with its filter type
+            and the last image row, which is the prior row of the next band.
+    """
+    if image.dtype != np.uint8:
+        raise ValueError("Only 8 bit images are supported.")
+
+    if image.ndim == 2:
+        image = image[:, :, np.newaxis]
+
+    height, width, channels = image.shape
+    lines = image.reshape(height, width * channels)
+
+    if prior_row is None:
+        prior_row = np.zeros(width * channels, dtype=np.uint8)
+
+    raw = np.empty((height, 1 + width * channels), dtype=np.uint8)
+
+    if png_filter == PNG_FILTER_NONE:
+        raw[:, 0] = 0
+        raw[:, 1:] = lines
+    else:
+        prior_lines = np.concatenate((prior_row[np.newaxis, :], lines[:-1]))
+
+        if png_filter == PNG_FILTER_ADAPTIVE:
+            _filter_adaptive(lines, prior_lines, channels, raw)
+        else:
+            raw[:, 0] = _FILTER_TYPE[png_filter]
+            raw[:, 1:] = _filter(lines, prior_lines, channels, _FILTER_TYPE[png_filter])
+
+    return raw.tobytes(), lines[-1].copy()
+
+def create_palette(colors: list[tuple[int, int, int]], num_blend_levels: int = _PALETTE_BLEND_LEVELS) -> np.ndarray: # pylint: disable=line-too-long
+    """Create a palette with the colors and the blends between every pair of
+        them, which are the anti-aliased borders of the track lines.
+
+    Args:
+        colors (list[tuple[int, int, int]]): RGB colors.
+        num_blend_levels (int, optional): Number of levels between two colors, including
+            both colors. Defaults to _PALETTE_BLEND_LEVELS.
+
+    Returns:
+        np.ndarray: RGB palette with shape (K, 3) and dtype uint8, which starts with the colors.
+    """
+    palette = [tuple(color) for color in colors]
+
+    for index_a, color_a in enumerate(colors):
+        for color_b in colors[index_a + 1:]:
+            for level in range(1, num_blend_levels):
+                alpha = level / num_blend_levels
+                blend = tuple(int(round(channel_a * (1 - alpha) + channel_b * alpha)) for channel_a, channel_b in zip(color_a, color_b)) # pylint: disable=line-too-long
+
+                if blend not in palette:
+                    palette.append(blend)
+
+    if len(palette) > 256:
+        raise ValueError(f"Too many palette colors: {len(palette)}.")
+
+    return np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+
+def _create_palette_lookup_table(palette: np.ndarray) -> np.ndarray:
+    """Create the lookup table, which maps the upper bits of every RGB channel
+        to the index of the nearest palette color.
+
+    Args:
+        palette (np.ndarray): RGB palette with shape (K, 3).
+
+    Returns:
+        np.ndarray: Palette indices with shape (2^(3 * _PALETTE_LOOKUP_BITS),).
+    """
+    shift = 8 - _PALETTE_LOOKUP_BITS
+    levels = np.arange(1 << _PALETTE_LOOKUP_BITS, dtype=np.int32)
+
+    # The lookup colors are the middle of the value range of every entry.
+    values = (levels << shift) + ((1 << shift) >> 1)
+    red, green, blue = np.meshgrid(values, values, values, indexing="ij")
+    colors = np.stack((red.ravel(), green.ravel(), blue.ravel()), axis=1)
+
+    palette = palette.astype(np.int32)
+    distances = ((colors[:, np.newaxis, :] - palette[np.newaxis, :, :]) ** 2).sum(axis=2)
+
+    return np.argmin(distances, axis=1).astype(np.uint8)
+
+# pylint: disable=too-many-arguments
+def encode_png(image: np.ndarray, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE) -> bytes: # pylint: disable=line-too-long
+    """Encode an 8 bit image as PNG.
+
+    Args:
+        image (np.ndarray): Image with shape (height, width) for grayscale,
+            (height, width, 3) for RGB or (height, width, 4) for RGBA.
+        compression_level (int, optional): zlib compression level [0..9]. Defaults to 6.
+        png_filter (str, optional): Scanline filter, see PNG_FILTERS. Defaults to PNG_FILTER_NONE.
+
+    Returns:
+        bytes: PNG file content.
+    """
+    fd = io.BytesIO()
+    channels = 1 if image.ndim == 2 else image.shape[2]
+
+    with PngWriter(fd, image.shape[1], image.shape[0], channels, compression_level, png_filter) as png_writer: # pylint: disable=line-too-long
+        png_writer.write(image)
+
+    return fd.getvalue()
+
+def save_png(file_name: str, image: np.ndarray, compression_level: int = 6, png_filter: str = PNG_FILTER_NONE) -> None: # pylint: disable=line-too-long
+    """Save an 8 bit image as PNG file.
+
+    Args:
+        file_name (str): The PNG file name.
+        image (np.ndarray): Image, see encode_png().
+        compression_level (int, optional): zlib compression level [0..9]. Defaults to 6.
+        png_filter (str, optional): Scanline filter, see PNG_FILTERS. Defaults to PNG_FILTER_NONE.
+    """
+    with open(file_name, "wb") as fd:
+        fd.write(encode_png(image, compression_level, png_filter))
+
+################################################################################
+# Main
+################################################################################
@@ -70,10 +70,14 @@ class PrgArgParser():
 
         return main_parser
 
-    def parse_args(self):
+    def parse_args(self, args: list[str] = None):
         """Parse the program arguments.
+
+        Args:
+            args (list[str], optional): Arguments to parse. Defaults to None,
+                which means the program arguments from the command line.
         """
-        self._args = self._parser.parse_args()
+        self._args = self._parser.parse_args(args)
 
     def get_sub_parsers(self):
         """Get the sub parsers to be able to add additional command specific parsers.
@@ -100,6 +104,70 @@ class PrgArgParser():
 # Functions
 ################################################################################
 
+def non_negative_int(value: str) -> int:
+    """Argument type of a non-negative integer, e.g. a seed.
+
+    Args:
+        value (str): Argument value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is no non-negative integer.
+
+    Returns:
+        int: Integer
+    """
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from error
+
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be non-negative: '{value}'")
+
+    return number
+
+def positive_int(value: str) -> int:
+    """Argument type of a positive integer, e.g. a number of workers.
+
+    Args:
+        value (str): Argument value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is no positive integer.
+
+    Returns:
+        int: Integer
+    """
+    number = non_negative_int(value)
+
+    if number == 0:
+        raise argparse.ArgumentTypeError(f"must be positive: '{value}'")
+
+    return number
+
+def positive_float(value: str) -> float:
+    """Argument type of a positive floating point number, e.g. a distance.
+
+    Args:
+        value (str): Argument value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is no positive number.
+
+    Returns:
+        float: Number
+    """
+    try:
+        number = float(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid float value: '{value}'") from error
+
+    # Rejects NaN too.
+    if (number > 0) is False:
+        raise argparse.ArgumentTypeError(f"must be positive: '{value}'")
+
+    return number
+
 ################################################################################
 # Main
 ################################################################################
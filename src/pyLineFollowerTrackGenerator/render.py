@@ -0,0 +1,704 @@
+"""Renderer independent track drawing and its rendering backends."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from typing import Iterator, Union
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from pyLineFollowerTrackGenerator.constants import RENDERER_NUMPY, RENDERER_TILED, COLORS
+from pyLineFollowerTrackGenerator.image_sink import ImageSink, FileImageSink
+from pyLineFollowerTrackGenerator.mipmap import MipPyramidWriter, save_mip_pyramid
+
+################################################################################
+# Variables
+################################################################################
+_KIND_LINE = 0
+_KIND_POINTS = 1
+
+# The axes are placed inside the figure like matplotlib does by default
+# (rcParams figure.subplot.left/right/bottom/top). The numpy renderer uses the
+# same placement to stay pixel-compatible to the matplotlib renderer.
+_AXES_LEFT = 0.125
+_AXES_RIGHT = 0.9
+_AXES_BOTTOM = 0.11
+_AXES_TOP = 0.88
+
+# Default scatter marker diameter in points (rcParams lines.markersize).
+_MARKER_SIZE = 6 # [pt]
+
+# Use a dpi of 72 to plot with exact pixel sizes, 1 pt = 1 pixel.
+_DPI = 72
+
+# Width and height of a tile of the tiled renderer.
+_TILE_SIZE = 256 # [pixel]
+
+# Render context of the matplotlib renderer, created on first use.
+_FIGURE_CONTEXT = {
+    "renderContext": None
+}
+
+################################################################################
+# Classes
+################################################################################
+
+class TrackDrawing:
+    """Renderer independent description of a track image. All coordinates are
+        in data coordinates, the line widths in pixels.
+    """
+    def __init__(self, width: int, height: int, background_color: str = "white", is_aspect_equal: bool = False) -> None: # pylint: disable=line-too-long
+        self.width = width
+        self.height = height
+        self.background_color = background_color
+        self.is_aspect_equal = is_aspect_equal
+        self._primitives = []
+
+    # pylint: disable=too-many-arguments
+    def add_line(self, x: list[float], y: list[float], color: str, line_width: float, zorder: int = 2) -> None: # pylint: disable=line-too-long
+        """Add a line through all given points.
+
+        Args:
+            x (list[float]): x-coordinates
+            y (list[float]): y-coordinates
+            color (str): Line color.
+            line_width (float): Line width in pixels.
+            zorder (int, optional): Drawing order, higher is drawn later. Defaults to 2.
+        """
+        self._primitives.append((_KIND_LINE, np.asarray(x, dtype=float), np.asarray(y, dtype=float), color, line_width, zorder)) # pylint: disable=line-too-long
+
+    # pylint: disable=too-many-arguments
+    def add_points(self, x: list[float], y: list[float], color: str, line_width: float, zorder: int = 1) -> None: # pylint: disable=line-too-long
+        """Add filled circle markers at the given points.
+
+        Args:
+            x (list[float]): x-coordinates
+            y (list[float]): y-coordinates
+            color (str): Marker color.
+            line_width (float): Marker edge width in pixels.
+            zorder (int, optional): Drawing order, higher is drawn later. Defaults to 1.
+        """
+        self._primitives.append((_KIND_POINTS, np.asarray(x, dtype=float), np.asarray(y, dtype=float), color, line_width, zorder)) # pylint: disable=line-too-long
+
+    def get_primitives(self) -> list[tuple]:
+        """Get all primitives in drawing order.
+
+        Returns:
+            list[tuple]: Primitives (kind, x, y, color, line_width, zorder)
+        """
+        return sorted(self._primitives, key=lambda primitive: primitive[5])
+
+class FigureRenderContext():
+    """Owns a single matplotlib figure with its Agg canvas, which is reused
+        to render one track after another. It doesn't use pyplot, therefore
+        no figure is left in the pyplot figure manager and the memory stays
+        bounded in a long living process.
+    """
+
+    def __init__(self) -> None:
+        self._fig = Figure(dpi=_DPI)
+        FigureCanvasAgg(self._fig)
+
+    def render(self, drawing: TrackDrawing) -> Figure:
+        """Render the drawing into the figure of the context. The figure
+            is only valid until the next drawing is rendered.
+
+        Args:
+            drawing (TrackDrawing): The track drawing.
+
+        Returns:
+            Figure: Figure
+        """
+        return render_figure(drawing, self._fig)
+
+    def get_image(self) -> np.ndarray:
+        """Get the image of the last rendered drawing.
+
+        Returns:
+            np.ndarray: RGB image with shape (height, width, 3) and dtype uint8.
+        """
+        return _get_figure_image(self._fig)
+
+################################################################################
+# Functions
+################################################################################
+
+def render_figure(drawing: TrackDrawing, fig: Union[None, Figure] = None) -> Figure:
+    """Render the drawing with matplotlib into the given figure. Its axes are
+        cleared and reused. Without a figure, a new one is created, which is
+        not managed by pyplot and released like any other object.
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+        fig (Union[None, Figure], optional): Figure to render into. Defaults to None.
+
+    Returns:
+        Figure: Figure
+    """
+    if fig is None:
+        fig = Figure(dpi=_DPI)
+        FigureCanvasAgg(fig)
+
+    fig.set_dpi(_DPI)
+    fig.set_size_inches(drawing.width/_DPI, drawing.height/_DPI)
+
+    if len(fig.axes) == 0:
+        ax = fig.add_subplot()
+    else:
+        ax = fig.axes[0]
+        ax.clear()
+
+        # The aspect ratio of a previous drawing and the axes box, which it
+        # shrinks, aren't reset by clear().
+        ax.set_aspect("auto")
+        ax.set_position(ax.get_position(original=True))
+
+    # Set background color.
+    ax.set_facecolor(drawing.background_color)
+
+    for kind, x, y, color, line_width, zorder in drawing.get_primitives():
+        if kind == _KIND_LINE:
+            ax.plot(x, y, color=color, linewidth=line_width, zorder=zorder)
+        else:
+            ax.scatter(x, y, color=color, linewidth=line_width, zorder=zorder)
+
+    # Set limits
+    ax.set_xlim(0, drawing.width)
+    ax.set_ylim(0, drawing.height)
+
+    # Set aspect ratio to ensure that a unit on x-axis is equal to a unit on y-axis.
+    if drawing.is_aspect_equal is True:
+        ax.set_aspect("equal", adjustable="box")
+
+    # Hide axes
+    ax.axis('off')
+
+    return fig
+
+def _get_transform(drawing: TrackDrawing) -> tuple[float, float, float, float]:
+    """Get the transformation from data coordinates to image coordinates,
+        like matplotlib places the axes inside the figure.
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+
+    Returns:
+        tuple[float, float, float, float]: Offset x, offset y, scale x and scale y
+            of the axes box in display coordinates (origin bottom left).
+    """
+    box_x = _AXES_LEFT * drawing.width
+    box_y = _AXES_BOTTOM * drawing.height
+    box_width = (_AXES_RIGHT - _AXES_LEFT) * drawing.width
+    box_height = (_AXES_TOP - _AXES_BOTTOM) * drawing.height
+    scale_x = box_width / drawing.width
+    scale_y = box_height / drawing.height
+
+    # Shrink the box and center it, like matplotlib does with adjustable "box".
+    if drawing.is_aspect_equal is True:
+        scale_x = scale_y = min(scale_x, scale_y)
+        box_x += (box_width - scale_x * drawing.width) / 2
+        box_y += (box_height - scale_y * drawing.height) / 2
+
+    return box_x, box_y, scale_x, scale_y
+
+# pylint: disable=too-many-arguments
+def _get_patch(u_min: float, u_max: float, v_min: float, v_max: float, width: int, height: int) -> tuple[int, int, int, int]: # pylint: disable=line-too-long
+    col_begin = max(int(np.floor(u_min)), 0)
+    col_end = min(int(np.ceil(u_max)) + 1, width)
+    row_begin = max(int(np.floor(v_min)), 0)
+    row_end = min(int(np.ceil(v_max)) + 1, height)
+
+    return row_begin, row_end, col_begin, col_end
+
+# pylint: disable=too-many-arguments
+def _get_pixel_centers(row_begin: int, row_end: int, col_begin: int, col_end: int, origin: tuple[float, float]) -> tuple[np.ndarray, np.ndarray]: # pylint: disable=line-too-long
+    """Get the pixel centers of an image region relative to the origin.
+
+    Args:
+        row_begin (int): First image row.
+        row_end (int): Image row after the last one.
+        col_begin (int): First image column.
+        col_end (int): Image column after the last one.
+        origin (tuple[float, float]): Origin in image coordinates.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Horizontal distances as row vector and
+            vertical distances as column vector.
+    """
+    du = np.arange(col_begin, col_end, dtype=np.float32) + (0.5 - origin[0])
+    dv = np.arange(row_begin, row_end, dtype=np.float32) + (0.5 - origin[1])
+
+    return du[np.newaxis, :], dv[:, np.newaxis]
+
+# pylint: disable=too-many-locals, too-many-arguments
+def _add_segment_coverage(coverage: np.ndarray, row_offset: int, col_offset: int, point_a: tuple[float, float], point_b: tuple[float, float], half_width: float, caps: tuple[bool, bool]) -> None: # pylint: disable=line-too-long
+    """Add the coverage of one line segment to the coverage patch. The line
+        segment joins are round, the line ends projecting (square) like the
+        matplotlib defaults.
+
+    Args:
+        coverage (np.ndarray): Coverage patch [0..1].
+        row_offset (int): Image row of the first patch row.
+        col_offset (int): Image column of the first patch column.
+        point_a (tuple[float, float]): Segment start in image coordinates.
+        point_b (tuple[float, float]): Segment end in image coordinates.
+        half_width (float): Half line width in pixels.
+        caps (tuple[bool, bool]): Projecting cap at segment start and end.
+    """
+    margin = half_width + 1
+    row_begin, row_end, col_begin, col_end = _get_patch(
+        min(point_a[0], point_b[0]) - margin - col_offset,
+        max(point_a[0], point_b[0]) + margin - col_offset,
+        min(point_a[1], point_b[1]) - margin - row_offset,
+        max(point_a[1], point_b[1]) + margin - row_offset,
+        coverage.shape[1],
+        coverage.shape[0])
+
+    if (row_begin >= row_end) or (col_begin >= col_end):
+        return
+
+    # Pixel centers relative to the segment start.
+    du, dv = _get_pixel_centers(row_begin + row_offset, row_end + row_offset, col_begin + col_offset, col_end + col_offset, point_a) # pylint: disable=line-too-long
+
+    seg_u = point_b[0] - point_a[0]
+    seg_v = point_b[1] - point_a[1]
+    seg_length = float(np.hypot(seg_u, seg_v))
+
+    if seg_length == 0:
+        along = np.zeros_like(du + dv)
+        across = np.hypot(du, dv)
+    else:
+        along = (du * seg_u + dv * seg_v) / seg_length
+        across = np.abs(du * seg_v - dv * seg_u) / seg_length
+
+    # Signed distance to the line border, negative inside.
+    edge = np.hypot(along - np.clip(along, 0, seg_length), across) - half_width
+
+    if caps[0] is True:
+        edge = np.where(along < 0, np.maximum(-along, across) - half_width, edge)
+
+    if caps[1] is True:
+        edge = np.where(along > seg_length, np.maximum(along - seg_length, across) - half_width, edge) # pylint: disable=line-too-long
+
+    # One pixel wide anti-aliasing ramp at the border.
+    patch = coverage[row_begin:row_end, col_begin:col_end]
+    np.maximum(patch, np.clip(0.5 - edge, 0, 1), out=patch)
+
+def _add_marker_coverage(coverage: np.ndarray, row_offset: int, col_offset: int, center: tuple[float, float], half_width: float) -> None: # pylint: disable=line-too-long
+    """Add the coverage of one circle marker to the coverage patch.
+        The marker is filled and its edge is stroked with the line width.
+        If the edge is wider than the marker, matplotlib leaves a ring
+        shaped hole between the face and the inner edge border, which is
+        considered here too.
+
+    Args:
+        coverage (np.ndarray): Coverage patch [0..1].
+        row_offset (int): Image row of the first patch row.
+        col_offset (int): Image column of the first patch column.
+        center (tuple[float, float]): Marker center in image coordinates.
+        half_width (float): Half edge line width in pixels.
+    """
+    face_radius = _MARKER_SIZE / 2
+    radius = face_radius + half_width
+    inner_radius = abs(face_radius - half_width)
+
+    row_begin, row_end, col_begin, col_end = _get_patch(
+        center[0] - radius - 1 - col_offset,
+        center[0] + radius + 1 - col_offset,
+        center[1] - radius - 1 - row_offset,
+        center[1] + radius + 1 - row_offset,
+        coverage.shape[1],
+        coverage.shape[0])
+
+    if (row_begin >= row_end) or (col_begin >= col_end):
+        return
+
+    du, dv = _get_pixel_centers(row_begin + row_offset, row_end + row_offset, col_begin + col_offset, col_end + col_offset, center) # pylint: disable=line-too-long
+    distance = np.hypot(du, dv)
+    edge = np.minimum(distance - face_radius, np.maximum(distance - radius, inner_radius - distance)) # pylint: disable=line-too-long
+
+    patch = coverage[row_begin:row_end, col_begin:col_end]
+    np.maximum(patch, np.clip(0.5 - edge, 0, 1), out=patch)
+
+def _get_clip(drawing: TrackDrawing) -> tuple[int, int, int, int]:
+    """Get the image region of the axes box. Like matplotlib, everything is
+        clipped to it.
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+
+    Returns:
+        tuple[int, int, int, int]: First row, row after the last one, first column
+            and column after the last one.
+    """
+    offset_x, offset_y, scale_x, scale_y = _get_transform(drawing)
+
+    return _get_patch(
+        offset_x,
+        offset_x + scale_x * drawing.width - 1,
+        drawing.height - (offset_y + scale_y * drawing.height),
+        drawing.height - offset_y - 1,
+        drawing.width,
+        drawing.height)
+
+def _blend_coverage(image: np.ndarray, coverage: np.ndarray, row_begin: int, col_begin: int, color: str) -> None: # pylint: disable=line-too-long
+    """Blend the color into the image by the coverage patch.
+        Only the covered pixels are blended, which are a small part of the image.
+
+    Args:
+        image (np.ndarray): RGB image with shape (height, width, 3).
+        coverage (np.ndarray): Coverage patch [0..1].
+        row_begin (int): Image row of the first patch row.
+        col_begin (int): Image column of the first patch column.
+        color (str): Color name.
+    """
+    pixels = image.reshape(-1, 3)
+    covered = np.flatnonzero(coverage)
+    alpha = coverage.ravel()[covered][:, np.newaxis]
+    rows, cols = np.divmod(covered, coverage.shape[1])
+    index = (rows + row_begin) * image.shape[1] + cols + col_begin
+    blended = pixels[index] * (1 - alpha) + np.asarray(COLORS[color], dtype=np.float32) * alpha
+    pixels[index] = np.rint(blended).astype(np.uint8)
+
+def render_raster(drawing: TrackDrawing) -> np.ndarray:
+    """Rasterize the drawing directly into an image, without matplotlib.
+        Every pixel is covered by the distance of its center to the polyline
+        segments, considering the line width in pixels like image_line_width
+        is used by matplotlib at 72 dpi.
+
+        The result is pixel-compatible to render_figure() within a tolerance
+        of 1 pixel along the line borders, because both renderers anti-alias
+        the borders differently. Line positions and widths are the same.
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+
+    Returns:
+        np.ndarray: RGB image with shape (height, width, 3) and dtype uint8.
+    """
+    # Fill row by row, it's much faster than broadcasting a single color.
+    image = np.empty((drawing.height, drawing.width, 3), dtype=np.uint8)
+    image[:] = np.tile(np.asarray(COLORS[drawing.background_color], dtype=np.uint8), (drawing.width, 1)) # pylint: disable=line-too-long
+
+    offset_x, offset_y, scale_x, scale_y = _get_transform(drawing)
+    clip_row_begin, clip_row_end, clip_col_begin, clip_col_end = _get_clip(drawing)
+
+    for kind, x, y, color, line_width, _ in drawing.get_primitives():
+        if len(x) == 0:
+            continue
+
+        # Image coordinates, origin top left.
+        u = (offset_x + x * scale_x).tolist()
+        v = (drawing.height - (offset_y + y * scale_y)).tolist()
+
+        half_width = line_width / 2
+
+        # Maximum distance of a covered pixel to the primitive coordinates.
+        extent = half_width + 1
+
+        if kind == _KIND_POINTS:
+            extent += _MARKER_SIZE / 2
+
+        row_begin, row_end, col_begin, col_end = _get_patch(
+            min(u) - extent,
+            max(u) + extent,
+            min(v) - extent,
+            max(v) + extent,
+            drawing.width,
+            drawing.height)
+
+        row_begin = max(row_begin, clip_row_begin)
+        row_end = min(row_end, clip_row_end)
+        col_begin = max(col_begin, clip_col_begin)
+        col_end = min(col_end, clip_col_end)
+
+        if (row_begin >= row_end) or (col_begin >= col_end):
+            continue
+
+        coverage = np.zeros((row_end - row_begin, col_end - col_begin), dtype=np.float32)
+
+        if kind == _KIND_LINE:
+            last_index = len(u) - 2
+            for index in range(last_index + 1):
+                _add_segment_coverage(  coverage,
+                                        row_begin,
+                                        col_begin,
+                                        (u[index], v[index]),
+                                        (u[index + 1], v[index + 1]),
+                                        half_width,
+                                        (index == 0, index == last_index))
+        else:
+            for center_u, center_v in zip(u, v):
+                # Matplotlib snaps the markers to the pixel grid.
+                center = (np.floor(center_u + 0.5) + 0.5, np.ceil(center_v - 0.5) + 0.5)
+                _add_marker_coverage(coverage, row_begin, col_begin, center, half_width)
+
+        _blend_coverage(image, coverage, row_begin, col_begin, color)
+
+    return image
+
+def _get_items(drawing: TrackDrawing) -> tuple[list[tuple], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: # pylint: disable=line-too-long
+    """Split all primitives of the drawing into items, which are the line
+        segments and the markers in image coordinates.
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+
+    Returns:
+        tuple: Primitives (kind, color, half_width) in drawing order and per item
+            the primitive index, start point, end point (same as start point for markers),
+            caps at start and end, as well as the bounding box (col_min, col_max, row_min, row_max).
+    """
+    offset_x, offset_y, scale_x, scale_y = _get_transform(drawing)
+    primitives = []
+    item_primitives = []
+    points_start = []
+    points_end = []
+    caps = []
+    margins = []
+
+    for kind, x, y, color, line_width, _ in drawing.get_primitives():
+        # Image coordinates, origin top left.
+        u = offset_x + x * scale_x
+        v = drawing.height - (offset_y + y * scale_y)
+        half_width = line_width / 2
+        points = np.column_stack((u, v))
+
+        if kind == _KIND_LINE:
+            num_items = max(len(points) - 1, 0)
+            points_start.append(points[:num_items])
+            points_end.append(points[1:num_items + 1])
+
+            item_caps = np.zeros((num_items, 2), dtype=bool)
+            item_caps[:1, 0] = True
+            item_caps[-1:, 1] = True
+            caps.append(item_caps)
+            margins.append(np.full(num_items, half_width + 1))
+        else:
+            # Matplotlib snaps the markers to the pixel grid.
+            num_items = len(points)
+            points = np.column_stack((np.floor(u + 0.5) + 0.5, np.ceil(v - 0.5) + 0.5))
+            points_start.append(points)
+            points_end.append(points)
+            caps.append(np.zeros((num_items, 2), dtype=bool))
+            margins.append(np.full(num_items, _MARKER_SIZE / 2 + half_width + 1))
+
+        item_primitives.append(np.full(num_items, len(primitives)))
+        primitives.append((kind, color, half_width))
+
+    points_start = np.concatenate(points_start).reshape(-1, 2)
+    points_end = np.concatenate(points_end).reshape(-1, 2)
+    margins = np.concatenate(margins)
+    bboxes = np.column_stack((
+        np.minimum(points_start[:, 0], points_end[:, 0]) - margins,
+        np.maximum(points_start[:, 0], points_end[:, 0]) + margins,
+        np.minimum(points_start[:, 1], points_end[:, 1]) - margins,
+        np.maximum(points_start[:, 1], points_end[:, 1]) + margins))
+
+    return primitives, np.concatenate(item_primitives).astype(int), points_start, points_end, np.concatenate(caps).reshape(-1, 2), bboxes # pylint: disable=line-too-long
+
+def _create_tile_index(bboxes: np.ndarray, tile_size: int, num_tiles_x: int, num_tiles_y: int) -> tuple[np.ndarray, np.ndarray]: # pylint: disable=line-too-long
+    """Create the index of the items per tile by their bounding boxes.
+        An item is listed in every tile its bounding box intersects. Inside a
+        tile, the items keep their order.
+
+    Args:
+        bboxes (np.ndarray): Bounding boxes (col_min, col_max, row_min, row_max) with shape (N, 4).
+        tile_size (int): Tile width and height in pixel.
+        num_tiles_x (int): Number of tiles along the x-axis.
+        num_tiles_y (int): Number of tiles along the y-axis.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Offsets with shape (num tiles + 1) and items.
+            The items of tile i are items[offsets[i]:offsets[i + 1]].
+    """
+    tile_bboxes = np.floor(bboxes / tile_size).astype(int)
+    tile_col_begin = np.clip(tile_bboxes[:, 0], 0, num_tiles_x - 1)
+    tile_col_end = np.clip(tile_bboxes[:, 1], 0, num_tiles_x - 1) + 1
+    tile_row_begin = np.clip(tile_bboxes[:, 2], 0, num_tiles_y - 1)
+    tile_row_end = np.clip(tile_bboxes[:, 3], 0, num_tiles_y - 1) + 1
+
+    num_cols = tile_col_end - tile_col_begin
+    counts = num_cols * (tile_row_end - tile_row_begin)
+
+    # One entry per item and intersected tile.
+    items = np.repeat(np.arange(len(bboxes)), counts)
+    local = np.arange(len(items)) - np.repeat(np.cumsum(counts) - counts, counts)
+    num_cols = np.repeat(num_cols, counts)
+    tiles = (np.repeat(tile_row_begin, counts) + local // num_cols) * num_tiles_x + np.repeat(tile_col_begin, counts) + local % num_cols # pylint: disable=line-too-long
+
+    order = np.argsort(tiles, kind="stable")
+    offsets = np.searchsorted(tiles[order], np.arange(num_tiles_x * num_tiles_y + 1))
+
+    return offsets, items[order]
+
+# pylint: disable=too-many-locals
+def render_tiles(drawing: TrackDrawing, tile_size: int = _TILE_SIZE) -> Iterator[np.ndarray]:
+    """Rasterize the drawing tile by tile, like render_raster() does for the
+        whole image. Only the line segments and markers, whose bounding box
+        intersects a tile, are rendered in it. The image is created as bands
+        of one tile row, therefore the memory depends on the image width and
+        the tile size, but not on the image height.
+
+        The result is the same as of render_raster().
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+        tile_size (int, optional): Tile width and height in pixel. Defaults to _TILE_SIZE.
+
+    Yields:
+        np.ndarray: Band of image rows with shape (rows, width, 3) and dtype uint8.
+    """
+    num_tiles_x = (drawing.width + tile_size - 1) // tile_size
+    num_tiles_y = (drawing.height + tile_size - 1) // tile_size
+    clip_row_begin, clip_row_end, clip_col_begin, clip_col_end = _get_clip(drawing)
+
+    primitives, item_primitives, points_start, points_end, caps, bboxes = _get_items(drawing)
+    offsets, tile_items = _create_tile_index(bboxes, tile_size, num_tiles_x, num_tiles_y)
+    background = np.tile(np.asarray(COLORS[drawing.background_color], dtype=np.uint8), (drawing.width, 1)) # pylint: disable=line-too-long
+
+    for tile_y in range(num_tiles_y):
+        band_row_begin = tile_y * tile_size
+        band = np.empty((min(tile_size, drawing.height - band_row_begin), drawing.width, 3), dtype=np.uint8) # pylint: disable=line-too-long
+        band[:] = background
+
+        row_begin = max(band_row_begin, clip_row_begin)
+        row_end = min(band_row_begin + band.shape[0], clip_row_end)
+
+        for tile_x in range(num_tiles_x):
+            tile = tile_y * num_tiles_x + tile_x
+            col_begin = max(tile_x * tile_size, clip_col_begin)
+            col_end = min((tile_x + 1) * tile_size, drawing.width, clip_col_end)
+
+            if (row_begin >= row_end) or (col_begin >= col_end) or (offsets[tile] == offsets[tile + 1]): # pylint: disable=line-too-long
+                continue
+
+            items = tile_items[offsets[tile]:offsets[tile + 1]]
+            coverage = None
+            primitive_index = -1
+
+            for item_primitive, point_start, point_end, item_caps in zip(item_primitives[items].tolist(), points_start[items].tolist(), points_end[items].tolist(), caps[items].tolist()): # pylint: disable=line-too-long
+                kind, _, half_width = primitives[item_primitive]
+
+                # The coverage of a primitive is blended at once, like by render_raster().
+                if item_primitive != primitive_index:
+                    if coverage is not None:
+                        _blend_coverage(band, coverage, row_begin - band_row_begin, col_begin, primitives[primitive_index][1]) # pylint: disable=line-too-long
+
+                    coverage = np.zeros((row_end - row_begin, col_end - col_begin), dtype=np.float32) # pylint: disable=line-too-long
+                    primitive_index = item_primitive
+
+                if kind == _KIND_LINE:
+                    _add_segment_coverage(coverage, row_begin, col_begin, tuple(point_start), tuple(point_end), half_width, tuple(item_caps)) # pylint: disable=line-too-long
+                else:
+                    _add_marker_coverage(coverage, row_begin, col_begin, tuple(point_start), half_width) # pylint: disable=line-too-long
+
+            _blend_coverage(band, coverage, row_begin - band_row_begin, col_begin, primitives[primitive_index][1]) # pylint: disable=line-too-long
+
+        yield band
+
+def _get_figure_image(fig: Figure) -> np.ndarray:
+    """Get the rendered image of a matplotlib figure.
+
+    Args:
+        fig (Figure): Figure
+
+    Returns:
+        np.ndarray: RGB image with shape (height, width, 3) and dtype uint8.
+    """
+    canvas = fig.canvas
+
+    if isinstance(canvas, FigureCanvasAgg) is False:
+        canvas = FigureCanvasAgg(fig)
+
+    canvas.draw()
+
+    return np.asarray(canvas.buffer_rgba())[:, :, :3]
+
+def _get_figure_render_context() -> FigureRenderContext:
+    if _FIGURE_CONTEXT["renderContext"] is None:
+        _FIGURE_CONTEXT["renderContext"] = FigureRenderContext()
+
+    return _FIGURE_CONTEXT["renderContext"]
+
+def init_render_context() -> None:
+    """Initialize the figure of the matplotlib renderer in advance, so the
+        first track image of a long living process is rendered as fast as
+        all further ones.
+    """
+    _get_figure_render_context()
+
+# pylint: disable=too-many-arguments
+def save_image(drawing: TrackDrawing, image_file_name: str, renderer: str, is_debug_mode: bool, mip_levels: int = 0, image_sink: Union[None, ImageSink] = None) -> None: # pylint: disable=line-too-long
+    """Render the drawing with the selected renderer and write it into the
+        image sink. Optional the mip levels 1..N are derived from the rendered
+        image and written too, see get_mip_file_name().
+
+    Args:
+        drawing (TrackDrawing): The track drawing.
+        image_file_name (str): Image file name.
+        renderer (str): Renderer, see RENDERERS.
+        is_debug_mode (bool): In debug mode the matplotlib figure will be shown.
+        mip_levels (int, optional): Number of mip levels. Defaults to 0.
+        image_sink (Union[None, ImageSink], optional): Image sink. Defaults to None,
+            which saves the images as PNG files.
+    """
+    if image_sink is None:
+        image_sink = FileImageSink()
+
+    if renderer == RENDERER_TILED:
+        # The mip levels are derived band by band, while the image is written.
+        with image_sink.open(image_file_name, drawing.width, drawing.height) as image_writer, \
+             MipPyramidWriter(image_sink, image_file_name, drawing.width, drawing.height, mip_levels) as mip_pyramid_writer: # pylint: disable=line-too-long
+            for band in render_tiles(drawing):
+                image_writer.write(band)
+                mip_pyramid_writer.write(band)
+
+    else:
+        if renderer == RENDERER_NUMPY:
+            image = render_raster(drawing)
+
+        elif is_debug_mode is True:
+            # Only pyplot can show the figure in a window.
+            fig = render_figure(drawing, plt.figure(dpi=_DPI))
+            plt.show()
+
+            image = _get_figure_image(fig)
+            plt.close(fig)
+
+        else:
+            render_context = _get_figure_render_context()
+            render_context.render(drawing)
+            image = render_context.get_image()
+
+        image_sink.write(image_file_name, image)
+
+        if mip_levels > 0:
+            save_mip_pyramid(image_sink, image_file_name, image, mip_levels)
+
+################################################################################
+# Main
+################################################################################
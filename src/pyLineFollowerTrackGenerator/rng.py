@@ -0,0 +1,85 @@
+"""Seeded random number generators, which make the generated tracks reproducible."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from typing import Union
+import numpy as np
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def get_seed(seed: Union[None, int]) -> int:
+    """Get the seed of a track. If no seed is given, a new one is created
+        from fresh entropy, so every track has a seed it can be regenerated with.
+
+    Args:
+        seed (Union[None, int]): Seed or None.
+
+    Returns:
+        int: Seed
+    """
+    return np.random.SeedSequence(seed).entropy
+
+def create_rng(seed: int) -> np.random.Generator:
+    """Create the random number generator for a track.
+        The same seed generates always the same track.
+
+    Args:
+        seed (int): Seed, see get_seed().
+
+    Returns:
+        np.random.Generator: Random number generator
+    """
+    return np.random.default_rng(seed)
+
+def spawn_seeds(seed: int, count: int) -> list[int]:
+    """Spawn independent seeds for several tracks from one root seed.
+        Every track can be regenerated on its own by its spawned seed,
+        independent of the order the tracks are generated in.
+
+    Args:
+        seed (int): Root seed, see get_seed().
+        count (int): Number of seeds to spawn.
+
+    Returns:
+        list[int]: Seeds
+    """
+    children = np.random.SeedSequence(seed).spawn(count)
+
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+################################################################################
+# Main
+################################################################################
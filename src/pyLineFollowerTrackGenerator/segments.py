@@ -0,0 +1,189 @@
+"""Analytic geometry of the track parts, which are lines and circular arcs."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import numpy as np
+
+################################################################################
+# Variables
+################################################################################
+
+# Number of samples of an arc, used to draw it.
+_ARC_SAMPLES = 100
+
+################################################################################
+# Classes
+################################################################################
+
+class LineSegment():
+    """A straight track part from a start to an end point.
+        The parameter t walks along the line in driving direction [0..1].
+    """
+
+    def __init__(self, point_start: tuple[float, float], point_end: tuple[float, float]) -> None:
+        """Create a line.
+
+        Args:
+            point_start (tuple[float, float]): Start point (x, y).
+            point_end (tuple[float, float]): End point (x, y).
+        """
+        self.point_start = np.asarray(point_start, dtype=float)
+        self.point_end = np.asarray(point_end, dtype=float)
+
+    def get_length(self) -> float:
+        """Get the length of the line.
+
+        Returns:
+            float: Length
+        """
+        return float(np.hypot(*(self.point_end - self.point_start)))
+
+    def get_curvature(self) -> float:
+        """Get the curvature of the line.
+
+        Returns:
+            float: Curvature, which is always 0.
+        """
+        return 0.0
+
+    def get_position(self, t: float) -> tuple[float, float]:
+        """Get the position on the line.
+
+        Args:
+            t (float): Parameter [0..1]
+
+        Returns:
+            tuple[float, float]: Position (x, y)
+        """
+        x, y = self.point_start + (self.point_end - self.point_start) * t
+
+        return float(x), float(y)
+
+    def get_tangent(self, t: float) -> tuple[float, float]: # pylint: disable=unused-argument
+        """Get the unit tangent in driving direction.
+
+        Args:
+            t (float): Parameter [0..1]
+
+        Returns:
+            tuple[float, float]: Unit tangent (dx, dy)
+        """
+        dx, dy = (self.point_end - self.point_start) / self.get_length()
+
+        return float(dx), float(dy)
+
+    def sample(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sample the line for drawing.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: x- and y-coordinates
+        """
+        return np.array([self.point_start[0], self.point_end[0]]), np.array([self.point_start[1], self.point_end[1]]) # pylint: disable=line-too-long
+
+class ArcSegment():
+    """A circular arc track part around a center. The angles are measured
+        counter-clockwise from the x-axis and the arc is driven from the
+        start angle to the end angle. The parameter t walks along the arc
+        in driving direction [0..1].
+    """
+
+    def __init__(self, center: tuple[float, float], radius: float, angle_start: float, angle_end: float) -> None: # pylint: disable=line-too-long
+        """Create an arc.
+
+        Args:
+            center (tuple[float, float]): Center (x, y).
+            radius (float): Radius
+            angle_start (float): Angle in rad at the start of the arc.
+            angle_end (float): Angle in rad at the end of the arc.
+        """
+        self.center = np.asarray(center, dtype=float)
+        self.radius = float(radius)
+        self.angle_start = float(angle_start)
+        self.angle_end = float(angle_end)
+
+    def get_length(self) -> float:
+        """Get the length of the arc.
+
+        Returns:
+            float: Length
+        """
+        return self.radius * abs(self.angle_end - self.angle_start)
+
+    def get_curvature(self) -> float:
+        """Get the curvature of the arc.
+
+        Returns:
+            float: Curvature, which is 1 / radius.
+        """
+        return 1.0 / self.radius
+
+    def _get_angle(self, t: float) -> float:
+        return self.angle_start + (self.angle_end - self.angle_start) * t
+
+    def get_position(self, t: float) -> tuple[float, float]:
+        """Get the position on the arc.
+
+        Args:
+            t (float): Parameter [0..1]
+
+        Returns:
+            tuple[float, float]: Position (x, y)
+        """
+        angle = self._get_angle(t)
+
+        return float(self.center[0] + self.radius * np.cos(angle)), float(self.center[1] + self.radius * np.sin(angle)) # pylint: disable=line-too-long
+
+    def get_tangent(self, t: float) -> tuple[float, float]:
+        """Get the unit tangent in driving direction.
+
+        Args:
+            t (float): Parameter [0..1]
+
+        Returns:
+            tuple[float, float]: Unit tangent (dx, dy)
+        """
+        angle = self._get_angle(t)
+        direction = np.sign(self.angle_end - self.angle_start)
+
+        return float(-direction * np.sin(angle)), float(direction * np.cos(angle))
+
+    def sample(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sample the arc for drawing.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: x- and y-coordinates
+        """
+        angles = np.linspace(self.angle_start, self.angle_end, _ARC_SAMPLES)
+
+        return self.center[0] + self.radius * np.cos(angles), self.center[1] + self.radius * np.sin(angles) # pylint: disable=line-too-long
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
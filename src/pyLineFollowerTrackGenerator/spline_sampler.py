@@ -0,0 +1,158 @@
+"""Adaptive sampling of a spline, driven by its curvature."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from typing import Any, Union
+import numpy as np
+from scipy.interpolate import splev
+
+################################################################################
+# Variables
+################################################################################
+
+# Number of initial samples per knot span, before the adaptive subdivision.
+_INITIAL_SAMPLES_PER_SPAN = 2
+
+# Positions inside an interval, where the deviation from the chord is checked.
+_PROBES = (0.25, 0.5, 0.75)
+
+# Max. number of subdivisions of an initial interval.
+_MAX_DEPTH = 16
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_initial_u(tck: Any) -> np.ndarray:
+    # Every knot span is sampled, which avoids that a feature between two
+    # samples is missed.
+    knots = np.unique(np.clip(tck[0], 0.0, 1.0))
+    knots = np.union1d(knots, [0.0, 1.0])
+
+    spans = np.linspace(knots[:-1], knots[1:], _INITIAL_SAMPLES_PER_SPAN, endpoint=False, axis=1)
+
+    return np.append(spans.ravel(), 1.0)
+
+# pylint: disable=too-many-locals, line-too-long
+def _get_deviation(tck: Any, u_begin: np.ndarray, u_end: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Get the deviation of the spline from the chords between the samples
+        and the chord lengths. The deviation is the max. of the measured
+        distances of the spline to the chord at the probes inside the interval
+        and the sagitta, which is estimated by the curvature at the probes.
+        Several probes detect a turning point inside the interval too.
+
+    Args:
+        tck (tuple[t,c,k]): Vector of knots, the B-spline coefficients, and the degree of the spline.
+        u_begin (np.ndarray): Spline parameters of the chord begins.
+        u_end (np.ndarray): Spline parameters of the chord ends.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Deviations and chord lengths
+    """
+    x_begin, y_begin = splev(u_begin, tck, der=0)
+    x_end, y_end = splev(u_end, tck, der=0)
+
+    chord_x = x_end - x_begin
+    chord_y = y_end - y_begin
+    chord_lengths = np.hypot(chord_x, chord_y)
+    deviations = np.zeros_like(chord_lengths)
+
+    for probe in _PROBES:
+        u_probe = u_begin + (u_end - u_begin) * probe
+
+        x_probe, y_probe = splev(u_probe, tck, der=0)
+        dx, dy = splev(u_probe, tck, der=1)
+        ddx, ddy = splev(u_probe, tck, der=2)
+
+        # Distance of the spline to the chord. A chord without length has
+        # no direction, in this case the distance to its begin is used.
+        cross = np.abs(chord_x * (y_probe - y_begin) - chord_y * (x_probe - x_begin))
+        distance = np.hypot(x_probe - x_begin, y_probe - y_begin)
+        distance = np.divide(cross, chord_lengths, out=distance, where=chord_lengths > 0)
+
+        # Sagitta of a circular arc with the curvature at the probe.
+        speed = np.hypot(dx, dy)
+        curvature = np.divide(np.abs(dx * ddy - dy * ddx), speed ** 3, out=np.zeros_like(speed), where=speed > 0)
+        sagitta = curvature * chord_lengths ** 2 / 8
+
+        deviations = np.maximum(deviations, np.maximum(distance, sagitta))
+
+    return deviations, chord_lengths
+
+def get_u_adaptive(tck: Any, tolerance: float, max_step: Union[None, float] = None) -> np.ndarray:
+    """Get the spline parameters of samples, which approximate the spline by
+        a polyline within the tolerance. Intervals are only subdivided where
+        the spline deviates from the chord more than the tolerance, therefore
+        straight parts get only a few samples and tight curves many.
+
+    Args:
+        tck (tuple[t,c,k]): Vector of knots, the B-spline coefficients, and the degree of the spline.
+        tolerance (float): Max. deviation of the polyline from the spline in the unit of the spline points.
+        max_step (Union[None, float]): Max. distance between two samples in the unit of the spline points.
+            If None, the distance is not limited.
+
+    Returns:
+        np.ndarray: Spline parameters u [0..1]
+    """
+    u = _get_initial_u(tck)
+
+    # Only intervals, which were subdivided in the previous step, are checked again.
+    is_active = np.ones(len(u) - 1, dtype=bool)
+
+    for _ in range(_MAX_DEPTH):
+        indices = np.nonzero(is_active)[0]
+
+        if len(indices) == 0:
+            break
+
+        deviations, chord_lengths = _get_deviation(tck, u[indices], u[indices + 1])
+        is_split = deviations > tolerance
+
+        if max_step is not None:
+            is_split |= chord_lengths > max_step
+
+        split_indices = indices[is_split]
+
+        # Position of every interval after the new samples are inserted.
+        is_split_all = np.zeros(len(u) - 1, dtype=bool)
+        is_split_all[split_indices] = True
+        interval_pos = np.arange(len(u) - 1) + np.concatenate(([0], np.cumsum(is_split_all)[:-1]))
+
+        u = np.insert(u, split_indices + 1, (u[split_indices] + u[split_indices + 1]) / 2)
+
+        is_active = np.zeros(len(u) - 1, dtype=bool)
+        is_active[interval_pos[split_indices]] = True
+        is_active[interval_pos[split_indices] + 1] = True
+
+    return u
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,517 @@
+"""Generate a Webots world with a line follower track in a square arena,
+    defined by the user in a grid with a fixed point to point length.
+"""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from typing import Union
+import numpy as np
+import matplotlib.pyplot as plt
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
+from pyLineFollowerTrackGenerator.base.fields import SFString
+from pyLineFollowerTrackGenerator.base.world_file import WorldFile
+from pyLineFollowerTrackGenerator.base.proto import Proto
+from pyLineFollowerTrackGenerator.util import (
+    get_world_and_image_file_name, create_world_info,
+    create_viewpoint, create_rectangle_arena,
+    create_textured_background, create_textured_background_light,
+    add_friction_to_world, generate_start_stop_line_at, get_start_stop_line_width,
+    get_start_stop_line_distance_to_middle, get_metrics_file_name
+)
+from pyLineFollowerTrackGenerator.rng import get_seed, create_rng
+from pyLineFollowerTrackGenerator.render import (
+    TrackDrawing, render_figure, save_image
+)
+from pyLineFollowerTrackGenerator.mipmap import get_max_mip_level
+from pyLineFollowerTrackGenerator.image_sink import ImageSink, FileImageSink
+from pyLineFollowerTrackGenerator.metrics import get_metrics, save_metrics
+from pyLineFollowerTrackGenerator.segments import LineSegment, ArcSegment
+from pyLineFollowerTrackGenerator.grid_file import load_grid, GridFileError
+
+# pylint: disable=R0801
+
+################################################################################
+# Variables
+################################################################################
+_NUM_OF_POINTS_MIN = 2
+_BASIC_TIME_STEP = 8 # [ms]
+
+_QUADRANT = [
+    # dx, dy, quadrant
+    ( 1,  1, 1),
+    (-1,  1, 2),
+    (-1, -1, 3),
+    ( 1, -1, 4)
+]
+
+_ANGLES = [
+    # direction vector (x, y)   quadrant    angle start, end    new direction
+
+    ( 0,  1,    1,      1/2 * np.pi,    1   * np.pi,     1,  0),    # north / curve to right / west
+    (-1,  0,    1,      0   * np.pi,    0   * np.pi,     0,  0),    # west / n.a. / n.a.
+    ( 0, -1,    1,      0   * np.pi,    0   * np.pi,     0,  0),    # south / n.a. / n. a.
+    ( 1,  0,    1,      3/2 * np.pi,    2   * np.pi,     0,  1),    # east / curve to left / north
+
+    ( 0,  1,    2,      0   * np.pi,    1/2 * np.pi,    -1,  0),    # north / curve to left / west
+    (-1,  0,    2,      1   * np.pi,    3/2 * np.pi,     0,  1),    # west / curve to right / north
+    ( 0, -1,    2,      0   * np.pi,    0   * np.pi,     0,  0),    # south / n.a. / n.a.
+    ( 1,  0,    2,      0   * np.pi,    0   * np.pi,     0,  0),    # east / n.a. / n.a.
+
+    ( 0,  1,    3,      0   * np.pi,    0   * np.pi,     0,  0),    # north / n.a. / n.a.
+    (-1,  0,    3,      1/2 * np.pi,    1   * np.pi,     0, -1),    # west / curve to left / south
+    ( 0, -1,    3,      3/2 * np.pi,    2   * np.pi,    -1,  0),    # south / curve to right / west
+    ( 1,  0,    3,      0   * np.pi,    0   * np.pi,     0,  0),    # east / n.a. / n.a.
+
+    ( 0,  1,    4,      0   * np.pi,    0   * np.pi,     0,  0),    # north / n.a. / n.a.
+    (-1,  0,    4,      0   * np.pi,    0   * np.pi,     0,  0),    # west / n.a. / n.a.
+    ( 0, -1,    4,      1   * np.pi,    3/2 * np.pi,     1,  0),    # south / curve to left / east
+    ( 1,  0,    4,      0   * np.pi,    1/2 * np.pi,     0, -1),    # east / curve to right / south
+]
+
+_CENTER = [
+    # direction vector (x, y)   quadrant    point x, point y
+
+    ( 0,  1,    1,      "e", "s"),  # north / curve to right / x from end point / y from start point
+    (-1,  0,    1,      "", ""),    # west / n.a. / n.a. / n.a.
+    ( 0, -1,    1,      "", ""),    # south / n.a. / n.a. / n.a.
+    ( 1,  0,    1,      "s", "e"),  # east / curve to left / x from start point / y from end point
+
+    ( 0,  1,    2,      "e", "s"),  # north / curve to left / x from end point / y from start point
+    (-1,  0,    2,      "s", "e"),  # west / curve to right / x from start point / y from end point
+    ( 0, -1,    2,      "", ""),    # south / n.a. / n.a. / n.a.
+    ( 1,  0,    2,      "", ""),    # east / n.a. / n.a. / n.a.
+
+    ( 0,  1,    3,      "", ""),    # north / n.a. / n.a. / n.a.
+    (-1,  0,    3,      "s", "e"),  # west / curve to left / x from start point / y from end point
+    ( 0, -1,    3,      "e", "s"),  # south / curve to right / x from end point / y from start point
+    ( 1,  0,    3,      "", ""),    # east / n.a. / n.a. / n.a.
+
+    ( 0,  1,    4,      "", ""),    # north / n.a. / n.a. / n.a.
+    (-1,  0,    4,      "", ""),    # west / n.a. / n.a. / n.a.
+    ( 0, -1,    4,      "e", "s"),  # south / curve to left / x from end point / y from start point
+    ( 1,  0,    4,      "s", "e"),  # east / curve to right / x from start point / y from end point
+]
+
+# The turn tables are integer encoded by the driving direction and the quadrant
+# of the next point, see _get_turn_key(). Unknown turns have a zero length arc
+# with the center in the origin and no new driving direction.
+_TURN_TABLE_SIZE = 9 * 5
+
+# pylint: disable=line-too-long
+_ANGLES_BY_KEY = {
+    ((d_vec_x + 1) * 3 + (d_vec_y + 1)) * 5 + q: (angle_start, angle_end, dir_vec_x_new, dir_vec_y_new)
+    for (d_vec_x, d_vec_y, q, angle_start, angle_end, dir_vec_x_new, dir_vec_y_new) in _ANGLES
+}
+
+_CENTER_BY_KEY = {
+    ((d_vec_x + 1) * 3 + (d_vec_y + 1)) * 5 + q: ("s" != x_source, "s" != y_source)
+    for (d_vec_x, d_vec_y, q, x_source, y_source) in _CENTER
+}
+
+_TURN_ANGLES = np.array([_ANGLES_BY_KEY.get(key, (0, 0, 0, 0)) for key in range(_TURN_TABLE_SIZE)])
+_TURN_CENTER_FROM_END = np.array([_CENTER_BY_KEY.get(key, (False, False)) for key in range(_TURN_TABLE_SIZE)])
+_TURN_IS_KNOWN = np.array([key in _CENTER_BY_KEY for key in range(_TURN_TABLE_SIZE)])
+
+# Quadrant of the next point by the signs of the x- and y-distance, index is sign + 1.
+_QUADRANT_BY_DELTA = {(delta_x, delta_y): q for (delta_x, delta_y, q) in _QUADRANT}
+_QUADRANT_BY_SIGN = np.array([[_QUADRANT_BY_DELTA.get((sign_x, sign_y), 0) for sign_y in (-1, 0, 1)] for sign_x in (-1, 0, 1)])
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_turn_key(dir_vec_x: np.ndarray, dir_vec_y: np.ndarray, quadrant: np.ndarray) -> np.ndarray:
+    return ((dir_vec_x + 1) * 3 + (dir_vec_y + 1)) * 5 + quadrant
+
+# pylint: disable=too-many-locals
+def resolve_turns(pixel_points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Resolve all lines and quarter circles of the track in one pass.
+
+        The driving direction before a part depends only on the last line
+        before it and the number of quarter circles since then, because every
+        quarter circle changes between the x- and the y-axis. Therefore the
+        driving directions are determined by cumulative sums instead of
+        walking along the track. A quarter circle, which doesn't fit to the
+        driving direction, stops the driving direction until the next line.
+
+    Args:
+        pixel_points (np.ndarray): Points in pixels with shape (N, 2).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            Flags which parts are lines, the centers with shape (N - 1, 2),
+            radii, start angles and end angles of the quarter circles.
+            The angles are in driving direction.
+    """
+    pixel_points = np.asarray(pixel_points, dtype=float)
+    point_start = pixel_points[:-1]
+    point_end = pixel_points[1:]
+    deltas = point_end - point_start
+    signs = np.sign(deltas).astype(int)
+    num_parts = len(deltas)
+
+    is_line = (deltas[:, 0] == 0) | (deltas[:, 1] == 0)
+    is_arc = ~is_line
+    indices = np.arange(num_parts)
+
+    # Driving direction after the last line, the track starts in x-direction.
+    last_line = np.maximum.accumulate(np.where(is_line, indices, -1))
+    line_dirs = np.vstack(([[1, 0]], signs))[last_line + 1]
+
+    # Number of quarter circles since the last line, including the part itself.
+    num_arcs = np.cumsum(is_arc)
+    num_arcs_since_line = num_arcs - np.where(last_line >= 0, num_arcs[np.maximum(last_line, 0)], 0)
+
+    # Driving direction before every quarter circle. After a quarter circle the
+    # direction is along the other axis, with the sign of its distance on it.
+    is_in_x = (line_dirs[:, 1] == 0) ^ (np.maximum(num_arcs_since_line - 1, 0) % 2 == 1)
+    previous_signs = np.vstack(([[0, 0]], signs[:-1]))
+    arc_dirs = np.where(is_in_x[:, np.newaxis], previous_signs * [1, 0], previous_signs * [0, 1])
+    dirs = np.where((num_arcs_since_line <= 1)[:, np.newaxis], line_dirs, arc_dirs)
+
+    keys = _get_turn_key(dirs[:, 0], dirs[:, 1], _QUADRANT_BY_SIGN[signs[:, 0] + 1, signs[:, 1] + 1])
+    angles = _TURN_ANGLES[keys]
+
+    # A quarter circle, which doesn't fit, has no new driving direction.
+    # All quarter circles after it until the next line are unknown.
+    is_fitting = (angles[:, 2] != 0) | (angles[:, 3] != 0)
+    num_not_fitting = np.cumsum(is_arc & ~is_fitting)
+    num_not_fitting_before = np.concatenate(([0], num_not_fitting[:-1]))
+    num_not_fitting_at_line = np.where(last_line >= 0, num_not_fitting[np.maximum(last_line, 0)], 0)
+    is_known = _TURN_IS_KNOWN[keys] & (num_not_fitting_before == num_not_fitting_at_line)
+    is_known &= (dirs[:, 0] != 0) | (dirs[:, 1] != 0)
+
+    angle_start = np.where(is_known, angles[:, 0], 0.0)
+    angle_end = np.where(is_known, angles[:, 1], 0.0)
+    centers = np.where(_TURN_CENTER_FROM_END[keys], point_end, point_start)
+    centers[~is_known] = 0.0
+    radii = np.abs(deltas[:, 0])
+
+    # The angles are ordered counter-clockwise, but the arc is driven from the start point.
+    distances = np.hypot(centers[:, 0] + radii * np.cos(angle_start) - point_start[:, 0],
+                         centers[:, 1] + radii * np.sin(angle_start) - point_start[:, 1])
+    is_reverse = distances > radii / 2
+    angle_start, angle_end = np.where(is_reverse, angle_end, angle_start), np.where(is_reverse, angle_start, angle_end)
+
+    return is_line, centers, radii, angle_start, angle_end
+
+# pylint: disable=line-too-long
+def create_track_segments(points: list[list[int]], grid_point_distance: float, border_x: float, border_y: float) -> tuple[list, list[list[float]]]:
+    """Create the analytic geometry of the track in the grid. Every part of
+        the track between two points is a line or a quarter circle.
+
+    Args:
+        points (list[list[int]]): List of points in the grid.
+        grid_point_distance (float): The distance between two points in the grid in pixel.
+        border_x (float): Border on the x-axis in pixels.
+        border_y (float): Border on the y-axis in pixels.
+
+    Returns:
+        tuple[list, list[list[float]]]: Segments (LineSegment or ArcSegment) and the points in pixels.
+    """
+    segments = []
+
+    # Consider grid point distance and border.
+    pixel_points = np.asarray(points, dtype=float).reshape(-1, 2) * grid_point_distance + [border_x, border_y]
+
+    is_line, centers, radii, angles_start, angles_end = resolve_turns(pixel_points)
+
+    for index, is_line_segment in enumerate(is_line.tolist()):
+        if is_line_segment is True:
+            segments.append(LineSegment(pixel_points[index], pixel_points[index + 1]))
+        else:
+            segments.append(ArcSegment(centers[index], radii[index], angles_start[index], angles_end[index]))
+
+    return segments, pixel_points.tolist()
+
+def _get_start_stop_line_parameter(segment) -> float:
+    """Get the parameter of the start-/stop-line on a track part. It is at
+        the begin of the part, but on a quarter circle at its begin in
+        counter-clockwise direction, independent of the driving direction.
+
+    Args:
+        segment (obj): Track part (LineSegment or ArcSegment).
+
+    Returns:
+        float: Parameter [0..1]
+    """
+    t = 0.0
+
+    if isinstance(segment, ArcSegment) and (segment.angle_end < segment.angle_start):
+        t = 1.0
+
+    return t
+
+# pylint: disable=too-many-arguments, line-too-long, too-many-locals
+def create_track_drawing(points: list[list[int]], image_width: int, image_height: int, image_line_width: int, grid_point_distance: float, pixel_per_m: float, start_stop_line_locations: list[bool], is_debug_mode: bool) -> TrackDrawing:
+    """Create the renderer independent drawing of the line follower track.
+
+    Args:
+        points (list[list[int]]): List of points in the grid.
+        image_width (int): Image width in pixels.
+        image_height (int): Image height in pixels.
+        image_line_width (int): The line follower line width in pixels.
+        grid_point_distance (int): The distance between two points in the grid in pixel.
+        pixel_per_m (float): Conversion factor pixel per m.
+        start_stop_line_locations (list[bool]): Locations of start-/stop-line.
+        is_debug_mode (bool): In debug mode the image will get additional information.
+
+    Returns:
+        TrackDrawing: Track drawing
+    """
+    line_color = "black"
+    line_points_color = "red"
+    start_stop_line_color = line_color
+    background_color = "white"
+
+    # In debug mode show the start-/stop-line in different color.
+    if is_debug_mode is True:
+        start_stop_line_color = "orange"
+
+    # Ensure that a unit on x-axis is equal to a unit on y-axis.
+    drawing = TrackDrawing(image_width, image_height, background_color, is_aspect_equal=True)
+
+    border_size = 10 # [%]
+    border_x = image_width * (2 * border_size) // 100
+    border_y = image_height * (2 * border_size) // 100
+
+    segments, pixel_points = create_track_segments(points, grid_point_distance, border_x, border_y)
+
+    # The start-/stop-line flag of a point belongs to the segment, which ends in it.
+    for segment, start_stop_line_location in zip(segments, start_stop_line_locations[1:]):
+
+        # Plot the line.
+        x_data, y_data = segment.sample()
+
+        if isinstance(segment, LineSegment):
+            drawing.add_line(x_data, y_data, line_color, image_line_width, zorder=1)
+        else:
+            drawing.add_line(x_data, y_data, line_color, image_line_width)
+
+        # Plot start- and stop-line
+        if start_stop_line_location is True:
+            t = _get_start_stop_line_parameter(segment)
+            x, y = segment.get_position(t)
+            dx, dy = segment.get_tangent(t)
+
+            x_perpendicular_low, y_perpendicular_low, \
+            x_perpendicular_high, y_perpendicular_high = \
+                generate_start_stop_line_at(x,
+                                            y,
+                                            dx,
+                                            dy,
+                                            int(get_start_stop_line_distance_to_middle() * pixel_per_m),
+                                            int(get_start_stop_line_width() * pixel_per_m))
+
+            drawing.add_line(x_perpendicular_low, y_perpendicular_low, start_stop_line_color, image_line_width, zorder=2)
+            drawing.add_line(x_perpendicular_high, y_perpendicular_high, start_stop_line_color, image_line_width, zorder=2)
+
+    # Show the points used for generation in debug mode.
+    if is_debug_mode is True:
+
+        # Convert the points to separate x- and y-coordinates.
+        x_points = [point[0] for point in pixel_points]
+        y_points = [point[1] for point in pixel_points]
+
+        drawing.add_points(x_points, y_points, line_points_color, image_line_width, zorder=2)
+
+    return drawing
+
+# pylint: disable=too-many-arguments, line-too-long
+def generate_track_image(points: list[list[int]], image_width: int, image_height: int, image_line_width: int, grid_point_distance: float, pixel_per_m: float, start_stop_line_locations: list[bool], is_debug_mode: bool) -> plt.Figure:
+    """Generate the image with the line follower track.
+
+    Args:
+        points (list[list[int]]): List of points in the grid.
+        image_width (int): Image width in pixels.
+        image_height (int): Image height in pixels.
+        image_line_width (int): The line follower line width in pixels.
+        grid_point_distance (int): The distance between two points in the grid in pixel.
+        pixel_per_m (float): Conversion factor pixel per m.
+        start_stop_line_locations (list[bool]): Locations of start-/stop-line.
+        is_debug_mode (bool): In debug mode the image will get additional information.
+
+    Returns:
+        plt.Figure: Figure
+    """
+    drawing = create_track_drawing( points,
+                                    image_width,
+                                    image_height,
+                                    image_line_width,
+                                    grid_point_distance,
+                                    pixel_per_m,
+                                    start_stop_line_locations,
+                                    is_debug_mode)
+
+    return render_figure(drawing)
+
+# pylint: disable=line-too-long
+def _get_track_metrics(points: list[list[int]], point_distance: float, start_stop_line_locations: list[bool]) -> dict:
+    """Get the geometry metrics of the track in the grid. Every part of the
+        track is a line or a quarter circle.
+
+    Args:
+        points (list[list[int]]): List of points in the grid.
+        point_distance (float): The distance between two points in the grid in m.
+        start_stop_line_locations (list[bool]): Locations of start-/stop-line.
+
+    Returns:
+        dict: Metrics
+    """
+    grid_points = np.asarray(points, dtype=float) * point_distance
+    deltas = np.abs(np.diff(grid_points, axis=0))
+    is_line = (deltas[:, 0] == 0) | (deltas[:, 1] == 0)
+
+    # A quarter circle has the distance on the x-axis as radius.
+    lengths = np.where(is_line, deltas.sum(axis=1), np.pi / 2 * deltas[:, 0])
+    curvatures = np.divide(1.0, deltas[:, 0], out=np.zeros_like(lengths), where=~is_line)
+
+    # The start-/stop-line is drawn on the part to the point with the flag.
+    segments, _ = create_track_segments(points, point_distance, 0, 0)
+    parameters = np.array([_get_start_stop_line_parameter(segment) for segment in segments])
+    positions = np.cumsum(lengths) - lengths + parameters * lengths
+    start_stop_line_positions = positions[np.asarray(start_stop_line_locations[1:], dtype=bool)]
+
+    is_closed = bool(np.all(grid_points[0] == grid_points[-1]))
+
+    return get_metrics(lengths, curvatures, start_stop_line_positions, is_closed)
+
+# pylint: disable=too-many-locals, too-many-statements
+def generate_world(args, image_sink: Union[None, ImageSink] = None) -> Ret:
+    """Generate the Webots world with the line follower track defined in the grid.
+
+    Args:
+        args (obj): Program arguments
+        image_sink (Union[None, ImageSink], optional): Image sink of the track images.
+            Defaults to None, which saves them as PNG files with the PNG arguments.
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    ret_status          = Ret.OK
+    world_title         = args.title
+    world_author        = args.author
+    world_email         = args.email
+    world_description   = args.desc
+    image_width         = args.imageSize # [pixel]
+    image_height        = args.imageSize # [pixel]
+    image_line_width    = args.imageSize * args.lineWidth // args.size # [pixel]
+    arena_width         = args.size # [m]
+    arena_height        = args.size # [m]
+    pixel_per_m         = args.imageSize / args.size # [pixel/m]
+    grid_point_distance = args.pointDistance * pixel_per_m # [pixel]
+    is_debug_mode       = args.debug
+    material_ground     = args.materialGround
+    material_robot      = args.materialRobot
+    material_property   = args.materialProperty
+    renderer            = args.renderer
+    mip_levels          = min(args.mipLevels, get_max_mip_level(image_width, image_height))
+    arena_mip_level     = min(args.arenaMipLevel, mip_levels)
+    seed                = get_seed(args.seed)
+    rng                 = create_rng(seed)
+
+    world_file_name, image_file_name = get_world_and_image_file_name(args.worldFileName[0])
+
+    # Without a given sink, the track images are saved as PNG files next to the world.
+    if image_sink is None:
+        image_sink = FileImageSink(args.pngCompression, args.pngFilter, args.pngMode)
+
+    world_info = create_world_info(world_title, world_description, world_author, world_email, _BASIC_TIME_STEP, seed) # pylint: disable=line-too-long
+    viewpoint = create_viewpoint(arena_width, arena_height)
+
+    proto_textured_background = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/backgrounds/protos/TexturedBackground.proto") # pylint: disable=line-too-long
+    textured_background = create_textured_background()
+
+    proto_textured_background_light = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/backgrounds/protos/TexturedBackgroundLight.proto") # pylint: disable=line-too-long
+    textured_background_light = create_textured_background_light()
+
+    proto_rectangle_arena = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/floors/protos/RectangleArena.proto") # pylint: disable=line-too-long
+    rectangle_arena = create_rectangle_arena(arena_width, arena_height, image_file_name, arena_mip_level)
+
+    if add_friction_to_world(world_info, material_ground, material_robot, material_property, rng) is True: # pylint: disable=line-too-long
+        rectangle_arena.add_fields(
+            SFString("contactMaterial", material_ground)
+        )
+
+    world_file = WorldFile([
+        proto_textured_background,
+        proto_textured_background_light,
+        proto_rectangle_arena
+    ], [
+        world_info,
+        viewpoint,
+        textured_background,
+        textured_background_light,
+        rectangle_arena
+    ])
+
+    points = []
+    start_stop_line_locations = []
+
+    try:
+        points, start_stop_lines = load_grid(args.gridFileName[0])
+        start_stop_line_locations = start_stop_lines.tolist()
+    except (OSError, GridFileError) as error:
+        print(f"Failed to load {args.gridFileName[0]}: {error}")
+        ret_status = Ret.ERROR
+
+    if ret_status != Ret.OK:
+        pass
+    elif len(points) < _NUM_OF_POINTS_MIN:
+        print(f"Min. number of points are {_NUM_OF_POINTS_MIN}.\n")
+        ret_status = Ret.ERROR
+    else:
+        metrics = _get_track_metrics(points, args.pointDistance, start_stop_line_locations)
+        metrics["seed"] = seed
+
+        drawing = create_track_drawing( points,
+                                        image_width,
+                                        image_height,
+                                        image_line_width,
+                                        grid_point_distance,
+                                        pixel_per_m,
+                                        start_stop_line_locations,
+                                        is_debug_mode)
+
+        # Save image in filesystem or the given sink.
+        save_image(drawing, image_file_name, renderer, is_debug_mode, mip_levels, image_sink)
+
+        code_format = CodeFormat()
+        world_file.save(world_file_name, code_format)
+
+        # Save the track metrics next to the world, to filter tracks without rendering them.
+        save_metrics(metrics, get_metrics_file_name(world_file_name))
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
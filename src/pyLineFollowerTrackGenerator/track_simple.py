@@ -0,0 +1,313 @@
+"""Generate a Webots world with a simple line follower track in a square arena."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from typing import Union
+import numpy as np
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.base.code_format import CodeFormat
+from pyLineFollowerTrackGenerator.base.fields import SFString
+from pyLineFollowerTrackGenerator.base.world_file import WorldFile
+from pyLineFollowerTrackGenerator.base.proto import Proto
+from pyLineFollowerTrackGenerator.util import (
+    get_world_and_image_file_name, create_world_info,
+    create_viewpoint, create_rectangle_arena,
+    create_textured_background, create_textured_background_light,
+    add_friction_to_world, create_track_drawing, generate_valid_points,
+    create_track_metrics, get_metrics_file_name
+)
+from pyLineFollowerTrackGenerator.rng import get_seed, create_rng
+from pyLineFollowerTrackGenerator.render import save_image
+from pyLineFollowerTrackGenerator.mipmap import get_max_mip_level
+from pyLineFollowerTrackGenerator.image_sink import ImageSink, FileImageSink
+from pyLineFollowerTrackGenerator.metrics import save_metrics
+
+# pylint: disable=R0801
+
+################################################################################
+# Variables
+################################################################################
+_NUM_OF_POINTS_MIN = 8
+_BASIC_TIME_STEP = 8 # [ms]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+# pylint: disable=line-too-long, too-many-arguments
+def _generate_points_along_x(distance, x_base, x_tolerance, y_base, y_tolerance, positive, jitter) -> np.ndarray:
+    """Generate points along the x-axis with a random y-coordinate for several
+        tracks at once. The jitter contains the uniform random values [0; 1)
+        of the y-coordinates with shape (num_tracks, num_points).
+
+    Returns:
+        np.ndarray: Point coordinates (x, y) with shape (num_tracks, num_points, 2).
+    """
+    direction = 1 if positive is True else -1
+    num_points = jitter.shape[1]
+    y_low = y_base - y_tolerance / 2
+    y_high = y_base + y_tolerance
+    points = np.empty(jitter.shape + (2,))
+
+    points[:, :, 0] = x_base + direction * distance * np.arange(num_points) + x_tolerance
+    points[:, :, 1] = y_low + (y_high - y_low) * jitter + y_tolerance
+
+    return points
+
+# pylint: disable=line-too-long, too-many-arguments
+def _generate_points_along_y(distance, x_base, x_tolerance, y_base, y_tolerance, positive, jitter) -> np.ndarray:
+    """Generate points along the y-axis with a random x-coordinate for several
+        tracks at once. The jitter contains the uniform random values [0; 1)
+        of the x-coordinates with shape (num_tracks, num_points).
+
+    Returns:
+        np.ndarray: Point coordinates (x, y) with shape (num_tracks, num_points, 2).
+    """
+    direction = 1 if positive is True else -1
+    num_points = jitter.shape[1]
+    x_low = x_base - x_tolerance / 2
+    x_high = x_base + x_tolerance
+    points = np.empty(jitter.shape + (2,))
+
+    points[:, :, 0] = x_low + (x_high - x_low) * jitter + x_tolerance
+    points[:, :, 1] = y_base + direction * distance * np.arange(num_points) + y_tolerance
+
+    return points
+
+def _draw_jitter(num_tracks: int, num_points_per_side: list[int], rng: np.random.Generator) -> list[np.ndarray]:
+    """Draw the random coordinates of all sides of several tracks at once.
+        Every track gets its values in the order the sides are walked, so
+        the first track is the same as a single track of the same generator.
+
+    Args:
+        num_tracks (int): Number of tracks.
+        num_points_per_side (list[int]): Number of points of every side.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        list[np.ndarray]: Uniform random values [0; 1) of every side with shape (num_tracks, num_points).
+    """
+    jitter = rng.uniform(size=(num_tracks, sum(num_points_per_side)))
+
+    return np.split(jitter, np.cumsum(num_points_per_side)[:-1], axis=1)
+
+# pylint: disable=too-many-locals, line-too-long
+def generate_tracks_along_rectangle(num_tracks, num_points, rect_width, rect_height, rng) -> np.ndarray:
+    """Generate a number of points along a virtual rectangle with the given
+        width/height for several tracks at once. The random coordinates of
+        all tracks are drawn with a single call of the generator.
+
+    Args:
+        num_tracks (int): Number of tracks to generate.
+        num_points (int): Number of points to generate.
+        rect_width (int): Virtual rectangle width in pixels.
+        rect_height (int): Virtual rectangle height in pixels.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        np.ndarray: Point coordinates (x, y) with shape (num_tracks, N, 2).
+    """
+    num_points_on_x_axis = num_points * rect_width // (2 * (rect_width + rect_height))
+    num_points_on_y_axis = num_points * rect_height // (2 * (rect_width + rect_height))
+    tolerance = 10 # [%]
+    width = rect_width * (100 - 2 * tolerance) // 100
+    height = rect_height * (100 - 2 * tolerance) // 100
+    x_tolerance = width * tolerance // 100
+    y_tolerance = height * tolerance // 100
+    distance_x = width // num_points_on_x_axis
+    distance_y = height // num_points_on_y_axis
+
+    #
+    #   *------*
+    #   |      |
+    #   |      |
+    #   |      |
+    #   *------*
+    #
+    # -----------------------> x
+    #
+
+    # Draw the random coordinates of all sides and tracks at once.
+    jitters = _draw_jitter(num_tracks, [num_points_on_x_axis, num_points_on_y_axis, num_points_on_x_axis, num_points_on_y_axis], rng)
+
+    # Walk along x-axis in positive direction
+    x_base = 0
+    y_base = 0
+    points1 = _generate_points_along_x(distance_x, x_base, x_tolerance, y_base, y_tolerance, True, jitters[0])
+
+    # Walk along y-axis in positive direction
+    x_base = width - 1
+    y_base = 0
+    points2 = _generate_points_along_y(distance_y, x_base, x_tolerance, y_base, y_tolerance, True, jitters[1])
+
+    # Walk along x-axis in negative direction
+    x_base = width - 1
+    y_base = height - 1
+    points3 = _generate_points_along_x(distance_x, x_base, x_tolerance, y_base, y_tolerance, False, jitters[2])
+
+    # Walk along y-axis in negative direction
+    x_base = 0
+    y_base = height - 1
+    points4 = _generate_points_along_y(distance_y, x_base, x_tolerance, y_base, y_tolerance, False, jitters[3])
+
+    return np.concatenate((points1, points2, points3, points4), axis=1)
+
+# pylint: disable=line-too-long
+def _generate_points_along_rectangle(num_points, rect_width, rect_height, rng) -> np.ndarray:
+    """Generate a number of points along a virtual rectangle with the given
+        width/height.
+
+    Args:
+        num_points (int): Number of points to generate.
+        rect_width (int): Virtual rectangle width in pixels.
+        rect_height (int): Virtual rectangle height in pixels.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        np.ndarray: Point coordinates (x, y) with shape (N, 2).
+    """
+    return generate_tracks_along_rectangle(1, num_points, rect_width, rect_height, rng)[0]
+
+# pylint: disable=too-many-locals, too-many-statements
+def generate_world(args, image_sink: Union[None, ImageSink] = None) -> Ret:
+    """Generate the Webots world with a simple line follower track.
+
+    Args:
+        args (obj): Program arguments
+        image_sink (Union[None, ImageSink], optional): Image sink of the track images.
+            Defaults to None, which saves them as PNG files with the PNG arguments.
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a corresponding error.
+    """
+    ret_status          = Ret.OK
+    world_title         = args.title
+    world_author        = args.author
+    world_email         = args.email
+    world_description   = args.desc
+    image_width         = args.imageSize # [pixel]
+    image_height        = args.imageSize # [pixel]
+    image_line_width    = args.imageSize * args.lineWidth // args.size # [pixel]
+    arena_width         = args.size # [m]
+    arena_height        = args.size # [m]
+    num_points          = args.numPoints
+    pixel_per_m         = args.imageSize / args.size # [pixel/m]
+    is_debug_mode       = args.debug
+    material_ground     = args.materialGround
+    material_robot      = args.materialRobot
+    material_property   = args.materialProperty
+    renderer            = args.renderer
+    mip_levels          = min(args.mipLevels, get_max_mip_level(image_width, image_height))
+    arena_mip_level     = min(args.arenaMipLevel, mip_levels)
+    min_clearance       = args.minClearance # [m]
+    max_attempts        = args.maxAttempts
+    seed                = get_seed(args.seed)
+    rng                 = create_rng(seed)
+
+    world_file_name, image_file_name = get_world_and_image_file_name(args.worldFileName[0])
+
+    # Without a given sink, the track images are saved as PNG files next to the world.
+    if image_sink is None:
+        image_sink = FileImageSink(args.pngCompression, args.pngFilter, args.pngMode)
+
+    # Limit lower number of points to enforce that the splines can be drawn
+    # within the image along the virtual rectangle.
+    if num_points < _NUM_OF_POINTS_MIN:
+        num_points = _NUM_OF_POINTS_MIN
+
+        if is_debug_mode is True:
+            print(f"Number of points limited to {num_points}.\n")
+
+    world_info = create_world_info(world_title, world_description, world_author, world_email, _BASIC_TIME_STEP, seed) # pylint: disable=line-too-long
+    viewpoint = create_viewpoint(arena_width, arena_height)
+
+    proto_textured_background = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/backgrounds/protos/TexturedBackground.proto") # pylint: disable=line-too-long
+    textured_background = create_textured_background()
+
+    proto_textured_background_light = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/backgrounds/protos/TexturedBackgroundLight.proto") # pylint: disable=line-too-long
+    textured_background_light = create_textured_background_light()
+
+    proto_rectangle_arena = Proto("https://raw.githubusercontent.com/cyberbotics/webots/R2025a/projects/objects/floors/protos/RectangleArena.proto") # pylint: disable=line-too-long
+    rectangle_arena = create_rectangle_arena(arena_width, arena_height, image_file_name, arena_mip_level)
+
+    # The friction uses its own random number stream, so the materials don't influence the track.
+    friction_rng = rng.spawn(1)[0]
+
+    if add_friction_to_world(world_info, material_ground, material_robot, material_property, friction_rng) is True: # pylint: disable=line-too-long
+        rectangle_arena.add_fields(
+            SFString("contactMaterial", material_ground)
+        )
+
+    world_file = WorldFile([
+        proto_textured_background,
+        proto_textured_background_light,
+        proto_rectangle_arena
+    ], [
+        world_info,
+        viewpoint,
+        textured_background,
+        textured_background_light,
+        rectangle_arena
+    ])
+
+    # Generate new random points, until the track passes the validation.
+    track_spline = generate_valid_points( lambda: _generate_points_along_rectangle(num_points, image_width, image_height, rng),
+                                          pixel_per_m,
+                                          min_clearance,
+                                          max_attempts,
+                                          is_debug_mode)
+
+    # 12.5 % after the first point, means in the middle of the lower rectangle part.
+    start_stop_line_location = 0.125
+
+    drawing = create_track_drawing( track_spline,
+                                    image_width,
+                                    image_height,
+                                    image_line_width,
+                                    pixel_per_m,
+                                    start_stop_line_location,
+                                    is_debug_mode)
+
+    # Save image in filesystem or the given sink.
+    save_image(drawing, image_file_name, renderer, is_debug_mode, mip_levels, image_sink)
+
+    code_format = CodeFormat()
+    world_file.save(world_file_name, code_format)
+
+    # Save the track metrics next to the world, to filter tracks without rendering them.
+    metrics = create_track_metrics(track_spline, pixel_per_m, start_stop_line_location)
+    metrics["seed"] = seed
+    save_metrics(metrics, get_metrics_file_name(world_file_name))
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,265 @@
+"""Validation of a track polyline, which finds crossings and parts of the track
+    which pass each other closer than a minimum clearance.
+"""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import numpy as np
+
+################################################################################
+# Variables
+################################################################################
+
+# Offsets of the neighbour cells in the uniform grid, including the cell itself.
+_NEIGHBOUR_CELLS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+# Distance relative to the min. clearance, where two segments touch each other.
+_TOUCH_TOLERANCE = 1e-9
+
+################################################################################
+# Classes
+################################################################################
+
+class TrackValidation():
+    """The result of a track validation.
+    """
+
+    def __init__(self, min_clearance: float, crossings: np.ndarray, min_distance: float) -> None:
+        """Create the result of a track validation.
+
+        Args:
+            min_clearance (float): Required min. distance between two parts of the track.
+            crossings (np.ndarray): Indices of the crossing segments with shape (K, 2).
+            min_distance (float): Min. distance between two non-adjacent segments.
+                It is infinite, if no segments are closer than the min. clearance.
+        """
+        self.min_clearance = min_clearance
+        self.crossings = crossings
+        self.min_distance = min_distance
+
+    def is_crossing(self) -> bool:
+        """Is the track crossing itself?
+
+        Returns:
+            bool: If the track crosses itself, it will return True otherwise False.
+        """
+        return len(self.crossings) > 0
+
+    def is_valid(self) -> bool:
+        """Is the track valid? A valid track doesn't cross itself and
+            keeps the min. clearance everywhere.
+
+        Returns:
+            bool: If the track is valid, it will return True otherwise False.
+        """
+        return (self.is_crossing() is False) and (self.min_distance >= self.min_clearance)
+
+################################################################################
+# Functions
+################################################################################
+
+# pylint: disable=too-many-locals
+def _get_candidate_pairs(centers: np.ndarray, cell_size: float) -> tuple[np.ndarray, np.ndarray]:
+    """Get all pairs of track parts, which are located in the same or in
+        neighbour cells of a uniform grid. The parts are sorted by their
+        cell, which makes the search O(n log n) plus the number of pairs.
+
+    Args:
+        centers (np.ndarray): Centers of the parts with shape (N, 2).
+        cell_size (float): Cell size of the grid.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices i and j of the pairs with i < j.
+    """
+    cells = np.floor(centers / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+
+    # Two columns more, that the neighbours of the border cells can't wrap around.
+    num_columns = cells[:, 0].max() + 3
+
+    keys = (cells[:, 1] + 1) * num_columns + (cells[:, 0] + 1)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    pairs_i = []
+    pairs_j = []
+
+    for dx, dy in _NEIGHBOUR_CELLS:
+        neighbour_keys = keys + dy * num_columns + dx
+        begin = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+        end = np.searchsorted(sorted_keys, neighbour_keys, side="right")
+        counts = end - begin
+
+        # Expand every segment with all segments of the neighbour cell.
+        indices_i = np.repeat(np.arange(len(keys)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        indices_j = order[np.repeat(begin, counts) + offsets]
+
+        is_unique = indices_i < indices_j
+        pairs_i.append(indices_i[is_unique])
+        pairs_j.append(indices_j[is_unique])
+
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+# pylint: disable=line-too-long
+def _get_point_segment_distance(points: np.ndarray, begins: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    directions = ends - begins
+    lengths_sqr = np.einsum("ij,ij->i", directions, directions)
+    projections = np.einsum("ij,ij->i", points - begins, directions)
+    factors = np.clip(np.divide(projections, lengths_sqr, out=np.zeros_like(projections), where=lengths_sqr > 0), 0, 1)
+
+    return np.hypot(*(points - begins - directions * factors[:, np.newaxis]).T)
+
+def _get_orientation(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    return np.sign((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]))
+
+def _get_segment_distance(a_begins: np.ndarray, a_ends: np.ndarray, b_begins: np.ndarray, b_ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Get the distance between pairs of segments and whether they cross.
+
+    Args:
+        a_begins (np.ndarray): Begin of the first segments with shape (K, 2).
+        a_ends (np.ndarray): End of the first segments with shape (K, 2).
+        b_begins (np.ndarray): Begin of the second segments with shape (K, 2).
+        b_ends (np.ndarray): End of the second segments with shape (K, 2).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Distances and crossing flags.
+    """
+    is_crossing = (_get_orientation(a_begins, a_ends, b_begins) * _get_orientation(a_begins, a_ends, b_ends) < 0) & \
+                  (_get_orientation(b_begins, b_ends, a_begins) * _get_orientation(b_begins, b_ends, a_ends) < 0)
+
+    distances = np.minimum.reduce([
+        _get_point_segment_distance(a_begins, b_begins, b_ends),
+        _get_point_segment_distance(a_ends, b_begins, b_ends),
+        _get_point_segment_distance(b_begins, a_begins, a_ends),
+        _get_point_segment_distance(b_ends, a_begins, a_ends)
+    ])
+    distances[is_crossing] = 0.0
+
+    return distances, is_crossing
+
+def _get_pairs(begins_i: np.ndarray, ends_i: np.ndarray, begins_j: np.ndarray, ends_j: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Get all pairs of the index ranges [begin_i, end_i) and [begin_j, end_j).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices i and j of the pairs.
+    """
+    counts_i = ends_i - begins_i
+    counts_j = ends_j - begins_j
+    counts = counts_i * counts_j
+
+    # Running number of the pair inside its range pair.
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    repeated_counts_j = np.repeat(counts_j, counts)
+
+    indices_i = np.repeat(begins_i, counts) + offsets // repeated_counts_j
+    indices_j = np.repeat(begins_j, counts) + offsets % repeated_counts_j
+
+    return indices_i, indices_j
+
+# pylint: disable=too-many-locals
+def validate_track(x: np.ndarray, y: np.ndarray, min_clearance: float) -> TrackValidation:
+    """Validate a closed track polyline. It finds the segments which cross
+        each other and the min. distance between non-adjacent parts of the track.
+
+        The track is split into parts with the length of half the min.
+        clearance. Parts are non-adjacent, if the track between them is longer
+        than a half circle with the min. clearance as diameter. A track part,
+        which bends tighter, counts as passing itself.
+
+        The parts are indexed in a uniform grid, therefore only parts in
+        neighbour cells are compared. Only the segments of parts which are
+        closer than the min. clearance are compared to each other, which keeps
+        the number of comparisons small, independent of the sample density.
+        Distances greater than the min. clearance are not determined.
+
+    Args:
+        x (np.ndarray): X-coordinates of the closed polyline.
+        y (np.ndarray): Y-coordinates of the closed polyline.
+        min_clearance (float): Required min. distance between two parts of the track.
+            It must be positive, because the track is split into parts of its size.
+
+    Raises:
+        ValueError: If the min. clearance is not positive.
+
+    Returns:
+        TrackValidation: Validation result
+    """
+    if (min_clearance > 0) is False:
+        raise ValueError(f"The min. clearance must be positive, but is {min_clearance}.")
+
+    points = np.stack((np.asarray(x, dtype=float), np.asarray(y, dtype=float)), axis=1)
+    begins = points[:-1]
+    ends = points[1:]
+
+    segment_lengths = np.hypot(*(ends - begins).T)
+    track_length = segment_lengths.sum()
+    positions = np.concatenate(([0.0], np.cumsum(segment_lengths)))
+
+    # Split the track into parts. Every part contains the segments, which begin in it.
+    part_ids = np.floor(positions[:-1] / (min_clearance / 2)).astype(np.int64)
+    part_begins = np.flatnonzero(np.diff(part_ids, prepend=-1))
+    part_ends = np.append(part_begins[1:], len(segment_lengths))
+
+    lower = np.minimum.reduceat(np.minimum(begins, ends), part_begins)
+    upper = np.maximum.reduceat(np.maximum(begins, ends), part_begins)
+    centers = (lower + upper) / 2
+    radius = np.hypot(*(upper - lower).T) / 2
+
+    # Two parts closer than the min. clearance are always in neighbour cells.
+    cell_size = min_clearance + 2 * radius.max()
+    parts_i, parts_j = _get_candidate_pairs(centers, cell_size)
+
+    # Length of the track between the parts, in both directions of the closed track.
+    gaps_forward = positions[part_begins[parts_j]] - positions[part_ends[parts_i]]
+    gaps_backward = track_length - positions[part_ends[parts_j]] + positions[part_begins[parts_i]]
+    gaps = np.minimum(gaps_forward, gaps_backward)
+
+    # Distance of the bounding boxes.
+    box_distances = np.hypot(*np.maximum(0, np.maximum(lower[parts_i] - upper[parts_j], lower[parts_j] - upper[parts_i])).T)
+
+    is_candidate = (gaps > min_clearance * np.pi / 2) & (box_distances <= min_clearance)
+    parts_i = parts_i[is_candidate]
+    parts_j = parts_j[is_candidate]
+
+    indices_i, indices_j = _get_pairs(part_begins[parts_i], part_ends[parts_i], part_begins[parts_j], part_ends[parts_j])
+
+    distances, is_crossing = _get_segment_distance(begins[indices_i], ends[indices_i], begins[indices_j], ends[indices_j])
+
+    # Segments which touch each other cross each other too, e.g. a sample on the other segment.
+    is_crossing |= distances <= min_clearance * _TOUCH_TOLERANCE
+
+    crossings = np.stack((indices_i[is_crossing], indices_j[is_crossing]), axis=1)
+    min_distance = float(distances.min()) if len(distances) > 0 else np.inf
+
+    if min_distance > min_clearance:
+        min_distance = np.inf
+
+    return TrackValidation(min_clearance, crossings, min_distance)
+
+################################################################################
+# Main
+################################################################################
@@ -27,18 +27,20 @@
 ################################################################################
 import sys
 from datetime import datetime
-from typing import Union, Any
+from typing import Union, Any, Callable
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.interpolate import splev, splprep
 from pyLineFollowerTrackGenerator.base.node import Node
 from pyLineFollowerTrackGenerator.base.fields import SFVec2f, SFNode
-from pyLineFollowerTrackGenerator.nodes.WorldInfo import WorldInfo
-from pyLineFollowerTrackGenerator.nodes.Viewpoint import Viewpoint
-from pyLineFollowerTrackGenerator.nodes.PBRAppearance import PBRAppearance
-from pyLineFollowerTrackGenerator.nodes.ImageTexture import ImageTexture
-from pyLineFollowerTrackGenerator.nodes.ContactProperties import ContactProperties
+from pyLineFollowerTrackGenerator import nodes
 from pyLineFollowerTrackGenerator.friction import Friction
+from pyLineFollowerTrackGenerator.render import TrackDrawing, render_figure
+from pyLineFollowerTrackGenerator.arc_length import ArcLengthTable
+from pyLineFollowerTrackGenerator.spline_sampler import get_u_adaptive
+from pyLineFollowerTrackGenerator.track_validator import TrackValidation, validate_track
+from pyLineFollowerTrackGenerator.metrics import get_spline_metrics
+from pyLineFollowerTrackGenerator.mipmap import get_mip_file_name
 
 ################################################################################
 # Variables
@@ -46,10 +48,39 @@ from pyLineFollowerTrackGenerator.friction import Friction
 _START_STOP_LINE_WIDTH = 0.05 # [m]
 _START_STOP_LINE_DISTANCE_TO_MIDDLE = 0.025 # [m]
 
+# Max. distance between two samples of the track spline.
+_SPLINE_SAMPLING_STEP = 0.1 # [m]
+
+# Max. deviation of the sampled track from the spline.
+_SPLINE_TOLERANCE = 0.25 # [pixel]
+
+# Friction database of the process, loaded once by get_friction_db().
+_FRICTION_CONTEXT = {
+    "frictionDb": None
+}
+
 ################################################################################
 # Classes
 ################################################################################
 
+class TrackSpline(): # pylint: disable=too-few-public-methods
+    """Closed spline through the points of a track in pixels. It is fitted
+        once per track and shared by the validation, drawing and metrics.
+    """
+
+    def __init__(self, points: Union[list[tuple[float, float]], np.ndarray], pixel_per_m: float) -> None: # pylint: disable=line-too-long
+        """Fit the spline through the points and sample it, like it is drawn.
+
+        Args:
+            points (Union[list[tuple[float, float]], np.ndarray]): Points in pixels.
+            pixel_per_m (float): Conversion factor pixel per m.
+        """
+        self.points = np.asarray(points, dtype=float)
+
+        # The points are in pixels, therefore the samples follow the curvature
+        # within a pixel tolerance.
+        self.x, self.y, self.tck, self.arc_length_table = generate_spline(self.points, _SPLINE_SAMPLING_STEP * pixel_per_m, _SPLINE_TOLERANCE) # pylint: disable=line-too-long
+
 ################################################################################
 # Functions
 ################################################################################
@@ -70,22 +101,32 @@ def get_start_stop_line_distance_to_middle() -> float:
     """
     return _START_STOP_LINE_DISTANCE_TO_MIDDLE
 
-def generate_spline(points: list[tuple[float, float]]):
+# pylint: disable=line-too-long
+def generate_spline(points: Union[list[tuple[float, float]], np.ndarray], sampling_step: Union[None, float] = None, tolerance: Union[None, float] = None):
     """Generate splines through list of points.
 
     Args:
-        points (list[tuple[float, float]]): Points with x- and y-coordinate.
+        points (Union[list[tuple[float, float]], np.ndarray]): Points with x- and y-coordinate,
+            e.g. as array with shape (N, 2).
+        sampling_step (Union[None, float]): Distance between two samples along the spline
+            in the unit of the points. If None, the spline is sampled with 10 samples per
+            point, equally spaced in the spline parameter.
+        tolerance (Union[None, float]): Max. deviation of the samples from the spline in the
+            unit of the points. If set, the spline is sampled adaptive by its curvature and
+            the sampling step is the max. distance between two samples.
 
     Returns:
-        tuple[list[float], list[float], tuple]:
+        tuple[list[float], list[float], tuple, ArcLengthTable]:
             List of arrays representing the curve in an N-D space.
             Vector of knots, the B-spline coefficients, and the degree of the spline.
+            Arc-length table of the spline.
     """
+    points = np.asarray(points, dtype=float)
     num_points = len(points)
 
     # Convert the points to separate x- and y-coordinates.
-    x = [point[0] for point in points]
-    y = [point[1] for point in points]
+    x = points[:, 0]
+    y = points[:, 1]
 
     # Generate spline representation of the line.
     # The line will be like a closed track.
@@ -93,11 +134,27 @@ def generate_spline(points: list[tuple[float, float]]):
     #       the B-spline coefficients and the degree of the spline.
     tck, _ = splprep([x, y], s=0, per=True) # pylint: disable=unbalanced-tuple-unpacking
 
+    arc_length_table = ArcLengthTable(tck)
+
     # Generate points along the spline
-    u_new = np.linspace(0, 1, num_points * 10)
+    if tolerance is not None:
+        u_new = get_u_adaptive(tck, tolerance, sampling_step)
+    elif sampling_step is not None:
+        u_new = arc_length_table.get_u_by_step(sampling_step)
+    else:
+        u_new = np.linspace(0, 1, num_points * 10)
+
     x_spline, y_spline = splev(u_new, tck, der=0)
 
-    return x_spline, y_spline, tck
+    return x_spline, y_spline, tck, arc_length_table
+
+def _get_track_spline(points: Union[list[tuple[float, float]], np.ndarray, TrackSpline], pixel_per_m: float) -> TrackSpline: # pylint: disable=line-too-long
+    track_spline = points
+
+    if isinstance(points, TrackSpline) is False:
+        track_spline = TrackSpline(points, pixel_per_m)
+
+    return track_spline
 
 # pylint: disable=line-too-long
 def generate_start_stop_line(tck: Any, u: float, distance_from_middle: int, length: int) -> tuple[list[float], list[float], list[float], list[float]]:
@@ -120,6 +177,28 @@ def generate_start_stop_line(tck: Any, u: float, distance_from_middle: int, leng
     # Determine the point on the spline at the given parameter u.
     x_spline, y_spline = splev(u, tck)
 
+    return generate_start_stop_line_at(x_spline, y_spline, dx, dy, distance_from_middle, length)
+
+# pylint: disable=too-many-arguments, line-too-long
+def generate_start_stop_line_at(x: float, y: float, dx: float, dy: float, distance_from_middle: int, length: int) -> tuple[list[float], list[float], list[float], list[float]]:
+    """Generate points for a start-/stop-line at a point of the track with
+        the given tangent. The start-/stop-line start at the given distance
+        from the line middle on both sides and has a dediacted length.
+
+    Args:
+        x (float): x-coordinate of the point on the track.
+        y (float): y-coordinate of the point on the track.
+        dx (float): x-component of the tangent in the point.
+        dy (float): y-component of the tangent in the point.
+        distance_from_middle (int): Distance from the line middle in pixels.
+        length (int): Length in pixels of one part of the start-/stop-line.
+
+    Returns:
+        tuple[list[float], list[float], list[float], list[float]]: Lower and upper points of the start-/stop-line.
+    """
+    x_spline = x
+    y_spline = y
+
     # Determine the unit normal vector to the tangent
     mag = np.sqrt(dx**2 + dy**2)
     nx = -dy / mag  # x-component of the unit normal vector
@@ -147,20 +226,21 @@ def generate_start_stop_line(tck: Any, u: float, distance_from_middle: int, leng
     return x_perpendicular_low, y_perpendicular_low, x_perpendicular_high, y_perpendicular_high
 
 # pylint: disable=too-many-arguments, line-too-long, too-many-locals
-def generate_track_image(points: list[tuple[float, float]], image_width: int, image_height: int, image_line_width: int, pixel_per_m: float, start_stop_line_location: float, is_debug_mode: bool) -> plt.Figure:
-    """Generate the image with the line follower track.
+def create_track_drawing(points: Union[list[tuple[float, float]], np.ndarray, TrackSpline], image_width: int, image_height: int, image_line_width: int, pixel_per_m: float, start_stop_line_location: float, is_debug_mode: bool) -> TrackDrawing:
+    """Create the renderer independent drawing of the line follower track.
 
     Args:
-        points (list[tuple[float, float]]): List of points.
+        points (Union[list[tuple[float, float]], np.ndarray, TrackSpline]): List of points
+            or the spline through them.
         image_width (int): Image width in pixels.
         image_height (int): Image height in pixels.
         image_line_width (int): The line follower line width in pixels.
         pixel_per_m (float): Conversion factor pixel per m.
-        start_stop_line_location (float): Location in % considering the whole track.
+        start_stop_line_location (float): Location as fraction of the whole track length [0..1].
         is_debug_mode (bool): In debug mode the image will get additional information.
 
     Returns:
-        plt.Figure: Figure
+        TrackDrawing: Track drawing
     """
     line_color = "black"
     line_points_color = "red"
@@ -171,55 +251,131 @@ def generate_track_image(points: list[tuple[float, float]], image_width: int, im
     if is_debug_mode is True:
         start_stop_line_color = "orange"
 
-    # Create figure and axis.
-    dpi = 72 # Use a dpi of 72 to plot with exact pixel sizes.
-    fig, ax = plt.subplots(figsize=(image_width/dpi, image_height/dpi),dpi=dpi)
-
-    # Set background color.
-    ax.set_facecolor(background_color)
+    drawing = TrackDrawing(image_width, image_height, background_color)
 
-    # Generate splines through list of points.
-    x_spline, y_spline, tck = generate_spline(points)
+    # Generate splines through list of points, if not done yet.
+    track_spline = _get_track_spline(points, pixel_per_m)
 
     # Plot the line.
-    ax.plot(x_spline, y_spline, color=line_color, linewidth=image_line_width, zorder=1)
+    drawing.add_line(track_spline.x, track_spline.y, line_color, image_line_width, zorder=1)
 
     # Show the points used for generation in debug mode.
     if is_debug_mode is True:
+        points = track_spline.points
 
-        # Convert the points to separate x- and y-coordinates.
-        x_points = [point[0] for point in points]
-        y_points = [point[1] for point in points]
-
-        ax.scatter(x_points, y_points, color=line_points_color, linewidth=image_line_width, zorder=2)
+        drawing.add_points(points[:, 0], points[:, 1], line_points_color, image_line_width, zorder=2)
 
     # Plot start- and stop-line
     x_perpendicular_low, y_perpendicular_low, \
     x_perpendicular_high, y_perpendicular_high = \
-        generate_start_stop_line(   tck,
-                                    start_stop_line_location,
+        generate_start_stop_line(   track_spline.tck,
+                                    track_spline.arc_length_table.get_u_by_fraction(start_stop_line_location),
                                     _START_STOP_LINE_DISTANCE_TO_MIDDLE * pixel_per_m,
                                     _START_STOP_LINE_WIDTH * pixel_per_m)
 
-    ax.plot(x_perpendicular_low,
-            y_perpendicular_low,
-            color=start_stop_line_color,
-            linewidth=image_line_width,
-            zorder=2)
-    ax.plot(x_perpendicular_high,
-            y_perpendicular_high,
-            color=start_stop_line_color,
-            linewidth=image_line_width,
-            zorder=2)
+    drawing.add_line(x_perpendicular_low, y_perpendicular_low, start_stop_line_color, image_line_width, zorder=2)
+    drawing.add_line(x_perpendicular_high, y_perpendicular_high, start_stop_line_color, image_line_width, zorder=2)
+
+    return drawing
+
+# pylint: disable=too-many-arguments, line-too-long
+def generate_track_image(points: Union[list[tuple[float, float]], np.ndarray], image_width: int, image_height: int, image_line_width: int, pixel_per_m: float, start_stop_line_location: float, is_debug_mode: bool) -> plt.Figure:
+    """Generate the image with the line follower track.
+
+    Args:
+        points (Union[list[tuple[float, float]], np.ndarray]): List of points.
+        image_width (int): Image width in pixels.
+        image_height (int): Image height in pixels.
+        image_line_width (int): The line follower line width in pixels.
+        pixel_per_m (float): Conversion factor pixel per m.
+        start_stop_line_location (float): Location as fraction of the whole track length [0..1].
+        is_debug_mode (bool): In debug mode the image will get additional information.
+
+    Returns:
+        plt.Figure: Figure
+    """
+    drawing = create_track_drawing( points,
+                                    image_width,
+                                    image_height,
+                                    image_line_width,
+                                    pixel_per_m,
+                                    start_stop_line_location,
+                                    is_debug_mode)
+
+    return render_figure(drawing)
 
-    # Set limits
-    ax.set_xlim(0, image_width)
-    ax.set_ylim(0, image_height)
+# pylint: disable=line-too-long
+def validate_track_points(points: Union[list[tuple[float, float]], np.ndarray, TrackSpline], pixel_per_m: float, min_clearance: float) -> TrackValidation:
+    """Validate the track through the points, like it is drawn.
+
+    Args:
+        points (Union[list[tuple[float, float]], np.ndarray, TrackSpline]): List of points
+            in pixels or the spline through them.
+        pixel_per_m (float): Conversion factor pixel per m.
+        min_clearance (float): Required min. distance between two parts of the track in m.
+
+    Returns:
+        TrackValidation: Validation result with distances in pixels.
+    """
+    track_spline = _get_track_spline(points, pixel_per_m)
+
+    return validate_track(track_spline.x, track_spline.y, min_clearance * pixel_per_m)
+
+# pylint: disable=line-too-long
+def generate_valid_points(generate_points: Callable[[], np.ndarray], pixel_per_m: float, min_clearance: float, max_attempts: int, is_debug_mode: bool) -> TrackSpline:
+    """Generate the points of a track until the track doesn't cross itself and
+        keeps the min. clearance, but at most the max. number of attempts.
+        If no valid track is found, the last one is used and a warning is shown.
+
+    Args:
+        generate_points (Callable[[], np.ndarray]): Generates the random points of a track in pixels.
+        pixel_per_m (float): Conversion factor pixel per m.
+        min_clearance (float): Required min. distance between two parts of the track in m.
+        max_attempts (int): Max. number of attempts to generate a valid track.
+        is_debug_mode (bool): In debug mode the validation results are shown.
+
+    Returns:
+        TrackSpline: Spline through the points, with the points (x, y) of shape (N, 2).
+            It is used to draw the track and to create its metrics without fitting
+            the spline again.
+    """
+    attempt = 0
+    is_valid = False
+
+    while (is_valid is False) and (attempt < max(max_attempts, 1)):
+        attempt += 1
+        track_spline = TrackSpline(generate_points(), pixel_per_m)
+        validation = validate_track_points(track_spline, pixel_per_m, min_clearance)
+        is_valid = validation.is_valid()
+
+        if is_debug_mode is True:
+            min_distance = "-" if np.isinf(validation.min_distance) else f"{validation.min_distance / pixel_per_m:.3f} m"
+            print(f"Track validation attempt {attempt}: crossings {len(validation.crossings)}, min. distance {min_distance}")
+
+    if is_valid is False:
+        if validation.is_crossing() is True:
+            print(f"Warning: The track crosses itself after {attempt} attempt(s).")
+        else:
+            print(f"Warning: The track parts are closer than {min_clearance} m ({validation.min_distance / pixel_per_m:.3f} m) after {attempt} attempt(s).")
+
+    return track_spline
+
+# pylint: disable=line-too-long
+def create_track_metrics(points: Union[list[tuple[float, float]], np.ndarray, TrackSpline], pixel_per_m: float, start_stop_line_location: float) -> dict:
+    """Create the geometry metrics of the track through the points.
+
+    Args:
+        points (Union[list[tuple[float, float]], np.ndarray, TrackSpline]): List of points
+            in pixels or the spline through them.
+        pixel_per_m (float): Conversion factor pixel per m.
+        start_stop_line_location (float): Location as fraction of the whole track length [0..1].
 
-    # Hide axes
-    ax.axis('off')
+    Returns:
+        dict: Metrics
+    """
+    track_spline = _get_track_spline(points, pixel_per_m)
 
-    return fig
+    return get_spline_metrics(track_spline.tck, pixel_per_m, [start_stop_line_location], track_spline.arc_length_table)
 
 def _get_cmd_line_parameters() -> str:
     args = sys.argv[1:]
@@ -252,7 +408,19 @@ def get_world_and_image_file_name(user_world_file_name: str) -> tuple[str, str]:
 
     return (world_file_name, image_file_name)
 
-def create_world_info(title: str, description: str, author: str, author_email: str, basic_time_step: float) -> WorldInfo:
+def get_metrics_file_name(world_file_name: str) -> str:
+    """Get the file name of the track metrics, which are stored next to the world.
+
+    Args:
+        world_file_name (str): The world file name (.wbt).
+
+    Returns:
+        str: Metrics file name.
+    """
+    return world_file_name[:-len(".wbt")] + ".metrics.json"
+
+# pylint: disable=too-many-arguments, line-too-long
+def create_world_info(title: str, description: str, author: str, author_email: str, basic_time_step: float, seed: Union[None,int] = None) -> Node:
     """Create webots world info node.
 
     Args:
@@ -261,13 +429,14 @@ def create_world_info(title: str, description: str, author: str, author_email: s
         author (str): Name of the world author.
         author_email (str): EMail address of the world author.
         basic_time_step (float): Basic simulation time step.
+        seed (Union[None,int], optional): Seed the world was generated with. Defaults to None.
 
     Returns:
-        WorldInfo: _description_
+        Node: World info node.
     """
     world_creation_date = datetime.today().strftime('%Y-%m-%d')
 
-    world_info = WorldInfo()
+    world_info = nodes.get("WorldInfo")()
     world_info["title"].value = title
     world_info["info"].values = [
         description,
@@ -275,11 +444,16 @@ def create_world_info(title: str, description: str, author: str, author_email: s
         world_creation_date,
         _get_cmd_line_parameters()
     ]
+
+    # The seed allows to regenerate the world.
+    if seed is not None:
+        world_info["info"].values.append(f"Seed: {seed}")
+
     world_info["basicTimeStep"].value = basic_time_step
 
     return world_info
 
-def create_viewpoint(arena_width: float, arena_length: float) -> Viewpoint:
+def create_viewpoint(arena_width: float, arena_length: float) -> Node:
     """Create viewpoint on arena.
 
     Args:
@@ -287,9 +461,9 @@ def create_viewpoint(arena_width: float, arena_length: float) -> Viewpoint:
         arena_length (float): Arena length in m.
 
     Returns:
-        Viewpoint: Viewpoint node
+        Node: Viewpoint node
     """
-    viewpoint = Viewpoint()
+    viewpoint = nodes.get("Viewpoint")()
     viewpoint["orientation"].values = [0, 1, 0, np.pi / 4]
     viewpoint["position"].values = [-2 * arena_width, 0, 2 * arena_length]
 
@@ -311,13 +485,14 @@ def create_textured_background_light() -> Node:
     """
     return Node("TexturedBackgroundLight")
 
-def create_rectangle_arena(arena_width: float, arena_length: float, image_file_name) -> Node:
+def create_rectangle_arena(arena_width: float, arena_length: float, image_file_name, mip_level: int = 0) -> Node:
     """Create a rectangle arena and use the image as ground.
 
     Args:
         arena_width (float): Arena width in m.
         arena_length (float): Arena length in m.
         image_file_name (_type_): The name of the image, used on ground.
+        mip_level (int, optional): The mip level of the image, used on ground. Defaults to 0.
 
     Returns:
         Node: Rectangle arena node.
@@ -326,17 +501,17 @@ def create_rectangle_arena(arena_width: float, arena_length: float, image_file_n
     rectangle_arena.add_fields([
         SFVec2f("floorSize", [arena_width, arena_length]),
         SFVec2f("floorTileSize", [arena_width, arena_length]),
-        SFNode("floorAppearance", PBRAppearance())
+        SFNode("floorAppearance", nodes.get("PBRAppearance")())
     ])
 
-    rectangle_arena["floorAppearance"].value["baseColorMap"].value = ImageTexture()
-    rectangle_arena["floorAppearance"].value["baseColorMap"].value["url"].values = [image_file_name]
+    rectangle_arena["floorAppearance"].value["baseColorMap"].value = nodes.get("ImageTexture")()
+    rectangle_arena["floorAppearance"].value["baseColorMap"].value["url"].values = [get_mip_file_name(image_file_name, mip_level)]
     rectangle_arena["floorAppearance"].value["metalness"].value = 0
     rectangle_arena["floorAppearance"].value["roughness"].value = 1
 
     return rectangle_arena
 
-def create_contact_properties(material_ground: str, material_robot: str, static_friction: Union[None,float], dynamic_friction: Union[None,float]) -> ContactProperties:
+def create_contact_properties(material_ground: str, material_robot: str, static_friction: Union[None,float], dynamic_friction: Union[None,float]) -> Node:
     """Create contact properties for the given materials, considering the
         static and dynamic friction.
 
@@ -347,9 +522,9 @@ def create_contact_properties(material_ground: str, material_robot: str, static_
         dynamic_friction (Union[None,float]): Dynamic friction.
 
     Returns:
-        ContactProperties: Contact properties node.
+        Node: Contact properties node.
     """
-    contact_properties = ContactProperties()
+    contact_properties = nodes.get("ContactProperties")()
     contact_properties["material1"].value = material_ground
     contact_properties["material2"].value = material_robot
 
@@ -361,14 +536,32 @@ def create_contact_properties(material_ground: str, material_robot: str, static_
 
     return contact_properties
 
-def add_friction_to_world(world_info: WorldInfo, material_ground: str, material_robot: str, material_property: str) -> bool:
+def get_friction_db() -> Union[None, Friction]:
+    """Get the friction database. It is loaded only once per process, which
+        keeps it warm for all further worlds generated by the process.
+
+    Returns:
+        Union[None, Friction]: Friction database or None, if loading failed.
+    """
+    if _FRICTION_CONTEXT["frictionDb"] is None:
+        friction_db = Friction()
+
+        if friction_db.load() is True:
+            _FRICTION_CONTEXT["frictionDb"] = friction_db
+
+    return _FRICTION_CONTEXT["frictionDb"]
+
+# pylint: disable=line-too-long
+def add_friction_to_world(world_info: Node, material_ground: str, material_robot: str, material_property: str, rng: Union[None,np.random.Generator] = None) -> bool:
     """Add friction to a world info node, depended on the materials and their property.
 
     Args:
-        world_info (WorldInfo): World info node.
+        world_info (Node): World info node.
         material_ground (str): Name of the ground material.
         material_robot (str): Name of the robot contact material.
         material_property (str): The material propertiy, like e.g. dry or wet.
+        rng (Union[None,np.random.Generator], optional): Random number generator used for
+            friction ranges. Defaults to None.
 
     Returns:
         bool: If successful, it will return True otherwise False.
@@ -376,10 +569,10 @@ def add_friction_to_world(world_info: WorldInfo, material_ground: str, material_
     status = False
 
     if (material_ground != "default") or (material_robot != "default"):
-        friction_db = Friction()
+        friction_db = get_friction_db()
 
-        if friction_db.load() is True:
-            static_friction, dynamic_friction = friction_db.get_friction(material_ground, material_robot, material_property)
+        if friction_db is not None:
+            static_friction, dynamic_friction = friction_db.get_friction(material_ground, material_robot, material_property, rng)
 
             if static_friction is None:
                 print(f"Static friction for {material_ground} / {material_robot}: -")
@@ -28,8 +28,6 @@
 import importlib.metadata as meta
 import pathlib
 
-import toml
-
 ################################################################################
 # Variables
 ################################################################################
@@ -74,6 +72,9 @@ def init_from_toml():
         list: Tool related informations
     """
 
+    # The toml package is only required if the package wasn't installed.
+    import toml # pylint: disable=import-outside-toplevel
+
     dist_dir = pathlib.Path(__file__).resolve().parents[2]
     toml_file = pathlib.Path.joinpath(dist_dir, "pyproject.toml")
     data = toml.load(toml_file)
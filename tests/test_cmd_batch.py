@@ -0,0 +1,97 @@
+"""Test the batch command."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+################################################################################
+# Imports
+################################################################################
+import pytest
+from pyLineFollowerTrackGenerator.cmd_batch import cmd_register
+from pyLineFollowerTrackGenerator.constants import Ret
+from pyLineFollowerTrackGenerator.job_worker import get_job_world_file_names
+from pyLineFollowerTrackGenerator.prg_arg_parser import PrgArgParser
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _parse(args: list[str]):
+    prg_arg_parser = PrgArgParser()
+    cmd_par_dict = cmd_register(prg_arg_parser.get_sub_parsers())
+    prg_arg_parser.parse_args(["batch"] + args)
+
+    return cmd_par_dict["execFunc"], prg_arg_parser.get_args()
+
+@pytest.mark.parametrize("workers", ["0", "-1", "two"])
+def test_invalid_workers(workers):
+    """The number of workers must be a positive integer.
+    """
+    with pytest.raises(SystemExit):
+        _parse(["-w", workers, "simple", "track_{index}"])
+
+def test_world_file_names():
+    """The world file names of the jobs get their extension, invalid jobs have none.
+    """
+    jobs = [
+        ["simple", "track", "-np", "20"],
+        ["etrack", "track.wbt"],
+        ["simple"],
+        ["unknown", "track"]
+    ]
+
+    assert get_job_world_file_names(jobs) == ["track.wbt", "track.wbt", None, None]
+
+def test_colliding_outputs(tmp_path, monkeypatch, capsys):
+    """Jobs, which write the same world, are rejected before any job runs.
+    """
+    monkeypatch.chdir(tmp_path)
+    exec_func, args = _parse(["-c", "2", "-w", "1", "simple", "track"])
+
+    assert exec_func(args) == Ret.ERROR
+    assert "Job 0 and job 1 write the same world track.wbt" in capsys.readouterr().out
+    assert len(list(tmp_path.iterdir())) == 0
+
+def test_colliding_outputs_with_extension(tmp_path, monkeypatch, capsys):
+    """A world file name with and without extension is the same world.
+    """
+    monkeypatch.chdir(tmp_path)
+    job_file = tmp_path / "jobs.json"
+    job_file.write_text('[["simple", "track"], ["simple", "./track.wbt"]]', encoding="utf-8")
+    exec_func, args = _parse(["-jf", str(job_file)])
+
+    assert exec_func(args) == Ret.ERROR
+    assert "Job 0 and job 1 write the same world" in capsys.readouterr().out
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["jobs.json"]
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,136 @@
+"""Test the compiled cache of the friction database."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import json
+import marshal
+import os
+import pickle
+import pytest
+from pyLineFollowerTrackGenerator import friction
+from pyLineFollowerTrackGenerator.friction import Friction
+
+################################################################################
+# Variables
+################################################################################
+
+_FRICTION_DATA = {
+    "friction": [{
+        "material1": "rubber",
+        "material2": "cardboard",
+        "static": {"dry": 0.5}
+    }]
+}
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+@pytest.fixture(name="database")
+def fixture_database(tmp_path, monkeypatch) -> str:
+    """Friction database in its own directory and a separate user cache directory.
+    """
+    database_dir = tmp_path / "database"
+    database_dir.mkdir()
+    file_name = str(database_dir / "friction.json")
+
+    with open(file_name, "w", encoding="utf-8") as fd:
+        json.dump(_FRICTION_DATA, fd)
+
+    monkeypatch.setattr(friction, "FRICTION_FILE_NAME", file_name)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+
+    return file_name
+
+def _get_cache_file_names(tmp_path) -> list[str]:
+    cache_dir = tmp_path / "cache" / "pyLineFollowerTrackGenerator"
+
+    return [str(cache_dir / file_name) for file_name in os.listdir(cache_dir)]
+
+def test_cache_in_user_cache_dir(tmp_path, database):
+    """The cache is written to the user cache directory as plain data and
+        nothing is written next to the database.
+    """
+    assert Friction().load() is True
+
+    cache_file_names = _get_cache_file_names(tmp_path)
+
+    assert os.listdir(os.path.dirname(database)) == ["friction.json"]
+    assert len(cache_file_names) == 1
+
+    with open(cache_file_names[0], "rb") as fd:
+        cache = marshal.loads(fd.read())
+
+    assert cache["frictionData"] == _FRICTION_DATA
+
+def test_cache_is_used(tmp_path, database): # pylint: disable=unused-argument
+    """The friction data is the same, if it is loaded from the cache.
+    """
+    assert Friction().load() is True
+
+    friction_db = Friction()
+
+    assert friction_db.load() is True
+    assert friction_db.get_friction("cardboard", "rubber", "dry") == (0.5, None)
+
+def test_corrupt_cache_is_rebuilt(tmp_path, database): # pylint: disable=unused-argument
+    """A cache, which is no plain data, e.g. a pickle, is never loaded, but rebuilt.
+    """
+    assert Friction().load() is True
+
+    cache_file_name = _get_cache_file_names(tmp_path)[0]
+
+    with open(cache_file_name, "wb") as fd:
+        fd.write(pickle.dumps({"version": 2}))
+
+    friction_db = Friction()
+
+    assert friction_db.load() is True
+    assert friction_db.get_friction("cardboard", "rubber", "dry") == (0.5, None)
+
+    with open(cache_file_name, "rb") as fd:
+        assert marshal.loads(fd.read())["frictionData"] == _FRICTION_DATA
+
+def test_changed_database_is_loaded(database):
+    """A changed database is loaded instead of the cache.
+    """
+    assert Friction().load() is True
+
+    friction_data = json.loads(json.dumps(_FRICTION_DATA))
+    friction_data["friction"][0]["static"]["dry"] = 0.7
+
+    with open(database, "w", encoding="utf-8") as fd:
+        json.dump(friction_data, fd, indent=4)
+
+    friction_db = Friction()
+
+    assert friction_db.load() is True
+    assert friction_db.get_friction("cardboard", "rubber", "dry") == (0.7, None)
@@ -0,0 +1,117 @@
+"""Test loading the grid files."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import json
+import numpy as np
+import pytest
+from pyLineFollowerTrackGenerator import grid_file
+from pyLineFollowerTrackGenerator.grid_file import GridFileError, load_grid
+
+################################################################################
+# Variables
+################################################################################
+
+# Points of a valid track.
+_TRACK = [
+    {"x": 1, "y": 0},
+    {"x": 2, "y": 0, "startStopLine": True},
+    {"x": 3, "y": 1},
+    {"x": 3, "y": 2}
+]
+
+_POINTS = [[1, 0], [2, 0], [3, 1], [3, 2]]
+_START_STOP_LINES = [False, True, False, False]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _load_json(tmp_path, content: str) -> tuple[np.ndarray, np.ndarray]:
+    file_name = str(tmp_path / "grid.json")
+
+    with open(file_name, "w", encoding="utf-8") as fd:
+        fd.write(content)
+
+    return load_grid(file_name)
+
+@pytest.mark.parametrize("data", [
+    {"track": _TRACK},
+    {"type": "track", "track": _TRACK},
+    {"name": "a \"track\" in a string", "track": _TRACK},
+    {"meta": {"track": "nested", "tracks": ["track"]}, "size": 12345, "track": _TRACK},
+    {"valid": True, "empty": None, "ratio": -1.5e3, "track": _TRACK},
+    {"track": _TRACK, "type": "track"}
+])
+@pytest.mark.parametrize("chunk_size", [3, 64 * 1024])
+def test_load_track_among_other_members(tmp_path, monkeypatch, data, chunk_size):
+    """The track is found, independent of other members before and after it,
+        also if they contain a "track" string or key, and of the chunk size.
+    """
+    monkeypatch.setattr(grid_file, "_CHUNK_SIZE", chunk_size)
+
+    points, start_stop_lines = _load_json(tmp_path, json.dumps(data, indent=4))
+
+    assert points.tolist() == _POINTS
+    assert start_stop_lines.tolist() == _START_STOP_LINES
+
+@pytest.mark.parametrize("content", [
+    '{"type": "track"}',
+    '{"meta": {"track": []}}',
+    '{}',
+    '[{"track": []}]'
+])
+def test_load_without_track(tmp_path, content):
+    """A file without track at the top-level is invalid.
+    """
+    with pytest.raises(GridFileError):
+        _load_json(tmp_path, content)
+
+def test_load_integral_floats(tmp_path):
+    """JSON numbers with an integral value are valid coordinates.
+    """
+    track = [{"x": float(point[0]), "y": float(point[1])} for point in _POINTS]
+
+    points, _ = _load_json(tmp_path, json.dumps({"track": track}))
+
+    assert points.tolist() == _POINTS
+
+@pytest.mark.parametrize("point", [
+    {"x": 1.5, "y": 0},
+    {"x": True, "y": 0},
+    {"x": 1, "y": False},
+    {"x": "1", "y": 0},
+    {"x": None, "y": 0}
+])
+def test_load_invalid_coordinates(tmp_path, point):
+    """Non-integral numbers, booleans and other values are no coordinates.
+    """
+    with pytest.raises(GridFileError, match="point 1"):
+        _load_json(tmp_path, json.dumps({"track": [{"x": 0, "y": 0}, point]}))
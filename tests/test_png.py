@@ -0,0 +1,76 @@
+"""Test the streaming PNG writer."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import io
+import numpy as np
+import pytest
+from pyLineFollowerTrackGenerator.constants import PNG_FILTER_NONE
+from pyLineFollowerTrackGenerator.png import PngWriter, encode_png
+
+################################################################################
+# Variables
+################################################################################
+_WIDTH = 4
+_HEIGHT = 6
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_rows(num_rows: int) -> np.ndarray:
+    return np.full((num_rows, _WIDTH, 3), 128, dtype=np.uint8)
+
+def test_complete_image():
+    """Writing the image band by band gives the same PNG as at once.
+    """
+    fd = io.BytesIO()
+
+    with PngWriter(fd, _WIDTH, _HEIGHT, 3, png_filter=PNG_FILTER_NONE) as png_writer:
+        png_writer.write(_get_rows(2))
+        png_writer.write(_get_rows(_HEIGHT - 2))
+
+    assert fd.getvalue() == encode_png(_get_rows(_HEIGHT), png_filter=PNG_FILTER_NONE)
+
+def test_incomplete_image():
+    """An image with missing rows is an error.
+    """
+    with pytest.raises(ValueError, match="rows are written"):
+        with PngWriter(io.BytesIO(), _WIDTH, _HEIGHT, 3) as png_writer:
+            png_writer.write(_get_rows(2))
+
+def test_exception_is_not_masked():
+    """An exception, which interrupts the writing, is not masked by the
+        incomplete image.
+    """
+    with pytest.raises(RuntimeError, match="interrupted"):
+        with PngWriter(io.BytesIO(), _WIDTH, _HEIGHT, 3) as png_writer:
+            png_writer.write(_get_rows(2))
+            raise RuntimeError("interrupted")
@@ -0,0 +1,93 @@
+"""Test the program startup, which shall not import the heavy libraries."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+################################################################################
+# Variables
+################################################################################
+_SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Libraries, which shall be imported only if a command is executed.
+_HEAVY_MODULES = ["numpy", "matplotlib", "scipy"]
+
+# Runs the program with the given arguments and prints the loaded heavy modules.
+_PROBE = f"""
+import json, sys
+from pyLineFollowerTrackGenerator.__main__ import main
+try:
+    main()
+except SystemExit:
+    pass
+print(json.dumps([name for name in {_HEAVY_MODULES!r} if name in sys.modules]))
+"""
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_loaded_heavy_modules(args: list[str]) -> list[str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = _SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+
+    process = subprocess.run(
+        [sys.executable, "-c", _PROBE] + args,
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+
+    return json.loads(process.stdout.splitlines()[-1])
+
+@pytest.mark.parametrize("args", [
+    ["--help"],
+    ["batch", "--help"],
+    ["etrack", "--help"],
+    ["friction", "--help"],
+    ["grid", "--help"],
+    ["gridgen", "--help"],
+    ["serve", "--help"],
+    ["simple", "--help"]
+])
+def test_startup_without_heavy_imports(args):
+    """The help of the program and of every command is shown without
+        importing numpy, matplotlib or scipy.
+    """
+    assert _get_loaded_heavy_modules(args) == []
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,137 @@
+"""Test the analytic segment model of the grid track."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import math
+import numpy as np
+import pytest
+from pyLineFollowerTrackGenerator.grid_tour import generate_tour
+from pyLineFollowerTrackGenerator.rng import create_rng
+from pyLineFollowerTrackGenerator.segments import ArcSegment
+from pyLineFollowerTrackGenerator.track_grid import create_track_segments, create_track_drawing, _get_track_metrics # pylint: disable=line-too-long
+
+################################################################################
+# Variables
+################################################################################
+
+# Grid point distance in pixels.
+_GRID_POINT_DISTANCE = 10
+
+# Grid point distance in m.
+_POINT_DISTANCE = 0.1
+
+# Image size in pixels, which gives a border of 20 pixels.
+_IMAGE_SIZE = 100
+_BORDER = 20
+
+# Turns of a closed track, which walks clockwise around a square. It starts in
+# positive x-direction and turns to the right only.
+_CLOCKWISE_TRACK = [
+    [0, 2], [2, 2], [3, 1], [3, -1], [2, -2], [0, -2], [-1, -1], [-1, 1], [0, 2]
+]
+
+# Turns of a closed track, which walks counter-clockwise around a square. It
+# starts in positive x-direction and turns to the left only.
+_COUNTER_CLOCKWISE_TRACK = [
+    [0, 0], [2, 0], [3, 1], [3, 3], [2, 4], [0, 4], [-1, 3], [-1, 1], [0, 0]
+]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_detached_arcs(points: list[list[int]]) -> list[int]:
+    segments, pixel_points = create_track_segments(points, _GRID_POINT_DISTANCE, 0, 0)
+    detached_arcs = []
+
+    for index, (segment, point_start, point_end) in enumerate(zip(segments, pixel_points[:-1], pixel_points[1:])): # pylint: disable=line-too-long
+        if isinstance(segment, ArcSegment):
+            if (np.allclose(segment.get_position(0), point_start) is False) or \
+               (np.allclose(segment.get_position(1), point_end) is False):
+                detached_arcs.append(index)
+
+    return detached_arcs
+
+def _get_track_position(points: list[list[int]], position: float) -> np.ndarray:
+    segments, _ = create_track_segments(points, _POINT_DISTANCE, 0, 0)
+
+    for segment in segments:
+        length = segment.get_length()
+
+        if (position < length) or (math.isclose(position, length) is True):
+            break
+
+        position -= length
+
+    return np.asarray(segment.get_position(position / length)) # pylint: disable=undefined-loop-variable
+
+def _get_drawn_start_stop_line_positions(points: list[list[int]], start_stop_line_locations: list[bool]) -> list[np.ndarray]: # pylint: disable=line-too-long
+    pixel_per_m = _GRID_POINT_DISTANCE / _POINT_DISTANCE
+    drawing = create_track_drawing(points, _IMAGE_SIZE, _IMAGE_SIZE, 1, _GRID_POINT_DISTANCE, pixel_per_m, start_stop_line_locations, True) # pylint: disable=line-too-long
+    positions = []
+
+    # In debug mode the start-/stop-lines are the only orange lines. They are
+    # drawn in pairs, the middle between the pair is on the track.
+    lines = [primitive for primitive in drawing.get_primitives() if primitive[3] == "orange"]
+
+    for (_, x_low, y_low, *_), (_, x_high, y_high, *_) in zip(lines[0::2], lines[1::2]):
+        position = np.array([x_low[0] + x_high[0], y_low[0] + y_high[0]]) / 2
+        positions.append((position - _BORDER) / pixel_per_m)
+
+    return positions
+
+@pytest.mark.parametrize("points", [_CLOCKWISE_TRACK, _COUNTER_CLOCKWISE_TRACK])
+def test_arcs_of_all_turns_end_in_grid_points(points):
+    """Every quarter circle starts and ends in its grid points, for all turns
+        to the left and to the right.
+    """
+    assert len(_get_detached_arcs(points)) == 0
+
+@pytest.mark.parametrize("seed", range(10))
+def test_arcs_of_generated_tours_end_in_grid_points(seed):
+    """Every quarter circle of a generated tour starts and ends in its grid points.
+    """
+    points, _ = generate_tour(8, 8, None, 1, create_rng(seed))
+
+    assert len(_get_detached_arcs(points.tolist())) == 0
+
+@pytest.mark.parametrize("points", [_CLOCKWISE_TRACK, _COUNTER_CLOCKWISE_TRACK])
+def test_start_stop_lines_are_drawn_at_metrics_positions(points):
+    """The start-/stop-lines are drawn at the positions along the track,
+        which are reported by the metrics, on lines and on quarter circles.
+    """
+    start_stop_line_locations = [True] * len(points)
+    metrics = _get_track_metrics(points, _POINT_DISTANCE, start_stop_line_locations)
+    drawn_positions = _get_drawn_start_stop_line_positions(points, start_stop_line_locations)
+
+    assert len(drawn_positions) == len(points) - 1
+
+    for position, drawn_position in zip(metrics["startStopLinePositions"], drawn_positions):
+        assert np.allclose(_get_track_position(points, position), drawn_position)
@@ -0,0 +1,114 @@
+"""Test the batched generation of the control points of the simple and E track."""
+
+# MIT License
+#
+# Copyright (c) 2024 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import numpy as np
+import pytest
+from pyLineFollowerTrackGenerator.rng import create_rng
+from pyLineFollowerTrackGenerator.track_etrack import generate_tracks_along_e, _generate_points_along_e # pylint: disable=line-too-long
+from pyLineFollowerTrackGenerator.track_simple import generate_tracks_along_rectangle, _generate_points_along_rectangle # pylint: disable=line-too-long
+
+################################################################################
+# Variables
+################################################################################
+
+# Batched and single track generator of every track type.
+_GENERATORS = [
+    (generate_tracks_along_rectangle, _generate_points_along_rectangle),
+    (generate_tracks_along_e, _generate_points_along_e)
+]
+
+_NUM_TRACKS = 5
+_NUM_POINTS = 40
+_IMAGE_SIZE = 1024
+
+################################################################################
+# Classes
+################################################################################
+
+class _CountingRng(): # pylint: disable=too-few-public-methods
+    """Random number generator, which counts the calls of uniform().
+    """
+
+    def __init__(self, seed: int) -> None:
+        self._rng = create_rng(seed)
+        self.num_calls = 0
+
+    def uniform(self, *args, **kwargs) -> np.ndarray:
+        """Draw uniform random values and count the call.
+
+        Returns:
+            np.ndarray: Random values
+        """
+        self.num_calls += 1
+
+        return self._rng.uniform(*args, **kwargs)
+
+################################################################################
+# Functions
+################################################################################
+
+@pytest.mark.parametrize("generate_tracks, _", _GENERATORS)
+def test_batch_shape(generate_tracks, _):
+    """The batch contains the points of every track.
+    """
+    tracks = generate_tracks(_NUM_TRACKS, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(1))
+    single_track = generate_tracks(1, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(1))
+
+    assert tracks.ndim == 3
+    assert tracks.shape[0] == _NUM_TRACKS
+    assert tracks.shape[1:] == single_track.shape[1:]
+    assert tracks.shape[2] == 2
+
+@pytest.mark.parametrize("generate_tracks, _", _GENERATORS)
+def test_batch_is_reproducible(generate_tracks, _):
+    """The same seed generates the same batch, another seed another one.
+    """
+    tracks = generate_tracks(_NUM_TRACKS, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(1))
+    tracks_same_seed = generate_tracks(_NUM_TRACKS, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(1)) # pylint: disable=line-too-long
+    tracks_other_seed = generate_tracks(_NUM_TRACKS, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(2)) # pylint: disable=line-too-long
+
+    assert np.array_equal(tracks, tracks_same_seed)
+    assert np.array_equal(tracks, tracks_other_seed) is False
+
+@pytest.mark.parametrize("generate_tracks, generate_points", _GENERATORS)
+def test_first_track_of_batch_is_single_track(generate_tracks, generate_points):
+    """The first track of a batch is the track of a single track call with the same seed.
+    """
+    tracks = generate_tracks(_NUM_TRACKS, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(3))
+    points = generate_points(_NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, create_rng(3))
+
+    assert np.array_equal(tracks[0], points)
+
+@pytest.mark.parametrize("generate_tracks, _", _GENERATORS)
+def test_batch_draws_once(generate_tracks, _):
+    """All random coordinates of a batch are drawn with a single call.
+    """
+    rng = _CountingRng(4)
+
+    generate_tracks(_NUM_TRACKS, _NUM_POINTS, _IMAGE_SIZE, _IMAGE_SIZE, rng)
+
+    assert rng.num_calls == 1